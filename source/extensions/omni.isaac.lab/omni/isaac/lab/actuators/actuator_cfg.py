@@ -155,6 +155,21 @@ class ActuatorNetMLPCfg(DCMotorCfg):
     time-step in the past. The allocated history length is `max(input_idx) + 1`.
     """
 
+    half_precision: bool = False
+    """Whether to run the network inference in half precision (float16). Defaults to False.
+
+    The network inputs are converted to half precision before the inference and the outputs are converted back
+    to single precision. This is mainly beneficial on CUDA devices.
+    """
+
+    optimize_network: bool = False
+    """Whether to freeze and optimize the TorchScript network for inference. Defaults to False.
+
+    If True, the network is frozen using :func:`torch.jit.freeze` and optimized using
+    :func:`torch.jit.optimize_for_inference`. This folds the parameters into the graph and fuses
+    the operations where possible.
+    """
+
 
 @configclass
 class DelayedPDActuatorCfg(IdealPDActuatorCfg):
@@ -125,16 +125,49 @@ class ActuatorNetMLP(DCMotor):
     def __init__(self, cfg: ActuatorNetMLPCfg, *args, **kwargs):
         super().__init__(cfg, *args, **kwargs)
 
+        # check the input order
+        if self.cfg.input_order not in ("pos_vel", "vel_pos"):
+            raise ValueError(
+                f"Invalid input order for MLP actuator net: {self.cfg.input_order}. Must be 'pos_vel' or 'vel_pos'."
+            )
+
         # load the model from JIT file
         file_bytes = read_file(self.cfg.network_file)
-        self.network = torch.jit.load(file_bytes, map_location=self._device)
-
-        # create buffers for MLP history
-        history_length = max(self.cfg.input_idx) + 1
-        self._joint_pos_error_history = torch.zeros(
-            self._num_envs, history_length, self.num_joints, device=self._device
+        self.network = torch.jit.load(file_bytes, map_location=self._device).eval()
+        # prepare the model for inference
+        # note: the precision is set first since freezing folds the parameters into constants
+        if self.cfg.half_precision:
+            self.network = self.network.half()
+        if self.cfg.optimize_network:
+            self.network = torch.jit.optimize_for_inference(torch.jit.freeze(self.network))
+
+        # create ring buffer for MLP history
+        # note: the last dimension interleaves the joint position errors and velocities of each history slot.
+        #   Shape is (num_envs, num_joints, 2 * history_length).
+        input_idx = list(self.cfg.input_idx)
+        self._history_length = max(input_idx) + 1
+        self._history = torch.zeros(self._num_envs, self.num_joints, 2 * self._history_length, device=self._device)
+        # views of the position error and velocity histories. Shape is (num_envs, num_joints, history_length).
+        self._joint_pos_error_history = self._history[..., 0::2]
+        self._joint_vel_history = self._history[..., 1::2]
+        # the slot of the current time-step in the ring buffer
+        self._history_pointer = -1
+
+        # precompute the indices of the network inputs in the history for each position of the pointer
+        # note: index *n* of the input indices is read from the slot *n* time-steps before the current one
+        channels = (0, 1) if self.cfg.input_order == "pos_vel" else (1, 0)
+        input_index = [
+            [2 * ((pointer - n) % self._history_length) + channel for channel in channels for n in input_idx]
+            for pointer in range(self._history_length)
+        ]
+        self._input_index = torch.tensor(input_index, dtype=torch.long, device=self._device)
+        # scaling of the network inputs
+        scales = {0: self.cfg.pos_scale, 1: self.cfg.vel_scale}
+        self._input_scale = torch.tensor(
+            [scales[channel] for channel in channels for _ in input_idx], device=self._device
         )
-        self._joint_vel_history = torch.zeros(self._num_envs, history_length, self.num_joints, device=self._device)
+        # buffer for the network inputs. Shape is (num_envs, num_joints, 2 * len(input_idx)).
+        self._network_input = torch.zeros(self._num_envs, self.num_joints, 2 * len(input_idx), device=self._device)
 
     """
     Operations.
@@ -142,41 +175,34 @@ class ActuatorNetMLP(DCMotor):
 
     def reset(self, env_ids: Sequence[int]):
         # reset the history for the specified environments
-        self._joint_pos_error_history[env_ids] = 0.0
-        self._joint_vel_history[env_ids] = 0.0
+        self._history[env_ids] = 0.0
 
     def compute(
         self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
     ) -> ArticulationActions:
-        # move history queue by 1 and update top of history
+        # move the head of the history by 1 and update it
+        self._history_pointer = (self._history_pointer + 1) % self._history_length
         # -- positions
-        self._joint_pos_error_history = self._joint_pos_error_history.roll(1, 1)
-        self._joint_pos_error_history[:, 0] = control_action.joint_positions - joint_pos
+        torch.sub(
+            control_action.joint_positions, joint_pos, out=self._joint_pos_error_history[..., self._history_pointer]
+        )
         # -- velocity
-        self._joint_vel_history = self._joint_vel_history.roll(1, 1)
-        self._joint_vel_history[:, 0] = joint_vel
+        self._joint_vel_history[..., self._history_pointer] = joint_vel
         # save current joint vel for dc-motor clipping
         self._joint_vel[:] = joint_vel
 
         # compute network inputs
-        # -- positions
-        pos_input = torch.cat([self._joint_pos_error_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
-        pos_input = pos_input.view(self._num_envs * self.num_joints, -1)
-        # -- velocity
-        vel_input = torch.cat([self._joint_vel_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
-        vel_input = vel_input.view(self._num_envs * self.num_joints, -1)
-        # -- scale and concatenate inputs
-        if self.cfg.input_order == "pos_vel":
-            network_input = torch.cat([pos_input * self.cfg.pos_scale, vel_input * self.cfg.vel_scale], dim=1)
-        elif self.cfg.input_order == "vel_pos":
-            network_input = torch.cat([vel_input * self.cfg.vel_scale, pos_input * self.cfg.pos_scale], dim=1)
-        else:
-            raise ValueError(
-                f"Invalid input order for MLP actuator net: {self.cfg.input_order}. Must be 'pos_vel' or 'vel_pos'."
-            )
+        # note: the inputs are gathered from the history in the order expected by the network
+        torch.index_select(self._history, 2, self._input_index[self._history_pointer], out=self._network_input)
+        self._network_input.mul_(self._input_scale)
+        network_input = self._network_input.view(self._num_envs * self.num_joints, -1)
 
         # run network inference
-        torques = self.network(network_input).view(self._num_envs, self.num_joints)
+        with torch.inference_mode():
+            if self.cfg.half_precision:
+                torques = self.network(network_input.half()).float()
+            else:
+                torques = self.network(network_input)
         self.computed_effort = torques.view(self._num_envs, self.num_joints) * self.cfg.torque_scale
 
         # clip the computed effort based on the motor limits
@@ -230,6 +230,9 @@ class DelayedPDActuator(IdealPDActuator):
     The amount of time lag is configurable and can be set to a random value between the minimum and maximum time
     lag bounds at every reset. The minimum and maximum time lag values are set in the configuration instance passed
     to the class.
+
+    Since the joint position, velocity and effort commands share the same time lag, they are stacked and stored
+    in a single delay buffer. This way, all the commands are delayed with a single read of the buffer.
     """
 
     cfg: DelayedPDActuatorCfg
@@ -237,10 +240,11 @@ class DelayedPDActuator(IdealPDActuator):
 
     def __init__(self, cfg: DelayedPDActuatorCfg, *args, **kwargs):
         super().__init__(cfg, *args, **kwargs)
-        # instantiate the delay buffers
-        self.positions_delay_buffer = DelayBuffer(cfg.max_delay, self._num_envs, device=self._device)
-        self.velocities_delay_buffer = DelayBuffer(cfg.max_delay, self._num_envs, device=self._device)
-        self.efforts_delay_buffer = DelayBuffer(cfg.max_delay, self._num_envs, device=self._device)
+        # instantiate the delay buffer for the stacked joint position, velocity and effort commands
+        self.delay_buffer = DelayBuffer(cfg.max_delay, self._num_envs, device=self._device)
+        # buffers for the stacked commands before and after the delay. Shape is (num_envs, 3, num_joints).
+        self._commands = torch.zeros(self._num_envs, 3, self.num_joints, device=self._device)
+        self._delayed_commands = torch.zeros_like(self._commands)
         # all of the envs
         self._ALL_INDICES = torch.arange(self._num_envs, dtype=torch.long, device=self._device)
 
@@ -260,21 +264,22 @@ class DelayedPDActuator(IdealPDActuator):
             device=self._device,
         )
         # set delays
-        self.positions_delay_buffer.set_time_lag(time_lags, env_ids)
-        self.velocities_delay_buffer.set_time_lag(time_lags, env_ids)
-        self.efforts_delay_buffer.set_time_lag(time_lags, env_ids)
+        self.delay_buffer.set_time_lag(time_lags, env_ids)
         # reset buffers
-        self.positions_delay_buffer.reset(env_ids)
-        self.velocities_delay_buffer.reset(env_ids)
-        self.efforts_delay_buffer.reset(env_ids)
+        self.delay_buffer.reset(env_ids)
 
     def compute(
         self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
     ) -> ArticulationActions:
+        # stack the setpoints
+        self._commands[:, 0] = control_action.joint_positions
+        self._commands[:, 1] = control_action.joint_velocities
+        self._commands[:, 2] = control_action.joint_efforts
         # apply delay based on the delay the model for all the setpoints
-        control_action.joint_positions = self.positions_delay_buffer.compute(control_action.joint_positions)
-        control_action.joint_velocities = self.velocities_delay_buffer.compute(control_action.joint_velocities)
-        control_action.joint_efforts = self.efforts_delay_buffer.compute(control_action.joint_efforts)
+        self.delay_buffer.compute(self._commands, out=self._delayed_commands)
+        control_action.joint_positions = self._delayed_commands[:, 0]
+        control_action.joint_velocities = self._delayed_commands[:, 1]
+        control_action.joint_efforts = self._delayed_commands[:, 2]
         # compte actuator model
         return super().compute(control_action, joint_pos, joint_vel)
 
@@ -1169,6 +1169,70 @@ class Articulation(AssetBase):
                 f" joints available: {total_act_joints} != {self.num_joints - self.num_fixed_tendons}."
             )
 
+        # prepare the joint layout used to dispatch the joint commands to the actuators
+        self._process_actuator_joint_layout()
+
+    def _process_actuator_joint_layout(self):
+        """Prepare the joint layout used to dispatch the joint commands to the actuators.
+
+        If the joints of each actuator group form a contiguous range, the actuators operate on slices
+        of the joint buffers, which are views and need no copies. Otherwise, the joints are permuted such that
+        the joints of each actuator group are contiguous. The joint buffers are then gathered into and
+        scattered from persistent buffers in this layout once for all the actuator groups.
+        """
+        # resolve the joint indices of the actuator groups
+        actuator_joint_ids = []
+        for actuator in self.actuators.values():
+            if isinstance(actuator.joint_indices, slice):
+                actuator_joint_ids.append(list(range(self.num_joints))[actuator.joint_indices])
+            else:
+                actuator_joint_ids.append(list(actuator.joint_indices))
+        # check if the joints of each actuator group are already contiguous
+        is_contiguous = all(
+            joint_ids == list(range(joint_ids[0], joint_ids[0] + len(joint_ids))) for joint_ids in actuator_joint_ids
+        )
+        if is_contiguous:
+            # the actuator groups operate directly on slices of the joint buffers
+            self._actuator_joint_perm = None
+            self._actuator_joint_slices = [
+                slice(joint_ids[0], joint_ids[0] + len(joint_ids)) for joint_ids in actuator_joint_ids
+            ]
+        else:
+            # the actuator groups operate on slices of the permuted joint buffers
+            self._actuator_joint_perm = torch.tensor(sum(actuator_joint_ids, []), dtype=torch.long, device=self.device)
+            self._actuator_joint_slices = []
+            start = 0
+            for joint_ids in actuator_joint_ids:
+                self._actuator_joint_slices.append(slice(start, start + len(joint_ids)))
+                start += len(joint_ids)
+            # buffers for the inputs of the actuators in the permuted layout
+            # -- joint position, velocity and effort targets, joint positions and joint velocities
+            self._actuator_inputs = torch.zeros(
+                5, self.num_instances, len(self._actuator_joint_perm), device=self.device
+            )
+            # buffers for the outputs of the actuators in the permuted layout
+            # note: these are initialized from the current values since not all actuators set all the outputs
+            self._actuator_outputs = torch.stack(
+                [output[:, self._actuator_joint_perm] for output in self._actuator_output_targets()]
+            )
+
+    def _actuator_output_targets(self) -> tuple[torch.Tensor, ...]:
+        """The buffers into which the outputs of the actuators are written.
+
+        Returns:
+            The simulation joint position, velocity and effort targets, the computed and applied torques,
+            the soft joint velocity limits and the gear ratios.
+        """
+        return (
+            self._joint_pos_target_sim,
+            self._joint_vel_target_sim,
+            self._joint_effort_target_sim,
+            self._data.computed_torque,
+            self._data.applied_torque,
+            self._data.soft_joint_vel_limits,
+            self._data.gear_ratio,
+        )
+
     def _process_fixed_tendons(self):
         """Process fixed tendons."""
         # create a list to store the fixed tendon names
@@ -1203,38 +1267,68 @@ class Articulation(AssetBase):
         The actions are first processed using actuator models. Depending on the robot configuration,
         the actuator models compute the joint level simulation commands and sets them into the PhysX buffers.
         """
+        # resolve the inputs of the actuators
+        if self._actuator_joint_perm is None:
+            # note: slicing the joint buffers returns views, so no copies are made
+            joint_pos_target = self._data.joint_pos_target
+            joint_vel_target = self._data.joint_vel_target
+            joint_effort_target = self._data.joint_effort_target
+            joint_pos = self._data.joint_pos
+            joint_vel = self._data.joint_vel
+            outputs = self._actuator_output_targets()
+        else:
+            # gather the inputs of all the actuators into the permuted layout at once
+            inputs = (
+                self._data.joint_pos_target,
+                self._data.joint_vel_target,
+                self._data.joint_effort_target,
+                self._data.joint_pos,
+                self._data.joint_vel,
+            )
+            for index, joint_data in enumerate(inputs):
+                torch.index_select(joint_data, 1, self._actuator_joint_perm, out=self._actuator_inputs[index])
+            joint_pos_target, joint_vel_target, joint_effort_target, joint_pos, joint_vel = self._actuator_inputs
+            outputs = self._actuator_outputs
+        pos_target_sim, vel_target_sim, effort_target_sim, computed_torque, applied_torque, vel_limits, gear_ratio = (
+            outputs
+        )
+
         # process actions per group
-        for actuator in self.actuators.values():
+        for actuator, joints in zip(self.actuators.values(), self._actuator_joint_slices):
             # prepare input for actuator model based on cached data
-            # TODO : A tensor dict would be nice to do the indexing of all tensors together
             control_action = ArticulationActions(
-                joint_positions=self._data.joint_pos_target[:, actuator.joint_indices],
-                joint_velocities=self._data.joint_vel_target[:, actuator.joint_indices],
-                joint_efforts=self._data.joint_effort_target[:, actuator.joint_indices],
+                joint_positions=joint_pos_target[:, joints],
+                joint_velocities=joint_vel_target[:, joints],
+                joint_efforts=joint_effort_target[:, joints],
                 joint_indices=actuator.joint_indices,
             )
             # compute joint command from the actuator model
             control_action = actuator.compute(
                 control_action,
-                joint_pos=self._data.joint_pos[:, actuator.joint_indices],
-                joint_vel=self._data.joint_vel[:, actuator.joint_indices],
+                joint_pos=joint_pos[:, joints],
+                joint_vel=joint_vel[:, joints],
             )
             # update targets (these are set into the simulation)
             if control_action.joint_positions is not None:
-                self._joint_pos_target_sim[:, actuator.joint_indices] = control_action.joint_positions
+                pos_target_sim[:, joints] = control_action.joint_positions
             if control_action.joint_velocities is not None:
-                self._joint_vel_target_sim[:, actuator.joint_indices] = control_action.joint_velocities
+                vel_target_sim[:, joints] = control_action.joint_velocities
             if control_action.joint_efforts is not None:
-                self._joint_effort_target_sim[:, actuator.joint_indices] = control_action.joint_efforts
+                effort_target_sim[:, joints] = control_action.joint_efforts
             # update state of the actuator model
             # -- torques
-            self._data.computed_torque[:, actuator.joint_indices] = actuator.computed_effort
-            self._data.applied_torque[:, actuator.joint_indices] = actuator.applied_effort
+            computed_torque[:, joints] = actuator.computed_effort
+            applied_torque[:, joints] = actuator.applied_effort
             # -- actuator data
-            self._data.soft_joint_vel_limits[:, actuator.joint_indices] = actuator.velocity_limit
+            vel_limits[:, joints] = actuator.velocity_limit
             # TODO: find a cleaner way to handle gear ratio. Only needed for variable gear ratio actuators.
             if hasattr(actuator, "gear_ratio"):
-                self._data.gear_ratio[:, actuator.joint_indices] = actuator.gear_ratio
+                gear_ratio[:, joints] = actuator.gear_ratio
+
+        # scatter the outputs of all the actuators back from the permuted layout at once
+        if self._actuator_joint_perm is not None:
+            for joint_data, output in zip(self._actuator_output_targets(), self._actuator_outputs):
+                joint_data.index_copy_(1, self._actuator_joint_perm, output)
 
     """
     Internal helpers -- Debugging.
@@ -11,9 +11,10 @@ from typing import Any
 import carb
 import omni.isaac.core.utils.torch as torch_utils
 
-from omni.isaac.lab.managers import ActionManager, EventManager, ObservationManager
+from omni.isaac.lab.managers import ActionManager, EventManager, ManagerBase, ManagerProfiler, ObservationManager
 from omni.isaac.lab.scene import InteractiveScene
 from omni.isaac.lab.sim import SimulationContext
+from omni.isaac.lab.utils.cuda_graph import CudaGraphFunction
 from omni.isaac.lab.utils.timer import Timer
 
 from .common import VecEnvObs
@@ -110,6 +111,8 @@ class ManagerBasedEnv:
 
         # counter for simulation steps
         self._sim_step_counter = 0
+        # profiler for the managers (created when the managers are loaded)
+        self.profiler: ManagerProfiler | None = None
 
         # generate scene
         with Timer("[INFO]: Time taken for scene creation", "scene_creation"):
@@ -209,6 +212,10 @@ class ManagerBasedEnv:
         # -- action manager
         self.action_manager = ActionManager(self.cfg.actions, self)
         print("[INFO] Action Manager: ", self.action_manager)
+        # wrap the application of actions for replaying it as a CUDA graph (if enabled)
+        self._apply_action_graph = CudaGraphFunction(
+            self.action_manager.apply_action, device=self.device, enabled=self.cfg.use_action_cuda_graph
+        )
         # -- observation manager
         self.observation_manager = ObservationManager(self.cfg.observations, self)
         print("[INFO] Observation Manager:", self.observation_manager)
@@ -219,8 +226,11 @@ class ManagerBasedEnv:
         # perform events at the start of the simulation
         # in-case a child implementation creates other managers, the randomization should happen
         # when all the other managers are created
-        if self.__class__ == ManagerBasedEnv and "startup" in self.event_manager.available_modes:
-            self.event_manager.apply(mode="startup")
+        if self.__class__ == ManagerBasedEnv:
+            # attach the profiler to the managers
+            self._setup_profiler()
+            if "startup" in self.event_manager.available_modes:
+                self.event_manager.apply(mode="startup")
 
     """
     Operations - MDP.
@@ -280,7 +290,7 @@ class ManagerBasedEnv:
         for _ in range(self.cfg.decimation):
             self._sim_step_counter += 1
             # set actions into buffers
-            self.action_manager.apply_action()
+            self._apply_action_graph()
             # set actions into simulator
             self.scene.write_data_to_sim()
             # simulate
@@ -296,9 +306,14 @@ class ManagerBasedEnv:
         # post-step: step interval event
         if "interval" in self.event_manager.available_modes:
             self.event_manager.apply(mode="interval", dt=self.step_dt)
+        # -- compute observations
+        obs = self.observation_manager.compute()
+        # -- update the profiler statistics
+        if self.profiler is not None:
+            self.profiler.step()
 
         # return observations and extras
-        return self.observation_manager.compute(), self.extras
+        return obs, self.extras
 
     @staticmethod
     def seed(seed: int = -1) -> int:
@@ -325,6 +340,7 @@ class ManagerBasedEnv:
         if not self._is_closed:
             # destructor is order-sensitive
             del self.viewport_camera_controller
+            del self._apply_action_graph
             del self.action_manager
             del self.observation_manager
             del self.event_manager
@@ -342,6 +358,18 @@ class ManagerBasedEnv:
     Helper functions.
     """
 
+    def _setup_profiler(self):
+        """Creates the profiler for the managers if enabled and attaches it to all the managers."""
+        # check if profiling is enabled
+        if self.cfg.profiler is None:
+            return
+        # create the profiler
+        self.profiler = ManagerProfiler(self.cfg.profiler, device=self.device)
+        # attach it to all the managers of the environment
+        for value in self.__dict__.values():
+            if isinstance(value, ManagerBase):
+                value.set_profiler(self.profiler)
+
     def _reset_idx(self, env_ids: Sequence[int]):
         """Reset environments based on specified indices.
 
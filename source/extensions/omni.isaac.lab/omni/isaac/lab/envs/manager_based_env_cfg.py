@@ -13,6 +13,7 @@ from dataclasses import MISSING
 
 import omni.isaac.lab.envs.mdp as mdp
 from omni.isaac.lab.managers import EventTermCfg as EventTerm
+from omni.isaac.lab.managers import ManagerProfilerCfg
 from omni.isaac.lab.scene import InteractiveSceneCfg
 from omni.isaac.lab.sim import SimulationCfg
 from omni.isaac.lab.utils import configclass
@@ -71,6 +72,27 @@ class ManagerBasedEnvCfg:
     This means that the control action is updated every 10 simulation steps.
     """
 
+    use_action_cuda_graph: bool = False
+    """Whether to replay the application of the actions inside the decimation loop as a CUDA graph.
+    Defaults to False.
+
+    If True, the call to :meth:`omni.isaac.lab.managers.ActionManager.apply_action` at every simulation step is
+    captured into a CUDA graph after a few warm-up steps and replayed afterwards. This removes the kernel launch
+    overhead of the action terms, which dominates for small robots at large numbers of environments. On non-CUDA
+    devices, or if the capture fails, the actions are applied eagerly.
+
+    .. attention::
+        Only the recorded kernels are replayed. The action terms must therefore only perform tensor operations
+        on persistent buffers in :meth:`~omni.isaac.lab.managers.ActionTerm.apply_actions` (for instance, writing
+        the processed actions into the joint targets of an articulation). In particular,
+        :meth:`~omni.isaac.lab.managers.ActionTerm.process_actions` must write the processed actions into their
+        pre-allocated buffer in place instead of re-assigning it, since the graph reads the buffer captured at the
+        time of capture. Terms that read lazily updated simulation data (such as
+        :class:`~omni.isaac.lab.envs.mdp.actions.RelativeJointPositionAction`) are not supported.
+
+    Please refer to the :class:`omni.isaac.lab.utils.cuda_graph.CudaGraphFunction` class for more details.
+    """
+
     # environment settings
     scene: InteractiveSceneCfg = MISSING
     """Scene settings.
@@ -95,3 +117,10 @@ class ManagerBasedEnvCfg:
 
     Please refer to the :class:`omni.isaac.lab.managers.EventManager` class for more details.
     """
+
+    profiler: ManagerProfilerCfg | None = None
+    """Profiler settings for timing the term calls of the managers. Defaults to None, in which case
+    profiling is disabled.
+
+    Please refer to the :class:`omni.isaac.lab.managers.ManagerProfiler` class for more details.
+    """
@@ -127,6 +127,8 @@ class ManagerBasedRLEnv(ManagerBasedEnv, gym.Env):
 
         # setup the action and observation spaces for Gym
         self._configure_gym_env_spaces()
+        # attach the profiler to the managers
+        self._setup_profiler()
 
         # perform events at the start of the simulation
         if "startup" in self.event_manager.available_modes:
@@ -166,7 +168,7 @@ class ManagerBasedRLEnv(ManagerBasedEnv, gym.Env):
         for _ in range(self.cfg.decimation):
             self._sim_step_counter += 1
             # set actions into buffers
-            self.action_manager.apply_action()
+            self._apply_action_graph()
             # set actions into simulator
             self.scene.write_data_to_sim()
             # simulate
@@ -202,6 +204,9 @@ class ManagerBasedRLEnv(ManagerBasedEnv, gym.Env):
         # -- compute observations
         # note: done after reset to get the correct observations for reset envs
         self.obs_buf = self.observation_manager.compute()
+        # -- update the profiler statistics
+        if self.profiler is not None:
+            self.profiler.step()
 
         # return observations, rewards, resets and extras
         return self.obs_buf, self.reward_buf, self.reset_terminated, self.reset_time_outs, self.extras
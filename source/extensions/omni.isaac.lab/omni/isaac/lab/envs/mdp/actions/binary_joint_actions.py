@@ -114,7 +114,8 @@ class BinaryJointAction(ActionTerm):
             # true: close, false: open
             binary_mask = actions < 0
         # compute the command
-        self._processed_actions = torch.where(binary_mask, self._close_command, self._open_command)
+        # note: the processed actions are written in place so that their memory stays fixed
+        torch.where(binary_mask, self._close_command, self._open_command, out=self._processed_actions)
 
     def reset(self, env_ids: Sequence[int] | None = None) -> None:
         self._raw_actions[env_ids] = 0.0
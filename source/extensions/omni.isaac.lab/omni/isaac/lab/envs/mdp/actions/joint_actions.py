@@ -119,7 +119,8 @@ class JointAction(ActionTerm):
         # store the raw actions
         self._raw_actions[:] = actions
         # apply the affine transformations
-        self._processed_actions = self._raw_actions * self._scale + self._offset
+        # note: the processed actions are written in place so that their memory stays fixed
+        self._processed_actions[:] = self._raw_actions * self._scale + self._offset
 
     def reset(self, env_ids: Sequence[int] | None = None) -> None:
         self._raw_actions[env_ids] = 0.0
@@ -101,7 +101,8 @@ class JointPositionToLimitsAction(ActionTerm):
         # store the raw actions
         self._raw_actions[:] = actions
         # apply affine transformations
-        self._processed_actions = self._raw_actions * self._scale
+        # note: the processed actions are written in place so that their memory stays fixed
+        self._processed_actions[:] = self._raw_actions * self._scale
         # rescale the position targets if configured
         # this is useful when the input actions are in the range [-1, 1]
         if self.cfg.rescale_to_limits:
@@ -128,7 +128,8 @@ class NonHolonomicAction(ActionTerm):
     def process_actions(self, actions):
         # store the raw actions
         self._raw_actions[:] = actions
-        self._processed_actions = self.raw_actions * self._scale + self._offset
+        # note: the processed actions are written in place so that their memory stays fixed
+        self._processed_actions[:] = self.raw_actions * self._scale + self._offset
 
     def apply_actions(self):
         # obtain current heading
@@ -15,6 +15,7 @@ from .command_manager import CommandManager, CommandTerm
 from .curriculum_manager import CurriculumManager
 from .event_manager import EventManager
 from .manager_base import ManagerBase, ManagerTermBase
+from .manager_profiler import ManagerProfiler, ManagerProfilerCfg
 from .manager_term_cfg import (
     ActionTermCfg,
     CommandTermCfg,
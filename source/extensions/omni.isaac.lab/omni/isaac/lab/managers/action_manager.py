@@ -315,8 +315,9 @@ class ActionManager(ManagerBase):
         Note:
             This should be called at every simulation step.
         """
-        for term in self._terms.values():
-            term.apply_actions()
+        for name, term in self._terms.items():
+            with self._profile(name):
+                term.apply_actions()
 
     def get_term(self, name: str) -> ActionTerm:
         """Returns the action term with the specified name.
@@ -340,9 +340,10 @@ class CommandManager(ManagerBase):
 
         """
         # iterate over all the command terms
-        for term in self._terms.values():
+        for name, term in self._terms.items():
             # compute term's value
-            term.compute(dt)
+            with self._profile(name):
+                term.compute(dt)
 
     def get_command(self, name: str) -> torch.Tensor:
         """Returns the command for the specified command term.
@@ -128,7 +128,8 @@ class CurriculumManager(ManagerBase):
             env_ids = slice(None)
         # iterate over all the curriculum terms
         for name, term_cfg in zip(self._term_names, self._term_cfgs):
-            state = term_cfg.func(self._env, env_ids, **term_cfg.params)
+            with self._profile(name):
+                state = term_cfg.func(self._env, env_ids, **term_cfg.params)
             self._curriculum_state[name] = state
 
     """
@@ -188,7 +188,8 @@ class EventManager(ManagerBase):
                         self._interval_term_time_left[index][:] = sampled_interval
 
                         # call the event term (with None for env_ids)
-                        term_cfg.func(self._env, None, **term_cfg.params)
+                        with self._profile(mode, self._mode_term_names[mode][index]):
+                            term_cfg.func(self._env, None, **term_cfg.params)
                 else:
                     valid_env_ids = (time_left < 1e-6).nonzero().flatten()
                     if len(valid_env_ids) > 0:
@@ -197,7 +198,8 @@ class EventManager(ManagerBase):
                         self._interval_term_time_left[index][valid_env_ids] = sampled_time
 
                         # call the event term
-                        term_cfg.func(self._env, valid_env_ids, **term_cfg.params)
+                        with self._profile(mode, self._mode_term_names[mode][index]):
+                            term_cfg.func(self._env, valid_env_ids, **term_cfg.params)
             elif mode == "reset":
                 # obtain the minimum step count between resets
                 min_step_count = term_cfg.min_step_count_between_reset
@@ -212,7 +214,8 @@ class EventManager(ManagerBase):
                     self._reset_term_last_triggered_once[index][env_ids] = True
 
                     # call the event term with the environment indices
-                    term_cfg.func(self._env, env_ids, **term_cfg.params)
+                    with self._profile(mode, self._mode_term_names[mode][index]):
+                        term_cfg.func(self._env, env_ids, **term_cfg.params)
                 else:
                     # extract last reset step for this term
                     last_triggered_step = self._reset_term_last_triggered_step_id[index][env_ids]
@@ -238,10 +241,12 @@ class EventManager(ManagerBase):
                         self._reset_term_last_triggered_step_id[index][valid_env_ids] = global_env_step_count
 
                         # call the event term
-                        term_cfg.func(self._env, valid_env_ids, **term_cfg.params)
+                        with self._profile(mode, self._mode_term_names[mode][index]):
+                            term_cfg.func(self._env, valid_env_ids, **term_cfg.params)
             else:
                 # call the event term
-                term_cfg.func(self._env, env_ids, **term_cfg.params)
+                with self._profile(mode, self._mode_term_names[mode][index]):
+                    term_cfg.func(self._env, env_ids, **term_cfg.params)
 
     """
     Operations - Term settings.
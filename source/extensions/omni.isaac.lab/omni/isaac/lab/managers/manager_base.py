@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import copy
 import inspect
 from abc import ABC, abstractmethod
@@ -22,6 +23,12 @@ from .scene_entity_cfg import SceneEntityCfg
 if TYPE_CHECKING:
     from omni.isaac.lab.envs import ManagerBasedEnv
 
+    from .manager_profiler import ManagerProfiler
+
+
+_NULL_CONTEXT = contextlib.nullcontext()
+"""Empty context used for the term calls when profiling is disabled."""
+
 
 class ManagerTermBase(ABC):
     """Base class for manager terms.
@@ -126,6 +133,8 @@ class ManagerBase(ABC):
         # store the inputs
         self.cfg = copy.deepcopy(cfg)
         self._env = env
+        # profiler for timing the term calls (None means profiling is disabled)
+        self._profiler: ManagerProfiler | None = None
         # parse config to create terms information
         self._prepare_terms()
 
@@ -149,6 +158,11 @@ class ManagerBase(ABC):
         """Name of active terms."""
         raise NotImplementedError
 
+    @property
+    def profiler(self) -> ManagerProfiler | None:
+        """The profiler used for timing the term calls. None if profiling is disabled."""
+        return self._profiler
+
     """
     Operations.
     """
@@ -192,6 +206,17 @@ class ManagerBase(ABC):
         # return the matching names
         return string_utils.resolve_matching_names(name_keys, list_of_strings)[1]
 
+    def set_profiler(self, profiler: ManagerProfiler | None):
+        """Sets the profiler used for timing the term calls of the manager.
+
+        The calls are recorded in the profiler with names of the form ``"<ManagerClass>/<term>"``. For managers
+        that organize terms into groups or modes, the group or mode name is added before the term's name.
+
+        Args:
+            profiler: The profiler instance. If None, profiling is disabled for the manager.
+        """
+        self._profiler = profiler
+
     """
     Implementation specific.
     """
@@ -205,6 +230,19 @@ class ManagerBase(ABC):
     Helper functions.
     """
 
+    def _profile(self, *names: str) -> contextlib.AbstractContextManager:
+        """Returns a context manager that times the wrapped term call if profiling is enabled.
+
+        Args:
+            *names: The names identifying the term call. These are joined with the manager's class name.
+
+        Returns:
+            The timing context of the profiler if profiling is enabled. Otherwise, an empty context.
+        """
+        if self._profiler is None:
+            return _NULL_CONTEXT
+        return self._profiler.time("/".join((self.__class__.__name__, *names)))
+
     def _resolve_common_term_cfg(self, term_name: str, term_cfg: ManagerTermBaseCfg, min_argc: int = 1):
         """Resolve common term configuration.
 
@@ -0,0 +1,274 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Profiler for timing the term calls of the managers."""
+
+from __future__ import annotations
+
+import json
+import os
+import torch
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from prettytable import PrettyTable
+
+from omni.isaac.lab.utils import configclass
+from omni.isaac.lab.utils.timer import Timer
+
+
+@configclass
+class ManagerProfilerCfg:
+    """Configuration for the manager profiler."""
+
+    use_cuda_events: bool = True
+    """Whether to time the term calls using CUDA events. Defaults to True.
+
+    If True and the device is a CUDA device, the term calls are timed using CUDA events. These measure the
+    time taken by the kernels launched by the term on the device without synchronizing the host after every
+    call. The events are only resolved when the statistics are updated in :meth:`ManagerProfiler.step`.
+
+    Otherwise, the term calls are timed on the host using :class:`~omni.isaac.lab.utils.timer.Timer`. On CUDA
+    devices, the device is synchronized before and after every call so that the measured time includes the
+    execution of the launched kernels.
+    """
+
+    window_size: int = 100
+    """Number of most recent calls used for computing the rolling statistics. Defaults to 100."""
+
+    dump_interval: int = 0
+    """Number of profiler steps between two reports of the statistics. Defaults to 0.
+
+    If zero, no report is generated automatically. Otherwise, the statistics table is printed
+    every :attr:`dump_interval` calls to :meth:`ManagerProfiler.step`. If :attr:`log_dir` is set,
+    the statistics are also saved as a JSON file.
+    """
+
+    log_dir: str | None = None
+    """Directory to save the JSON reports into. Defaults to None, in which case no file is written."""
+
+
+class ManagerProfiler:
+    """Profiler for timing the term calls of the managers.
+
+    The profiler records the time taken by every call that is wrapped by the :meth:`time` context manager.
+    The calls are identified by a name, which for the managers is of the form ``"<Manager>/<term>"``
+    (for instance, ``"RewardManager/track_lin_vel_xy_exp"``). For each name, it keeps track of the number
+    of calls, the total time, the minimum and maximum time, and the mean time over a rolling window.
+
+    The profiler is attached to a manager using the :meth:`ManagerBase.set_profiler` method. When no profiler
+    is attached, the managers call the terms directly and no timing overhead is added.
+
+    Example usage:
+
+    .. code-block:: python
+
+        profiler = ManagerProfiler(ManagerProfilerCfg(dump_interval=100), device=env.device)
+        env.reward_manager.set_profiler(profiler)
+
+        for _ in range(1000):
+            env.step(actions)
+            # resolve timings and print the report every 100 steps
+            profiler.step()
+
+    """
+
+    def __init__(self, cfg: ManagerProfilerCfg, device: str):
+        """Initialize the profiler.
+
+        Args:
+            cfg: The configuration object.
+            device: The device on which the profiled terms are computed.
+        """
+        # store inputs
+        self.cfg = cfg
+        self._device = device
+        # resolve the timing method
+        self._use_cuda_events = self.cfg.use_cuda_events and "cuda" in device
+        self._synchronize = not self._use_cuda_events and "cuda" in device
+        # timers for host timing
+        self._timers: dict[str, Timer] = dict()
+        # recorded events which are not yet resolved: (name, start event, end event)
+        self._pending_events: list[tuple[str, torch.cuda.Event, torch.cuda.Event]] = list()
+        # statistics per name (in seconds)
+        self._num_calls: dict[str, int] = dict()
+        self._total_time: dict[str, float] = dict()
+        self._min_time: dict[str, float] = dict()
+        self._max_time: dict[str, float] = dict()
+        self._recent_times: dict[str, deque[float]] = dict()
+        # number of calls to :meth:`step`
+        self._step_count = 0
+
+    def __str__(self) -> str:
+        """Returns: A string representation of the profiler statistics."""
+        # create table for the statistics
+        table = PrettyTable()
+        table.title = f"Manager Profiler (step: {self._step_count})"
+        table.field_names = ["Name", "Calls", "Mean (ms)", "Window Mean (ms)", "Min (ms)", "Max (ms)", "Total (s)"]
+        # set alignment of table columns
+        table.align["Name"] = "l"
+        table.float_format = ".4"
+        # add info sorted by the total time
+        summary = self.summary()
+        for name, stats in sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True):
+            table.add_row([
+                name,
+                stats["num_calls"],
+                stats["mean"] * 1e3,
+                stats["window_mean"] * 1e3,
+                stats["min"] * 1e3,
+                stats["max"] * 1e3,
+                stats["total"],
+            ])
+        return table.get_string()
+
+    """
+    Properties.
+    """
+
+    @property
+    def step_count(self) -> int:
+        """Number of calls to :meth:`step` since the last reset."""
+        return self._step_count
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the recorded calls."""
+        self._resolve_events()
+        return list(self._num_calls.keys())
+
+    """
+    Operations.
+    """
+
+    @contextmanager
+    def time(self, name: str) -> Iterator[None]:
+        """Context manager for timing the wrapped call.
+
+        Args:
+            name: The name under which the timing is recorded.
+        """
+        if self._use_cuda_events:
+            # record events on the current stream
+            start_event = torch.cuda.Event(enable_timing=True)
+            end_event = torch.cuda.Event(enable_timing=True)
+            start_event.record()
+            yield
+            end_event.record()
+            # store the events for resolving them later
+            self._pending_events.append((name, start_event, end_event))
+        else:
+            # obtain the timer for the name
+            timer = self._timers.get(name)
+            if timer is None:
+                timer = Timer()
+                self._timers[name] = timer
+            # time the call on the host
+            if self._synchronize:
+                torch.cuda.synchronize(self._device)
+            timer.start()
+            yield
+            if self._synchronize:
+                torch.cuda.synchronize(self._device)
+            timer.stop()
+            # record the elapsed time
+            self._record(name, timer.total_run_time)
+
+    def step(self):
+        """Updates the statistics and generates a report if the dump interval is reached.
+
+        This function should be called once per environment step. It resolves the pending CUDA events
+        (which synchronizes the host with the recorded events) and dumps the statistics every
+        :attr:`ManagerProfilerCfg.dump_interval` steps.
+        """
+        self._step_count += 1
+        # update the statistics
+        self._resolve_events()
+        # dump the statistics
+        if self.cfg.dump_interval > 0 and self._step_count % self.cfg.dump_interval == 0:
+            print(self)
+            if self.cfg.log_dir is not None:
+                self.save(os.path.join(self.cfg.log_dir, f"manager_profile_step_{self._step_count}.json"))
+
+    def reset(self):
+        """Clears all the recorded statistics."""
+        self._pending_events.clear()
+        self._num_calls.clear()
+        self._total_time.clear()
+        self._min_time.clear()
+        self._max_time.clear()
+        self._recent_times.clear()
+        self._step_count = 0
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Returns the statistics of all the recorded calls.
+
+        Returns:
+            A dictionary with the names of the calls as keys. The values are dictionaries containing the number
+            of calls (``"num_calls"``) and the ``"mean"``, ``"window_mean"``, ``"min"``, ``"max"``, ``"last"``
+            and ``"total"`` times in seconds.
+        """
+        # update the statistics
+        self._resolve_events()
+        # collect the statistics
+        summary = dict()
+        for name, num_calls in self._num_calls.items():
+            recent_times = self._recent_times[name]
+            summary[name] = {
+                "num_calls": num_calls,
+                "mean": self._total_time[name] / num_calls,
+                "window_mean": sum(recent_times) / len(recent_times),
+                "min": self._min_time[name],
+                "max": self._max_time[name],
+                "last": recent_times[-1],
+                "total": self._total_time[name],
+            }
+        return summary
+
+    def save(self, file_path: str):
+        """Saves the statistics of all the recorded calls into a JSON file.
+
+        Args:
+            file_path: The path to the JSON file. The parent directories are created if they do not exist.
+        """
+        # create the directory if it does not exist
+        dir_name = os.path.dirname(file_path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        # save the statistics
+        with open(file_path, "w") as f:
+            json.dump({"step": self._step_count, "terms": self.summary()}, f, indent=4)
+
+    """
+    Helper functions.
+    """
+
+    def _record(self, name: str, elapsed_time: float):
+        """Adds the elapsed time of a call to the statistics.
+
+        Args:
+            name: The name of the call.
+            elapsed_time: The elapsed time (in seconds).
+        """
+        if name not in self._num_calls:
+            self._num_calls[name] = 0
+            self._total_time[name] = 0.0
+            self._min_time[name] = elapsed_time
+            self._max_time[name] = elapsed_time
+            self._recent_times[name] = deque(maxlen=self.cfg.window_size)
+        # update the statistics
+        self._num_calls[name] += 1
+        self._total_time[name] += elapsed_time
+        self._min_time[name] = min(self._min_time[name], elapsed_time)
+        self._max_time[name] = max(self._max_time[name], elapsed_time)
+        self._recent_times[name].append(elapsed_time)
+
+    def _resolve_events(self):
+        """Resolves the pending CUDA events into elapsed times."""
+        for name, start_event, end_event in self._pending_events:
+            end_event.synchronize()
+            # note: elapsed time of CUDA events is in milliseconds
+            self._record(name, start_event.elapsed_time(end_event) * 1e-3)
+        self._pending_events.clear()
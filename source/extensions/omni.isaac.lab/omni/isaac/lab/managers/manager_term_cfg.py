@@ -156,6 +156,24 @@ class ObservationTermCfg(ManagerTermBaseCfg):
     """The scale to apply to the observation after clipping. Defaults to None,
     in which case no scaling is applied (same as setting scale to :obj:`1`)."""
 
+    history_length: int = 0
+    """Number of past observations to store in the observation buffers. Defaults to 0, meaning no history.
+
+    The history is stored in a :class:`~omni.isaac.lab.utils.buffers.CircularBuffer`, i.e. only the head of
+    the buffer moves when new observations are appended. The returned observation has the shape
+    (num_envs, history_length, obs_term_dim) with the most recent observation at the end. After the
+    initialization or a reset, the history is filled with the first observation computed for the environment.
+    """
+
+    flatten_history_dim: bool = True
+    """Whether to flatten the history dimension of the observation. Defaults to True.
+
+    If True, the observation with history of shape (num_envs, history_length, obs_term_dim) is flattened
+    to the shape (num_envs, history_length * prod(obs_term_dim)). Otherwise, it is returned as is.
+
+    This setting is only used if :attr:`history_length` is greater than zero.
+    """
+
 
 @configclass
 class ObservationGroupCfg:
@@ -177,6 +195,36 @@ class ObservationGroupCfg:
     Otherwise, no corruption is applied.
     """
 
+    history_length: int | None = None
+    """Number of past observations to store in the observation buffers for all terms in the group.
+    Defaults to None, in which case the history is configured for each term separately.
+
+    If set, this value overrides the :attr:`ObservationTermCfg.history_length` of all the terms in the group.
+    Please check :class:`ObservationTermCfg` for details on the history of observations.
+    """
+
+    flatten_history_dim: bool = True
+    """Whether to flatten the history dimension of the observations of all terms in the group. Defaults to True.
+
+    This setting is only used if :attr:`history_length` is not None. In that case, it overrides the
+    :attr:`ObservationTermCfg.flatten_history_dim` of all the terms in the group.
+    """
+
+    preallocate_buffer: bool = False
+    """Whether to compute the concatenated observations into a persistent buffer. Defaults to False.
+
+    If true, the group owns a preallocated output tensor and each observation term is written into its
+    slice of this tensor. The clipping and scaling of all the terms are then applied once on the whole
+    buffer. This avoids allocating new tensors for the group at every call to the manager.
+
+    .. attention::
+        The same tensor is returned at every call to :meth:`ObservationManager.compute_group`. Thus, any
+        reference to a previously returned observation is overwritten with the new values. If the observations
+        need to be stored, please clone them.
+
+    This setting is only supported when :attr:`concatenate_terms` is True.
+    """
+
 
 ##
 # Event manager
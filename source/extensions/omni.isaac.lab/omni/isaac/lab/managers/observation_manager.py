@@ -8,12 +8,14 @@
 from __future__ import annotations
 
 import inspect
+import math
 import torch
 from collections.abc import Sequence
 from prettytable import PrettyTable
 from typing import TYPE_CHECKING
 
 from omni.isaac.lab.utils import modifiers
+from omni.isaac.lab.utils.buffers import CircularBuffer
 
 from .manager_base import ManagerBase, ManagerTermBase
 from .manager_term_cfg import ObservationGroupCfg, ObservationTermCfg
@@ -74,19 +76,24 @@ class ObservationManager(ManagerBase):
             # if terms are concatenated, compute the combined shape into a single tuple
             # otherwise, keep the list of shapes as is
             if self._group_obs_concatenate[group_name]:
-                try:
-                    term_dims = [torch.tensor(dims, device="cpu") for dims in group_term_dims]
-                    self._group_obs_dim[group_name] = tuple(torch.sum(torch.stack(term_dims, dim=0), dim=0).tolist())
-                except RuntimeError:
+                # note: the terms are concatenated along the last dimension, so the other dimensions must match
+                if len({dims[:-1] for dims in group_term_dims}) != 1:
                     raise RuntimeError(
                         f"Unable to concatenate observation terms in group '{group_name}'."
                         f" The shapes of the terms are: {group_term_dims}."
                         " Please ensure that the shapes are compatible for concatenation."
                         " Otherwise, set 'concatenate_terms' to False in the group configuration."
                     )
+                self._group_obs_dim[group_name] = (
+                    *group_term_dims[0][:-1],
+                    sum(dims[-1] for dims in group_term_dims),
+                )
             else:
                 self._group_obs_dim[group_name] = group_term_dims
 
+        # create persistent buffers for the groups that request it
+        self._prepare_group_buffers()
+
     def __str__(self) -> str:
         """Returns: A string representation for the observation manager."""
         msg = f"<ObservationManager> contains {len(self._group_obs_term_names)} groups.\n"
@@ -174,6 +181,10 @@ class ObservationManager(ManagerBase):
         # call all modifiers that are classes
         for mod in self._group_obs_class_modifiers:
             mod.reset(env_ids=env_ids)
+        # reset the history of the terms
+        for group_history_buffers in self._group_obs_term_history_buffer.values():
+            for history_buffer in group_history_buffers.values():
+                history_buffer.reset(batch_ids=env_ids)
         # nothing to log here
         return {}
 
@@ -210,6 +221,7 @@ class ObservationManager(ManagerBase):
         3. Apply corruption/noise model based on :attr:`ObservationTermCfg.noise`
         4. Apply clipping based on :attr:`ObservationTermCfg.clip`
         5. Apply scaling based on :attr:`ObservationTermCfg.scale`
+        6. Append to the term's history based on :attr:`ObservationTermCfg.history_length`
 
         We apply noise to the computed term first to maintain the integrity of how noise affects the data
         as it truly exists in the real world. If the noise is applied after clipping or scaling, the noise
@@ -236,15 +248,21 @@ class ObservationManager(ManagerBase):
             )
         # iterate over all the terms in each group
         group_term_names = self._group_obs_term_names[group_name]
+        group_history_buffers = self._group_obs_term_history_buffer[group_name]
         # buffer to store obs per group
         group_obs = dict.fromkeys(group_term_names, None)
         # read attributes for each term
         obs_terms = zip(group_term_names, self._group_obs_term_cfgs[group_name])
 
+        # compute into the persistent buffer if the group has one
+        if group_name in self._group_obs_buffer:
+            return self._compute_group_into_buffer(group_name)
+
         # evaluate terms: compute, add noise, clip, scale, custom modifiers
         for name, term_cfg in obs_terms:
             # compute term's value
-            obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params).clone()
+            with self._profile(group_name, name):
+                obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params).clone()
             # apply post-processing
             if term_cfg.modifiers is not None:
                 for modifier in term_cfg.modifiers:
@@ -255,6 +273,12 @@ class ObservationManager(ManagerBase):
                 obs = obs.clip_(min=term_cfg.clip[0], max=term_cfg.clip[1])
             if term_cfg.scale:
                 obs = obs.mul_(term_cfg.scale)
+            # update the history of the term and read it back
+            if name in group_history_buffers:
+                group_history_buffers[name].append(obs)
+                obs = group_history_buffers[name].buffer
+                if term_cfg.flatten_history_dim:
+                    obs = obs.reshape(self._env.num_envs, -1)
             # add value to list
             group_obs[name] = obs
 
@@ -268,6 +292,114 @@ class ObservationManager(ManagerBase):
     Helper functions.
     """
 
+    def _compute_group_into_buffer(self, group_name: str) -> torch.Tensor:
+        """Computes the observations for a given group into its persistent buffer.
+
+        Each term is written into its slice of the group's buffer. Since clipping and scaling are element-wise
+        operations, they are applied once on the whole buffer after all the terms are computed. This results
+        in the same values as the per-term processing in :meth:`compute_group`.
+
+        Args:
+            group_name: The name of the group for which to compute the observations.
+
+        Returns:
+            The persistent buffer of the group. Shape is (num_envs, ...).
+        """
+        group_buffer = self._group_obs_buffer[group_name]
+        group_history_buffers = self._group_obs_term_history_buffer[group_name]
+        # evaluate terms: compute, custom modifiers, add noise, update history
+        # note: no clone is needed since the term's value is copied into the buffer
+        obs_terms = zip(
+            self._group_obs_term_names[group_name],
+            self._group_obs_term_cfgs[group_name],
+            self._group_obs_term_views[group_name],
+        )
+        for name, term_cfg, term_view in obs_terms:
+            # compute term's value
+            with self._profile(group_name, name):
+                obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params)
+            # apply post-processing
+            if term_cfg.modifiers is not None:
+                for modifier in term_cfg.modifiers:
+                    obs = modifier.func(obs, **modifier.params)
+            if term_cfg.noise:
+                obs = term_cfg.noise.func(obs, term_cfg.noise)
+            # update the history of the term and read it back
+            # note: clipping and scaling are element-wise, so they can be applied after reading the history
+            if name in group_history_buffers:
+                group_history_buffers[name].append(obs)
+                obs = group_history_buffers[name].buffer.view(term_view.shape)
+            # write value into the slice of the buffer
+            term_view.copy_(obs)
+        # apply clipping and scaling on the whole group
+        group_clip = self._group_obs_clip[group_name]
+        if group_clip is not None:
+            group_buffer.clamp_(min=group_clip[0], max=group_clip[1])
+        group_scale = self._group_obs_scale[group_name]
+        if group_scale is not None:
+            group_buffer.mul_(group_scale)
+
+        return group_buffer
+
+    def _prepare_group_buffers(self):
+        """Prepares the persistent buffers for the groups with :attr:`ObservationGroupCfg.preallocate_buffer` set.
+
+        For each such group, the following quantities are created:
+
+        * The output buffer of shape (num_envs, ...) which stores the concatenated observations.
+        * The views into the output buffer for each term. These are slices along the last dimension.
+        * The per-element clipping bounds and scaling factors along the last dimension. These are None if
+          none of the terms in the group are clipped or scaled respectively.
+
+        Raises:
+            ValueError: If the persistent buffer is requested for a group that does not concatenate its terms.
+        """
+        # create buffers to store information for each observation group
+        self._group_obs_buffer: dict[str, torch.Tensor] = dict()
+        self._group_obs_term_views: dict[str, list[torch.Tensor]] = dict()
+        self._group_obs_clip: dict[str, tuple[torch.Tensor, torch.Tensor] | None] = dict()
+        self._group_obs_scale: dict[str, torch.Tensor | None] = dict()
+
+        for group_name, preallocate in self._group_obs_preallocate.items():
+            # skip groups that compute observations on the fly
+            if not preallocate:
+                continue
+            # check that the terms are concatenated
+            if not self._group_obs_concatenate[group_name]:
+                raise ValueError(
+                    f"Unable to preallocate the buffer for observation group '{group_name}' since its terms"
+                    " are not concatenated. Please set 'concatenate_terms' to True in the group configuration."
+                )
+            # create the output buffer
+            group_dim = self._group_obs_dim[group_name]
+            group_buffer = torch.zeros((self.num_envs, *group_dim), device=self.device)
+            # create per-element clipping and scaling along the last dimension
+            clip_min = torch.full((group_dim[-1],), -torch.inf, device=self.device)
+            clip_max = torch.full((group_dim[-1],), torch.inf, device=self.device)
+            scale = torch.ones(group_dim[-1], device=self.device)
+            # create views into the buffer for each term
+            term_views = list()
+            idx = 0
+            obs_terms = zip(self._group_obs_term_dim[group_name], self._group_obs_term_cfgs[group_name])
+            for term_dim, term_cfg in obs_terms:
+                term_slice = slice(idx, idx + term_dim[-1])
+                term_views.append(group_buffer[..., term_slice])
+                # note: we follow the same checks as in :meth:`compute_group`
+                if term_cfg.clip:
+                    clip_min[term_slice] = term_cfg.clip[0]
+                    clip_max[term_slice] = term_cfg.clip[1]
+                if term_cfg.scale:
+                    scale[term_slice] = term_cfg.scale
+                idx += term_dim[-1]
+            # store the buffers
+            self._group_obs_buffer[group_name] = group_buffer
+            self._group_obs_term_views[group_name] = term_views
+            # only keep the clipping and scaling if they are needed
+            is_clipped = any(term_cfg.clip for term_cfg in self._group_obs_term_cfgs[group_name])
+            self._group_obs_clip[group_name] = (clip_min, clip_max) if is_clipped else None
+            is_scaled = any(term_cfg.scale for term_cfg in self._group_obs_term_cfgs[group_name])
+            self._group_obs_scale[group_name] = scale if is_scaled else None
+
     def _prepare_terms(self):
         """Prepares a list of observation terms functions."""
         # create buffers to store information for each observation group
@@ -277,6 +409,8 @@ class ObservationManager(ManagerBase):
         self._group_obs_term_cfgs: dict[str, list[ObservationTermCfg]] = dict()
         self._group_obs_class_term_cfgs: dict[str, list[ObservationTermCfg]] = dict()
         self._group_obs_concatenate: dict[str, bool] = dict()
+        self._group_obs_preallocate: dict[str, bool] = dict()
+        self._group_obs_term_history_buffer: dict[str, dict[str, CircularBuffer]] = dict()
 
         # create a list to store modifiers that are classes
         # we store it as a separate list to only call reset on them and prevent unnecessary calls
@@ -303,8 +437,10 @@ class ObservationManager(ManagerBase):
             self._group_obs_term_dim[group_name] = list()
             self._group_obs_term_cfgs[group_name] = list()
             self._group_obs_class_term_cfgs[group_name] = list()
+            self._group_obs_term_history_buffer[group_name] = dict()
             # read common config for the group
             self._group_obs_concatenate[group_name] = group_cfg.concatenate_terms
+            self._group_obs_preallocate[group_name] = group_cfg.preallocate_buffer
             # check if config is dict already
             if isinstance(group_cfg, dict):
                 group_cfg_items = group_cfg.items()
@@ -313,7 +449,13 @@ class ObservationManager(ManagerBase):
             # iterate over all the terms in each group
             for term_name, term_cfg in group_cfg.__dict__.items():
                 # skip non-obs settings
-                if term_name in ["enable_corruption", "concatenate_terms"]:
+                if term_name in [
+                    "enable_corruption",
+                    "concatenate_terms",
+                    "history_length",
+                    "flatten_history_dim",
+                    "preallocate_buffer",
+                ]:
                     continue
                 # check for non config
                 if term_cfg is None:
@@ -329,13 +471,28 @@ class ObservationManager(ManagerBase):
                 # check noise settings
                 if not group_cfg.enable_corruption:
                     term_cfg.noise = None
+                # check history settings
+                if group_cfg.history_length is not None:
+                    term_cfg.history_length = group_cfg.history_length
+                    term_cfg.flatten_history_dim = group_cfg.flatten_history_dim
                 # add term config to list to list
                 self._group_obs_term_names[group_name].append(term_name)
                 self._group_obs_term_cfgs[group_name].append(term_cfg)
 
                 # call function the first time to fill up dimensions
                 obs_dims = tuple(term_cfg.func(self._env, **term_cfg.params).shape)
-                self._group_obs_term_dim[group_name].append(obs_dims[1:])
+
+                # create history buffers and compute the dimensions of the term with history
+                if term_cfg.history_length > 0:
+                    self._group_obs_term_history_buffer[group_name][term_name] = CircularBuffer(
+                        max_len=term_cfg.history_length, batch_size=self._env.num_envs, device=self._env.device
+                    )
+                    term_dims = (term_cfg.history_length, *obs_dims[1:])
+                    if term_cfg.flatten_history_dim:
+                        term_dims = (math.prod(term_dims),)
+                    self._group_obs_term_dim[group_name].append(term_dims)
+                else:
+                    self._group_obs_term_dim[group_name].append(obs_dims[1:])
 
                 # prepare modifiers for each observation
                 if term_cfg.modifiers is not None:
@@ -35,6 +35,11 @@ class RewardManager(ManagerBase):
         of the environment. This is done to ensure that the computed reward terms are balanced with
         respect to the chosen time-step interval in the environment.
 
+    Internally, the values of all the reward terms are written into a single tensor of shape
+    (num_envs, num_terms). The total reward and the episodic sums of all the terms are then updated
+    using a single matrix-vector product and a single fused multiply-add with the tensor of the weights.
+    The raw values of the terms from the last computation are available in :attr:`term_values`.
+
     """
 
     _env: ManagerBasedRLEnv
@@ -48,10 +53,22 @@ class RewardManager(ManagerBase):
             env: The environment instance.
         """
         super().__init__(cfg, env)
+        num_terms = len(self._term_names)
+        # create buffer for the raw values of the reward terms
+        self._term_values = torch.zeros(self.num_envs, num_terms, dtype=torch.float, device=self.device)
+        # create buffer for the weights of the reward terms
+        self._term_weights = torch.tensor(
+            [term_cfg.weight for term_cfg in self._term_cfgs], dtype=torch.float, device=self.device
+        )
+        # weights scaled by the time-step (updated lazily when the time-step or the weights change)
+        self._term_weights_dt = torch.zeros_like(self._term_weights)
+        self._term_weights_dt_scale: float | None = None
         # prepare extra info to store individual reward term information
+        # note: the dictionary holds views into the single buffer for all the terms
+        self._episode_sums_buf = torch.zeros(self.num_envs, num_terms, dtype=torch.float, device=self.device)
         self._episode_sums = dict()
-        for term_name in self._term_names:
-            self._episode_sums[term_name] = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
+        for index, term_name in enumerate(self._term_names):
+            self._episode_sums[term_name] = self._episode_sums_buf[:, index]
         # create buffer for managing reward per environment
         self._reward_buf = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
 
@@ -84,6 +101,20 @@ class RewardManager(ManagerBase):
         """Name of active reward terms."""
         return self._term_names
 
+    @property
+    def term_values(self) -> torch.Tensor:
+        """The raw values of the reward terms from the last call to :meth:`compute`.
+
+        The shape of the tensor is (num_envs, num_terms). The values are not multiplied by the weights and the
+        time-step. The order of the columns corresponds to the order of the terms in :attr:`active_terms`.
+        Terms with zero weight are not computed and their values are zero.
+
+        .. note::
+            The tensor is updated in-place at every call to :meth:`compute`. Please clone it if the values
+            need to be stored.
+        """
+        return self._term_values
+
     """
     Operations.
     """
@@ -102,14 +133,13 @@ class RewardManager(ManagerBase):
         if env_ids is None:
             env_ids = slice(None)
         # store information
+        # r_1 + r_2 + ... + r_n
+        episodic_sum_avg = torch.mean(self._episode_sums_buf[env_ids], dim=0) / self._env.max_episode_length_s
         extras = {}
-        for key in self._episode_sums.keys():
-            # store information
-            # r_1 + r_2 + ... + r_n
-            episodic_sum_avg = torch.mean(self._episode_sums[key][env_ids])
-            extras["Episode_Reward/" + key] = episodic_sum_avg / self._env.max_episode_length_s
-            # reset episodic sum
-            self._episode_sums[key][env_ids] = 0.0
+        for index, key in enumerate(self._term_names):
+            extras["Episode_Reward/" + key] = episodic_sum_avg[index]
+        # reset episodic sum
+        self._episode_sums_buf[env_ids] = 0.0
         # reset all the reward terms
         for term_cfg in self._class_term_cfgs:
             term_cfg.func.reset(env_ids=env_ids)
@@ -128,19 +158,22 @@ class RewardManager(ManagerBase):
         Returns:
             The net reward signal of shape (num_envs,).
         """
-        # reset computation
-        self._reward_buf[:] = 0.0
         # iterate over all the reward terms
-        for name, term_cfg in zip(self._term_names, self._term_cfgs):
+        for index, (name, term_cfg) in enumerate(zip(self._term_names, self._term_cfgs)):
             # skip if weight is zero (kind of a micro-optimization)
             if term_cfg.weight == 0.0:
                 continue
             # compute term's value
-            value = term_cfg.func(self._env, **term_cfg.params) * term_cfg.weight * dt
-            # update total reward
-            self._reward_buf += value
-            # update episodic sum
-            self._episode_sums[name] += value
+            with self._profile(name):
+                self._term_values[:, index] = term_cfg.func(self._env, **term_cfg.params)
+        # scale the weights by the time-step
+        if self._term_weights_dt_scale != dt:
+            torch.mul(self._term_weights, dt, out=self._term_weights_dt)
+            self._term_weights_dt_scale = dt
+        # update total reward
+        torch.mv(self._term_values, self._term_weights_dt, out=self._reward_buf)
+        # update episodic sum
+        self._episode_sums_buf.addcmul_(self._term_values, self._term_weights_dt)
 
         return self._reward_buf
 
@@ -161,7 +194,14 @@ class RewardManager(ManagerBase):
         if term_name not in self._term_names:
             raise ValueError(f"Reward term '{term_name}' not found.")
         # set the configuration
-        self._term_cfgs[self._term_names.index(term_name)] = cfg
+        index = self._term_names.index(term_name)
+        self._term_cfgs[index] = cfg
+        # update the weight of the term
+        self._term_weights[index] = cfg.weight
+        self._term_weights_dt_scale = None
+        # clear the value of the term if it is not computed anymore
+        if cfg.weight == 0.0:
+            self._term_values[:, index] = 0.0
 
     def get_term_cfg(self, term_name: str) -> RewardTermCfg:
         """Gets the configuration for the specified term.
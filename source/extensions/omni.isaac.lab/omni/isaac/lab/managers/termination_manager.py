@@ -156,7 +156,8 @@ class TerminationManager(ManagerBase):
         self._terminated_buf[:] = False
         # iterate over all the termination terms
         for name, term_cfg in zip(self._term_names, self._term_cfgs):
-            value = term_cfg.func(self._env, **term_cfg.params)
+            with self._profile(name):
+                value = term_cfg.func(self._env, **term_cfg.params)
             # store timeout signal separately
             if term_cfg.time_out:
                 self._truncated_buf |= value
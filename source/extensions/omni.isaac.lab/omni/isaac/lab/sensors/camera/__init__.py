@@ -8,6 +8,7 @@
 from .camera import Camera
 from .camera_cfg import CameraCfg
 from .camera_data import CameraData
+from .image_writer import ImageWriter
 from .tiled_camera import TiledCamera
 from .tiled_camera_cfg import TiledCameraCfg
 from .utils import *  # noqa: F401, F403
@@ -10,7 +10,7 @@ import re
 import torch
 from collections.abc import Sequence
 from tensordict import TensorDict
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Literal
 
 import carb
 import omni.kit.commands
@@ -21,7 +21,7 @@ from pxr import UsdGeom
 import omni.isaac.lab.sim as sim_utils
 from omni.isaac.lab.utils import to_camel_case
 from omni.isaac.lab.utils.array import convert_to_torch
-from omni.isaac.lab.utils.math import quat_from_matrix
+from omni.isaac.lab.utils.math import compute_unprojection_grid, quat_from_matrix
 
 from ..sensor_base import SensorBase
 from .camera_data import CameraData
@@ -132,6 +132,8 @@ class Camera(SensorBase):
         self._sensor_prims: list[UsdGeom.Camera] = list()
         # Create empty variables for storing output data
         self._data = CameraData()
+        # Cached unprojection grid of the cameras (computed when first accessed)
+        self._unprojection_grid: torch.Tensor | None = None
 
     def __del__(self):
         """Unsubscribes from callbacks and detach from the replicator registry."""
@@ -191,6 +193,18 @@ class Camera(SensorBase):
         """A tuple containing (height, width) of the camera sensor."""
         return (self.cfg.height, self.cfg.width)
 
+    @property
+    def unprojection_grid(self) -> torch.Tensor:
+        """The points at unit depth that the pixels of the cameras unproject to. Shape is (N, H x W, 3).
+
+        The grid is computed from the intrinsic matrices when it is first accessed and cached until the intrinsic
+        matrices change. It can be passed to :meth:`omni.isaac.lab.utils.math.unproject_depth` and the pointcloud
+        utilities to unproject the depth images without recomputing it.
+        """
+        if self._unprojection_grid is None:
+            self._unprojection_grid = compute_unprojection_grid(self._data.intrinsic_matrices, *self.image_shape)
+        return self._unprojection_grid
+
     """
     Configuration
     """
@@ -480,18 +494,20 @@ class Camera(SensorBase):
             # it allocates memory for all the sensors
             self._create_annotator_data()
         else:
+            # resolve the indices of the annotators on the host once
+            # note: this avoids synchronizing with the device for every camera
+            if isinstance(env_ids, torch.Tensor):
+                indices = env_ids.tolist()
+            else:
+                indices = list(env_ids)
+            if len(indices) == self._view.count:
+                env_ids = slice(None)
             # iterate over all the data types
-            for name, annotators in self._rep_registry.items():
-                # iterate over all the annotators
-                for index in env_ids:
-                    # get the output
-                    output = annotators[index].get_data()
-                    # process the output
-                    data, info = self._process_annotator_output(name, output)
-                    # add data to output
-                    self._data.output[name][index] = data
-                    # add info to output
-                    self._data.info[index][name] = info
+            for name in self._rep_registry:
+                # read the outputs of the annotators as a batch
+                data = self._read_annotator_data(name, indices)
+                # add data to output
+                self._data.output[name][env_ids] = data
 
     """
     Private Helpers
@@ -532,6 +548,9 @@ class Camera(SensorBase):
         # the memory will be allocated when the buffer() function is called for the first time.
         self._data.output = TensorDict({}, batch_size=self._view.count, device=self.device)
         self._data.info = [{name: None for name in self.cfg.data_types} for _ in range(self._view.count)]
+        # buffers to gather the raw outputs of the annotators into
+        # note: these are also allocated when the buffer() function is called for the first time.
+        self._annotator_buffers: dict[str, torch.Tensor] = dict()
 
     def _update_intrinsic_matrices(self, env_ids: Sequence[int]):
         """Compute camera's matrix of intrinsic parameters.
@@ -565,6 +584,8 @@ class Camera(SensorBase):
             self._data.intrinsic_matrices[i, 1, 1] = f_y
             self._data.intrinsic_matrices[i, 1, 2] = c_y
             self._data.intrinsic_matrices[i, 2, 2] = 1
+        # invalidate the unprojection grid
+        self._unprojection_grid = None
 
     def _update_poses(self, env_ids: Sequence[int]):
         """Computes the pose of the camera in the world frame with ROS convention.
@@ -593,59 +614,79 @@ class Camera(SensorBase):
         This is an expensive operation and should be called only once.
         """
         # add data from the annotators
-        for name, annotators in self._rep_registry.items():
-            # create a list to store the data for each annotator
-            data_all_cameras = list()
-            # iterate over all the annotators
-            for index in self._ALL_INDICES:
-                # get the output
-                output = annotators[index].get_data()
-                # process the output
-                data, info = self._process_annotator_output(name, output)
-                # append the data
-                data_all_cameras.append(data)
-                # store the info
-                self._data.info[index][name] = info
-            # concatenate the data along the batch dimension
-            self._data.output[name] = torch.stack(data_all_cameras, dim=0)
-
-    def _process_annotator_output(self, name: str, output: Any) -> tuple[torch.tensor, dict | None]:
-        """Process the annotator output.
-
-        This function is called after the data has been collected from all the cameras.
+        for name in self._rep_registry:
+            # read the outputs of all the annotators
+            # note: the data is cloned since it is a view of the buffer that is reused by the next reads
+            self._data.output[name] = self._read_annotator_data(name, list(range(self._view.count))).clone()
+
+    def _read_annotator_data(self, name: str, indices: list[int]) -> torch.Tensor:
+        """Reads the outputs of the annotators of a data type for the given cameras.
+
+        The raw outputs of the annotators are gathered into a buffer of the data type, which is allocated
+        for all the cameras when it is read for the first time. The gathered outputs are then processed
+        together. The info of the outputs is stored in the :attr:`CameraData.info`.
+
+        Args:
+            name: The name of the data type.
+            indices: The indices of the cameras to read.
+
+        Returns:
+            The processed data of the cameras. It is a view of the buffer of the data type.
         """
-        # extract info and data from the output
-        if isinstance(output, dict):
-            data = output["data"]
-            info = output["info"]
-        else:
-            data = output
-            info = None
-        # convert data into torch tensor
-        data = convert_to_torch(data, device=self.device)
+        annotators = self._rep_registry[name]
+        buffer = self._annotator_buffers.get(name)
+        # iterate over the annotators
+        for i, index in enumerate(indices):
+            # get the output
+            output = annotators[index].get_data()
+            # extract info and data from the output
+            if isinstance(output, dict):
+                data = output["data"]
+                self._data.info[index][name] = output["info"]
+            else:
+                data = output
+                self._data.info[index][name] = None
+            # convert data into torch tensor
+            data = convert_to_torch(data)
+            # allocate the buffer from the first output
+            if buffer is None:
+                buffer = torch.empty((self._view.count, *data.shape), dtype=data.dtype, device=self.device)
+                self._annotator_buffers[name] = buffer
+            # copy the data into the buffer
+            buffer[i].copy_(data)
+        # process the data of all the cameras together
+        return self._process_annotator_output(name, buffer[: len(indices)])
+
+    def _process_annotator_output(self, name: str, data: torch.Tensor) -> torch.Tensor:
+        """Process the raw annotator data of a batch of cameras.
+
+        This function is called after the data has been collected from the cameras.
+
+        Args:
+            name: The name of the data type.
+            data: The raw data of the cameras. Shape is (B, ...), where B is the number of cameras.
 
+        Returns:
+            The processed data of the cameras. Shape is (B, H, W, C) or (B, H, W).
+        """
         # process data for different segmentation types
         # Note: Replicator returns raw buffers of dtype int32 for segmentation types
         #   so we need to convert them to uint8 4 channel images for colorized types
+        num_cameras = data.shape[0]
         height, width = self.image_shape
         if name == "semantic_segmentation":
-            if self.cfg.colorize_semantic_segmentation:
-                data = data.view(torch.uint8).reshape(height, width, -1)
-            else:
-                data = data.view(height, width)
+            colorize = self.cfg.colorize_semantic_segmentation
         elif name == "instance_segmentation_fast":
-            if self.cfg.colorize_instance_segmentation:
-                data = data.view(torch.uint8).reshape(height, width, -1)
-            else:
-                data = data.view(height, width)
+            colorize = self.cfg.colorize_instance_segmentation
         elif name == "instance_id_segmentation_fast":
-            if self.cfg.colorize_instance_id_segmentation:
-                data = data.view(torch.uint8).reshape(height, width, -1)
-            else:
-                data = data.view(height, width)
-
-        # return the data and info
-        return data, info
+            colorize = self.cfg.colorize_instance_id_segmentation
+        else:
+            return data
+        # reinterpret the data for the whole batch
+        if colorize:
+            return data.view(torch.uint8).reshape(num_cameras, height, width, -1)
+        else:
+            return data.view(num_cameras, height, width)
 
     """
     Internal simulation callbacks.
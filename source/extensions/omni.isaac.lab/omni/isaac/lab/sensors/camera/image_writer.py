@@ -0,0 +1,294 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Sub-module for a writer that saves the camera outputs to disk in the background."""
+
+from __future__ import annotations
+
+import numpy as np
+import os
+import queue
+import threading
+import torch
+from collections.abc import Mapping
+from typing import Literal
+
+
+class ImageWriter:
+    """A writer that saves the camera outputs to disk on background threads.
+
+    Encoding and writing images to disk is slow compared to a simulation step. Instead of doing it on the
+    simulation thread, the writer copies the outputs into host staging buffers and hands them over to a
+    pool of worker threads that encode and write the files. For outputs on the GPU, the staging buffers are
+    allocated in pinned memory and the copies are issued asynchronously on the current CUDA stream, so that
+    :meth:`write` returns without waiting for the device.
+
+    The number of pending writes is bounded by ``max_queue_size``. When the workers cannot keep up,
+    :meth:`write` blocks until a slot is free instead of buffering an unbounded number of images.
+
+    Each output is saved into its own sub-directory of the output directory. Depending on the file format,
+    the files are named as follows:
+
+    * ``"png"``: One image per camera, saved as ``<name>/<frame>_<camera_index>.png``.
+    * ``"npy"``: One shard per frame containing the images of all cameras, saved as ``<name>/<frame>.npy``.
+    * ``"raw"``: One shard per frame containing the bytes of the images of all cameras, saved as
+      ``<name>/<frame>.raw``. The shape and data type of the shard are those of the output.
+
+    Usage:
+
+    .. code-block:: python
+
+        from omni.isaac.lab.sensors import ImageWriter
+
+        with ImageWriter("output/camera", file_format="png") as writer:
+            for _ in range(100):
+                sim.step()
+                camera.update(dt)
+                writer.write(camera.data.output)
+
+    Note:
+        Writing PNG files requires :mod:`torchvision`. PNG files only support images with 1, 3 or 4 channels.
+        Floating point images are assumed to be in the range [0, 1] and are converted to 8-bit images, similar
+        to :func:`omni.isaac.lab.sensors.camera.utils.save_images_to_file`. To save depth images without loss
+        of precision, use the ``"npy"`` or ``"raw"`` file formats.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        file_format: Literal["png", "npy", "raw"] = "png",
+        num_workers: int = 2,
+        max_queue_size: int = 8,
+        frame_padding: int = 6,
+    ):
+        """Initializes the writer and starts the worker threads.
+
+        Args:
+            output_dir: The directory to save the outputs to. It is created if it does not exist.
+            file_format: The format of the saved files. Defaults to "png".
+            num_workers: The number of worker threads that encode and write the files. Defaults to 2.
+            max_queue_size: The maximum number of pending writes before :meth:`write` blocks. Defaults to 8.
+            frame_padding: The number of digits to pad the frame number in the file names with. Defaults to 6.
+
+        Raises:
+            ValueError: When the file format is not supported.
+            ValueError: When the number of workers or the maximum queue size is not positive.
+        """
+        # check inputs
+        if file_format not in ("png", "npy", "raw"):
+            raise ValueError(f"Unsupported file format: '{file_format}'. Expected 'png', 'npy' or 'raw'.")
+        if num_workers < 1 or max_queue_size < 1:
+            raise ValueError(
+                "The number of workers and the maximum queue size must be positive. Received:"
+                f" num_workers={num_workers}, max_queue_size={max_queue_size}."
+            )
+        # store inputs
+        self._output_dir = output_dir
+        self._file_format = file_format
+        self._frame_padding = frame_padding
+        # counter for the frames written without an explicit frame number
+        self._frame = 0
+        # free staging buffers, keyed by their shape, data type and whether they are pinned
+        self._staging_buffers: dict[tuple, list[torch.Tensor]] = dict()
+        self._staging_buffers_lock = threading.Lock()
+        # first error raised by the workers, reported on the simulation thread
+        self._error: Exception | None = None
+        # start the workers
+        os.makedirs(self._output_dir, exist_ok=True)
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._workers = [
+            threading.Thread(target=self._run_worker, name=f"ImageWriter-{index}", daemon=True)
+            for index in range(num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        self._is_closed = False
+
+    def __del__(self):
+        """Flushes the pending writes and stops the workers."""
+        # the writer may not be fully initialized if the constructor raised
+        if hasattr(self, "_is_closed"):
+            self.close()
+
+    def __enter__(self) -> ImageWriter:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    """
+    Properties
+    """
+
+    @property
+    def output_dir(self) -> str:
+        """The directory the outputs are saved to."""
+        return self._output_dir
+
+    @property
+    def num_pending(self) -> int:
+        """The approximate number of writes that are queued and not yet picked up by the workers."""
+        return self._queue.qsize()
+
+    """
+    Operations
+    """
+
+    def write(self, data: Mapping[str, torch.Tensor], frame: int | None = None):
+        """Queues the outputs of the cameras to be saved to disk.
+
+        The outputs are copied into host staging buffers before the method returns, so the input tensors
+        can be modified afterwards. If the queue is full, the method blocks until the workers free a slot.
+
+        Args:
+            data: The outputs to save, such as :attr:`CameraData.output`. Each value is a tensor of shape
+                (N, H, W, C), where N is the number of cameras.
+            frame: The frame number used in the file names. Defaults to None, in which case a counter of
+                the calls to this method is used.
+
+        Raises:
+            RuntimeError: When the writer is closed or a previous write failed.
+            ValueError: When an output cannot be saved in the file format of the writer.
+        """
+        # check the state of the writer
+        if self._is_closed:
+            raise RuntimeError("Cannot write outputs with an image writer that is closed.")
+        self._raise_worker_error()
+        # resolve frame number
+        if frame is None:
+            frame = self._frame
+        self._frame = frame + 1
+        # queue the outputs
+        for name, images in data.items():
+            if self._file_format == "png":
+                self._check_png_images(name, images)
+            # copy the images into a staging buffer
+            staging_buffer = self._acquire_staging_buffer(images)
+            staging_buffer.copy_(images, non_blocking=True)
+            # record when the copy completes so that the workers do not read the buffer too early
+            if images.is_cuda:
+                copy_event = torch.cuda.Event()
+                copy_event.record(torch.cuda.current_stream(images.device))
+            else:
+                copy_event = None
+            # note: this blocks while the queue is full
+            self._queue.put((name, frame, staging_buffer, copy_event))
+
+    def flush(self):
+        """Blocks until all the queued outputs are saved to disk.
+
+        Raises:
+            RuntimeError: When a queued write failed.
+        """
+        if not self._is_closed:
+            self._queue.join()
+        self._raise_worker_error()
+
+    def close(self):
+        """Flushes the queued outputs and stops the workers.
+
+        The method does nothing if the writer is already closed.
+
+        Raises:
+            RuntimeError: When a queued write failed.
+        """
+        if self._is_closed:
+            return
+        # wait for the pending writes
+        self._queue.join()
+        self._is_closed = True
+        # stop the workers
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        # free the staging buffers
+        self._staging_buffers.clear()
+        self._raise_worker_error()
+
+    """
+    Internal helpers.
+    """
+
+    def _acquire_staging_buffer(self, images: torch.Tensor) -> torch.Tensor:
+        """Returns a free host buffer to copy the images into."""
+        pin_memory = images.is_cuda
+        key = (tuple(images.shape), images.dtype, pin_memory)
+        with self._staging_buffers_lock:
+            free_buffers = self._staging_buffers.get(key)
+            if free_buffers:
+                return free_buffers.pop()
+        # note: the number of buffers is bounded by the number of writes that can be pending at once
+        return torch.empty(images.shape, dtype=images.dtype, pin_memory=pin_memory)
+
+    def _release_staging_buffer(self, staging_buffer: torch.Tensor):
+        """Returns a buffer to the pool of free host buffers."""
+        key = (tuple(staging_buffer.shape), staging_buffer.dtype, staging_buffer.is_pinned())
+        with self._staging_buffers_lock:
+            self._staging_buffers.setdefault(key, []).append(staging_buffer)
+
+    def _check_png_images(self, name: str, images: torch.Tensor):
+        """Checks that the images of an output can be saved as PNG files."""
+        if images.dim() != 4 or images.shape[-1] not in (1, 3, 4):
+            raise ValueError(
+                f"Cannot save the output '{name}' as PNG files. Expected a tensor of shape (N, H, W, C) with"
+                f" 1, 3 or 4 channels, but received shape: {tuple(images.shape)}."
+            )
+        if images.dtype != torch.uint8 and not images.is_floating_point():
+            raise ValueError(
+                f"Cannot save the output '{name}' as PNG files. Expected an 8-bit or floating point tensor,"
+                f" but received data type: {images.dtype}. Use the 'npy' or 'raw' file formats instead."
+            )
+
+    def _raise_worker_error(self):
+        """Raises the first error that occurred in the workers, if any."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"Failed to save the camera outputs to '{self._output_dir}'.") from error
+
+    def _run_worker(self):
+        """Worker loop that saves the queued outputs to disk."""
+        while True:
+            job = self._queue.get()
+            # check if the writer is closed
+            if job is None:
+                self._queue.task_done()
+                break
+            name, frame, staging_buffer, copy_event = job
+            try:
+                # wait for the copy from the device
+                if copy_event is not None:
+                    copy_event.synchronize()
+                self._save(name, frame, staging_buffer)
+            except Exception as e:
+                # note: only the first error is kept as the later ones are likely caused by it
+                if self._error is None:
+                    self._error = e
+            finally:
+                self._release_staging_buffer(staging_buffer)
+                self._queue.task_done()
+
+    def _save(self, name: str, frame: int, images: torch.Tensor):
+        """Saves the images of an output at a given frame to disk."""
+        # create the directory of the output
+        output_dir = os.path.join(self._output_dir, name)
+        os.makedirs(output_dir, exist_ok=True)
+        file_stem = os.path.join(output_dir, f"{frame:0{self._frame_padding}d}")
+        # save the images
+        if self._file_format == "npy":
+            np.save(f"{file_stem}.npy", images.numpy())
+        elif self._file_format == "raw":
+            images.numpy().tofile(f"{file_stem}.raw")
+        else:
+            from torchvision.io import write_png
+
+            # convert floating point images to 8-bit images
+            if images.is_floating_point():
+                images = images.mul(255).add_(0.5).clamp_(0, 255).to(torch.uint8)
+            # convert to channel-first layout: (N, C, H, W)
+            images = images.permute(0, 3, 1, 2)
+            index_padding = len(str(images.shape[0] - 1))
+            for index, image in enumerate(images):
+                write_png(image.contiguous(), f"{file_stem}_{index:0{index_padding}d}.png")
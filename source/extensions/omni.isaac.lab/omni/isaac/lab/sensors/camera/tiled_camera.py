@@ -10,7 +10,7 @@ import numpy as np
 import torch
 from collections.abc import Sequence
 from tensordict import TensorDict
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 import carb
 import omni.usd
@@ -41,6 +41,10 @@ class TiledCamera(Camera):
     - ``"distance_to_camera"``: An image containing the distance to camera optical center.
     - ``"depth"``: An alias for ``"distance_to_camera"``.
 
+    The images can be stored with a lower precision to save memory and bandwidth (see
+    :attr:`TiledCameraCfg.rgb_dtype` and :attr:`TiledCameraCfg.depth_dtype`). The conversion happens
+    while the images are copied out of the tiled buffer, so it does not need a separate pass.
+
     .. attention::
         Please note that the fidelity of RGB images may be lower than the standard camera sensor due to the
         tiled rendering process. Various ray tracing effects such as reflections, refractions, and shadows may not be
@@ -216,6 +220,7 @@ class TiledCamera(Camera):
                     *list(self._data.output[data_type].shape[1:]),  # height, width, num_channels
                     self._tiling_grid_shape()[0],  # num_tiles_x
                     offset if data_type == "distance_to_camera" or data_type == "depth" else 0,
+                    *self._output_mappings[data_type],  # clip_min, clip_max, scale, bias
                 ],
                 device=self.device,
             )
@@ -231,6 +236,9 @@ class TiledCamera(Camera):
                 f"The TiledCamera class only supports the following types {TiledCamera.SUPPORTED_TYPES} but the"
                 f" following where provided: {cfg.data_types}"
             )
+        # check that the depth can be quantized
+        if cfg.depth_dtype == "uint8" and cfg.depth_clipping_range is None:
+            raise ValueError("The depth clipping range must be provided to quantize the depth to 'uint8'.")
 
     def _create_buffers(self):
         """Create buffers for storing data."""
@@ -245,15 +253,33 @@ class TiledCamera(Camera):
         self._data.image_shape = self.image_shape
         # -- output data
         data_dict = dict()
+        # mapping of the pixel values of each data type: (clip_min, clip_max, scale, bias)
+        self._output_mappings: dict[str, tuple[float, float, float, float]] = dict()
         if "rgb" in self.cfg.data_types:
             data_dict["rgb"] = torch.zeros(
-                (self._view.count, self.cfg.height, self.cfg.width, 3), device=self.device
+                (self._view.count, self.cfg.height, self.cfg.width, 3),
+                dtype=getattr(torch, self.cfg.rgb_dtype),
+                device=self.device,
             ).contiguous()
+            if self.cfg.rgb_dtype == "uint8":
+                self._output_mappings["rgb"] = (0.0, 1.0, 255.0, 0.5)
+            else:
+                self._output_mappings["rgb"] = (-math.inf, math.inf, 1.0, 0.0)
         for data_type in ["distance_to_camera", "depth"]:
             if data_type in self.cfg.data_types:
                 data_dict[data_type] = torch.zeros(
-                    (self._view.count, self.cfg.height, self.cfg.width, 1), device=self.device
+                    (self._view.count, self.cfg.height, self.cfg.width, 1),
+                    dtype=getattr(torch, self.cfg.depth_dtype),
+                    device=self.device,
                 ).contiguous()
+                # resolve the clipping range
+                near, far = self.cfg.depth_clipping_range or (-math.inf, math.inf)
+                if self.cfg.depth_dtype == "uint8":
+                    # quantize the clipped distances to the full range of the data type
+                    scale = 255.0 / (far - near)
+                    self._output_mappings[data_type] = (near, far, scale, 0.5 - near * scale)
+                else:
+                    self._output_mappings[data_type] = (near, far, 1.0, 0.0)
         self._data.output = TensorDict(data_dict, batch_size=self._view.count, device=self.device)
 
     def _tiled_image_shape(self) -> tuple[int, int]:
@@ -271,7 +297,7 @@ class TiledCamera(Camera):
         # we do not need to create annotator data for the tiled camera sensor
         raise RuntimeError("This function should not be called for the tiled camera sensor.")
 
-    def _process_annotator_output(self, name: str, output: Any) -> tuple[torch.tensor, dict | None]:
+    def _process_annotator_output(self, name: str, data: torch.Tensor) -> torch.Tensor:
         # we do not need to process annotator output for the tiled camera sensor
         raise RuntimeError("This function should not be called for the tiled camera sensor.")
 
@@ -64,6 +64,29 @@ class TiledCameraCfg(SensorBaseCfg):
     height: int = MISSING
     """Height of the image in pixels."""
 
+    rgb_dtype: Literal["float32", "uint8"] = "float32"
+    """Data type of the ``"rgb"`` images. Defaults to "float32".
+
+    - ``"float32"``: The colors are in the range [0, 1].
+    - ``"uint8"``: The colors are in the range [0, 255].
+    """
+
+    depth_dtype: Literal["float32", "float16", "uint8"] = "float32"
+    """Data type of the ``"distance_to_camera"`` (or ``"depth"``) images. Defaults to "float32".
+
+    - ``"float32"``: The distances in meters.
+    - ``"float16"``: The distances in meters with half precision.
+    - ``"uint8"``: The distances quantized over the :attr:`depth_clipping_range`, where 0 is the
+      near and 255 is the far clipping distance.
+    """
+
+    depth_clipping_range: tuple[float, float] | None = None
+    """Range (near, far) to clip the distances to (in meters). Defaults to None, in which case the distances
+    are not clipped.
+
+    This is required if the :attr:`depth_dtype` is "uint8".
+    """
+
     return_latest_camera_pose: bool = False
     """Whether to return the latest camera pose when fetching the camera's data. Defaults to False.
 
@@ -88,6 +88,7 @@ def create_pointcloud_from_depth(
     position: Sequence[float] | None = None,
     orientation: Sequence[float] | None = None,
     device: torch.device | str | None = None,
+    unprojection_grid: torch.Tensor | None = None,
 ) -> np.ndarray | torch.Tensor:
     r"""Creates pointcloud from input depth image and camera intrinsic matrix.
 
@@ -115,6 +116,8 @@ def create_pointcloud_from_depth(
         orientation: The orientation (w, x, y, z) of the camera in a target frame. Defaults to None.
         device: The device for torch where the computation should be executed.
             Defaults to None, i.e. takes the device that matches the depth image.
+        unprojection_grid: The points at unit depth of the pixels (see :attr:`Camera.unprojection_grid`).
+            Shape is (H x W, 3). Defaults to None, in which case it is computed from the intrinsic matrix.
 
     Returns:
         An array/tensor of shape (N, 3) comprising of 3D coordinates of points.
@@ -142,7 +145,9 @@ def create_pointcloud_from_depth(
     if orientation is not None:
         orientation = convert_to_torch(orientation, dtype=torch.float32, device=device)
     # compute pointcloud
-    depth_cloud = math_utils.unproject_depth(depth, intrinsic_matrix)
+    if unprojection_grid is not None:
+        unprojection_grid = convert_to_torch(unprojection_grid, dtype=torch.float32, device=device)
+    depth_cloud = math_utils.unproject_depth(depth, intrinsic_matrix, unprojection_grid)
     # convert 3D points to world frame
     depth_cloud = math_utils.transform_points(depth_cloud, position, orientation)
 
@@ -262,6 +267,222 @@ def create_pointcloud_from_rgbd(
         return points_xyz, points_rgb
 
 
+def create_pointclouds_from_depth(
+    intrinsic_matrices: torch.Tensor,
+    depth: torch.Tensor,
+    positions: torch.Tensor | None = None,
+    orientations: torch.Tensor | None = None,
+    num_points: int | None = None,
+    voxel_size: float | None = None,
+    num_cameras_per_env: int = 1,
+    unprojection_grid: torch.Tensor | None = None,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    r"""Creates a batch of pointclouds of a fixed size from depth images of multiple cameras.
+
+    This function provides the same functionality as :meth:`create_pointcloud_from_depth` but for a batch of
+    cameras. Instead of dropping the invalid points, which results in pointclouds of different sizes, the
+    pointclouds are padded to a fixed number of points. The valid points are moved to the front of each
+    pointcloud and a mask marks them. The padded points are set to zero.
+
+    Invalid points correspond to pixels with depth values 0.0, NaN or infinity. The valid points can be
+    further reduced with the following options:
+
+    * ``voxel_size``: Only one point is kept in each occupied voxel of the pointcloud.
+    * ``num_points``: At most this many points are sampled uniformly from the valid points.
+
+    The cameras of an environment can be fused into a single pointcloud by setting the ``num_cameras_per_env``.
+    In that case, the cameras of an environment must be consecutive in the batch. The poses of the cameras
+    should then be given in a common frame (for example, the world frame).
+
+    All the computations are done on the device of the depth images.
+
+    Args:
+        intrinsic_matrices: The calibration matrices of the cameras. Shape is (N, 3, 3).
+        depth: The depth images of the cameras. Shape is (N, H, W) or (N, H, W, 1).
+        positions: The positions of the cameras in a target frame. Shape is (N, 3). Defaults to None.
+        orientations: The orientations (w, x, y, z) of the cameras in a target frame. Shape is (N, 4).
+            Defaults to None.
+        num_points: The number of points in each pointcloud. Defaults to None, in which case all the
+            pixels of the fused cameras are kept.
+        voxel_size: The size of the voxels to downsample the pointclouds with (in m). Defaults to None,
+            in which case the pointclouds are not downsampled.
+        num_cameras_per_env: The number of cameras fused into each pointcloud. Defaults to 1.
+        unprojection_grid: The points at unit depth of the pixels of the cameras (see
+            :attr:`Camera.unprojection_grid`). Shape is (N, H x W, 3). Defaults to None, in which case
+            it is computed from the intrinsic matrices.
+
+    Returns:
+        A tuple containing the points and the mask of the valid points. Their shapes are (M, P, 3) and (M, P),
+        where M is the number of pointclouds (N / num_cameras_per_env) and P is the number of points.
+
+    Raises:
+        ValueError: When the number of cameras is not divisible by the number of cameras per environment.
+    """
+    points, _, valid = _create_pointclouds(
+        intrinsic_matrices,
+        depth,
+        None,
+        positions,
+        orientations,
+        num_points,
+        voxel_size,
+        num_cameras_per_env,
+        unprojection_grid,
+    )
+    return points, valid
+
+
+def create_pointclouds_from_rgbd(
+    intrinsic_matrices: torch.Tensor,
+    depth: torch.Tensor,
+    rgb: torch.Tensor,
+    positions: torch.Tensor | None = None,
+    orientations: torch.Tensor | None = None,
+    num_points: int | None = None,
+    voxel_size: float | None = None,
+    num_cameras_per_env: int = 1,
+    unprojection_grid: torch.Tensor | None = None,
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Creates a batch of colored pointclouds of a fixed size from RGB-D images of multiple cameras.
+
+    This function provides the same functionality as :meth:`create_pointclouds_from_depth` but also returns
+    the colors of the points. The colors of the padded points are set to zero.
+
+    Args:
+        intrinsic_matrices: The calibration matrices of the cameras. Shape is (N, 3, 3).
+        depth: The depth images of the cameras. Shape is (N, H, W) or (N, H, W, 1).
+        rgb: The color images of the cameras. Shape is (N, H, W, C).
+        positions: The positions of the cameras in a target frame. Shape is (N, 3). Defaults to None.
+        orientations: The orientations (w, x, y, z) of the cameras in a target frame. Shape is (N, 4).
+            Defaults to None.
+        num_points: The number of points in each pointcloud. Defaults to None, in which case all the
+            pixels of the fused cameras are kept.
+        voxel_size: The size of the voxels to downsample the pointclouds with (in m). Defaults to None,
+            in which case the pointclouds are not downsampled.
+        num_cameras_per_env: The number of cameras fused into each pointcloud. Defaults to 1.
+        unprojection_grid: The points at unit depth of the pixels of the cameras (see
+            :attr:`Camera.unprojection_grid`). Shape is (N, H x W, 3). Defaults to None, in which case
+            it is computed from the intrinsic matrices.
+
+    Returns:
+        A tuple containing the points, their colors and the mask of the valid points. Their shapes are
+        (M, P, 3), (M, P, C) and (M, P), where M is the number of pointclouds (N / num_cameras_per_env)
+        and P is the number of points.
+
+    Raises:
+        ValueError: When the number of cameras is not divisible by the number of cameras per environment.
+        ValueError: When the rgb images are not of shape (N, H, W, C).
+    """
+    if rgb.dim() != 4 or rgb.shape[:3] != depth.shape[:3]:
+        raise ValueError(f"Expected rgb images of shape (N, H, W, C) matching the depth: got shape {rgb.shape}.")
+    return _create_pointclouds(
+        intrinsic_matrices,
+        depth,
+        rgb,
+        positions,
+        orientations,
+        num_points,
+        voxel_size,
+        num_cameras_per_env,
+        unprojection_grid,
+    )
+
+
+def _create_pointclouds(
+    intrinsic_matrices: torch.Tensor,
+    depth: torch.Tensor,
+    rgb: torch.Tensor | None,
+    positions: torch.Tensor | None,
+    orientations: torch.Tensor | None,
+    num_points: int | None,
+    voxel_size: float | None,
+    num_cameras_per_env: int,
+    unprojection_grid: torch.Tensor | None,
+) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor]:
+    """Creates a batch of padded pointclouds. Please check :meth:`create_pointclouds_from_rgbd` for details."""
+    # resolve the shapes
+    num_cameras = depth.shape[0]
+    if num_cameras % num_cameras_per_env != 0:
+        raise ValueError(
+            f"The number of cameras ({num_cameras}) is not divisible by the number of cameras per environment"
+            f" ({num_cameras_per_env})."
+        )
+    num_clouds = num_cameras // num_cameras_per_env
+    if depth.dim() == 4:
+        depth = depth.squeeze(-1)
+    depth = depth.float()
+
+    # compute the points of all the pixels: (N, H x W, 3)
+    # note: the pixels are ordered as (u, v) by the unprojection
+    points = math_utils.unproject_depth(depth, intrinsic_matrices.float(), unprojection_grid)
+    points = math_utils.transform_points(points, positions, orientations)
+    # fuse the cameras of each environment: (M, P, 3)
+    points = points.reshape(num_clouds, -1, 3)
+    depth = depth.transpose(1, 2).reshape(num_clouds, -1)
+    valid = torch.all(torch.isfinite(points), dim=-1) & (depth > 0.0)
+    if rgb is not None:
+        rgb = rgb.transpose(1, 2).reshape(num_clouds, depth.shape[1], -1)
+
+    # keep one point per voxel
+    if voxel_size is not None:
+        valid &= _find_voxel_representatives(points, valid, voxel_size)
+
+    # select the valid points
+    # note: the valid points are either sampled randomly or kept in order by sorting on their keys.
+    total_points = points.shape[1]
+    if num_points is None:
+        num_points = total_points
+    if num_points < total_points:
+        keys = torch.rand(valid.shape, device=points.device)
+    else:
+        keys = torch.arange(total_points, device=points.device, dtype=torch.float).expand_as(valid) / total_points
+    keys = torch.where(valid, keys, 2.0)
+    keys, indices = torch.topk(keys, min(num_points, total_points), dim=1, largest=False, sorted=True)
+    valid = keys < 2.0
+    # gather the selected points and zero the padding
+    points = torch.gather(points, 1, indices.unsqueeze(-1).expand(-1, -1, 3))
+    points = torch.where(valid.unsqueeze(-1), points, 0.0)
+    if rgb is not None:
+        rgb = torch.gather(rgb, 1, indices.unsqueeze(-1).expand(-1, -1, rgb.shape[-1]))
+        rgb = torch.where(valid.unsqueeze(-1), rgb, 0)
+    # pad the pointclouds if more points are requested than there are pixels
+    if num_points > total_points:
+        padding = (0, 0, 0, num_points - total_points)
+        points = F.pad(points, padding)
+        valid = F.pad(valid, padding[2:])
+        if rgb is not None:
+            rgb = F.pad(rgb, padding)
+
+    return points, rgb, valid
+
+
+def _find_voxel_representatives(points: torch.Tensor, valid: torch.Tensor, voxel_size: float) -> torch.Tensor:
+    """Finds the first valid point in each occupied voxel of a batch of pointclouds.
+
+    The voxel coordinates are clipped to 21 bits, i.e. about a million voxels in each direction.
+
+    Args:
+        points: The points of the pointclouds. Shape is (M, P, 3).
+        valid: The mask of the valid points. Shape is (M, P).
+        voxel_size: The size of the voxels (in m).
+
+    Returns:
+        The mask of the points that represent their voxel. Shape is (M, P).
+    """
+    # compute the voxel of each point and pack its coordinates into a single key
+    # note: the invalid points get a negative key so that they are never selected.
+    voxels = torch.floor(torch.where(valid.unsqueeze(-1), points, 0.0) / voxel_size).long()
+    voxels = voxels.clamp(-(2**20), 2**20 - 1) + 2**20
+    keys = (voxels[..., 0] << 42) | (voxels[..., 1] << 21) | voxels[..., 2]
+    keys = torch.where(valid, keys, -1)
+    # sort the keys of each pointcloud and find the first point of each voxel
+    # note: the sort is stable so that the first point is also the first in the original order.
+    sorted_keys, order = torch.sort(keys, dim=1, stable=True)
+    is_first = (sorted_keys >= 0) & (sorted_keys != F.pad(sorted_keys[:, :-1], (1, 0), value=-1))
+    # mark the representatives in the original order
+    return torch.zeros_like(valid).scatter_(1, order, is_first)
+
+
 def convert_orientation_convention(
     orientation: torch.Tensor,
     origin: Literal["opengl", "ros", "world"] = "opengl",
@@ -402,6 +623,9 @@ def create_rotation_matrix_from_view(
 def save_images_to_file(images: torch.Tensor, file_path: str):
     """Save images to file.
 
+    The images are tiled into a grid and written on the calling thread. To save the camera outputs at every
+    step without stalling the simulation, use :class:`omni.isaac.lab.sensors.camera.ImageWriter` instead.
+
     Args:
         images: A tensor of shape (N, H, W, C) containing the images.
         file_path: The path to save the images to.
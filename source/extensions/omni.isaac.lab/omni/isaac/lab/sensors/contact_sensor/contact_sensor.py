@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import torch
 from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 import omni.physics.tensors.impl.api as physx
 from pxr import PhysxSchema
@@ -55,6 +55,13 @@ class ContactSensor(SensorBase):
     respectively will not work. Instead, you need to create a separate sensor for each foot and filter
     it against the object.
 
+    If the :attr:`ContactSensorCfg.history_length` is greater than zero, the net contact forces of the last
+    few updates are stored in a circular buffer. Each update only writes the newest forces of an environment
+    over its oldest ones. The buffer is reordered from the most recent to the oldest forces only when the
+    :attr:`ContactSensorData.net_forces_w_history` is read. Reductions over the history that do not depend on
+    the order of the entries can be computed directly on the circular buffer with
+    :meth:`compute_net_forces_history_norm`.
+
     .. _PhysX ContactReporter: https://docs.omniverse.nvidia.com/kit/docs/omni_usd_schema_physics/104.2/class_physx_schema_physx_contact_report_a_p_i.html
     .. _RigidContactView: https://docs.omniverse.nvidia.com/py/isaacsim/source/extensions/omni.isaac.core/docs/index.html#omni.isaac.core.prims.RigidContactView
     """
@@ -74,6 +81,8 @@ class ContactSensor(SensorBase):
         self._data: ContactSensorData = ContactSensorData()
         # initialize self._body_physx_view for running in extension mode
         self._body_physx_view = None
+        # flag for whether the ordered history of net forces needs to be recomputed
+        self._is_history_outdated = False
 
     def __str__(self) -> str:
         """Returns: A string containing information about the instance."""
@@ -97,6 +106,9 @@ class ContactSensor(SensorBase):
     def data(self) -> ContactSensorData:
         # update sensors if needed
         self._update_outdated_buffers()
+        # reorder the history of net forces if needed
+        if self._is_history_outdated:
+            self._update_net_forces_w_history()
         # return the data
         return self._data
 
@@ -141,8 +153,8 @@ class ContactSensor(SensorBase):
             env_ids = slice(None)
         # reset accumulative data buffers
         self._data.net_forces_w[env_ids] = 0.0
-        self._data.net_forces_w_history[env_ids] = 0.0
         if self.cfg.history_length > 0:
+            self._net_forces_w_history_buffer[env_ids] = 0.0
             self._data.net_forces_w_history[env_ids] = 0.0
         # reset force matrix
         if len(self.cfg.filter_prim_paths_expr) != 0:
@@ -237,6 +249,41 @@ class ContactSensor(SensorBase):
         less_than_dt_detached = self.data.current_air_time < (dt + abs_tol)
         return currently_detached * less_than_dt_detached
 
+    def compute_net_forces_history_norm(
+        self, reduction: Literal["max", "mean"] = "max", body_ids: Sequence[int] | slice | None = None
+    ) -> torch.Tensor:
+        """Reduces the norms of the net normal contact forces over the history.
+
+        The reduction does not depend on the order of the history. It is thus computed directly on the circular
+        buffer of the history instead of the :attr:`ContactSensorData.net_forces_w_history`, which avoids
+        reordering the buffer.
+
+        Args:
+            reduction: The reduction over the history. Defaults to "max".
+            body_ids: The indices of the bodies. Defaults to None, in which case all the bodies are used.
+
+        Returns:
+            The reduced norms of the net normal contact forces. Shape is (N, B), where N is the number of
+            sensors and B is the number of selected bodies.
+
+        Raises:
+            ValueError: If the reduction is not supported.
+        """
+        # update sensors if needed
+        self._update_outdated_buffers()
+        # resolve all bodies
+        if body_ids is None:
+            body_ids = slice(None)
+        # compute the norms of the forces over the history
+        net_forces_norm = torch.norm(self._net_forces_w_history_buffer[:, :, body_ids], dim=-1)
+        # reduce over the history
+        if reduction == "max":
+            return torch.max(net_forces_norm, dim=1)[0]
+        elif reduction == "mean":
+            return torch.mean(net_forces_norm, dim=1)
+        else:
+            raise ValueError(f"Invalid reduction: {reduction}. Expected 'max' or 'mean'.")
+
     """
     Implementation.
     """
@@ -289,11 +336,18 @@ class ContactSensor(SensorBase):
         # optional buffers
         # -- history of net forces
         if self.cfg.history_length > 0:
-            self._data.net_forces_w_history = torch.zeros(
+            # circular buffer and the index of the most recent entry of each sensor
+            self._net_forces_w_history_buffer = torch.zeros(
                 self._num_envs, self.cfg.history_length, self._num_bodies, 3, device=self._device
             )
+            self._history_index = torch.zeros(self._num_envs, dtype=torch.long, device=self._device)
+            self._history_offsets = torch.arange(self.cfg.history_length, device=self._device)
+            self._ALL_INDICES = torch.arange(self._num_envs, dtype=torch.long, device=self._device)
+            # ordered history (most recent first)
+            self._data.net_forces_w_history = torch.zeros_like(self._net_forces_w_history_buffer)
         else:
             self._data.net_forces_w_history = self._data.net_forces_w.unsqueeze(1)
+            self._net_forces_w_history_buffer = self._data.net_forces_w_history
         # -- pose of sensor origins
         if self.cfg.track_pose:
             self._data.pos_w = torch.zeros(self._num_envs, self._num_bodies, 3, device=self._device)
@@ -316,6 +370,9 @@ class ContactSensor(SensorBase):
         # default to all sensors
         if len(env_ids) == self._num_envs:
             env_ids = slice(None)
+            history_env_ids = self._ALL_INDICES if self.cfg.history_length > 0 else None
+        else:
+            history_env_ids = env_ids
 
         # obtain the contact forces
         # TODO: We are handling the indexing ourself because of the shape; (N, B) vs expected (N * B).
@@ -323,9 +380,12 @@ class ContactSensor(SensorBase):
         net_forces_w = self.contact_physx_view.get_net_contact_forces(dt=self._sim_physics_dt)
         self._data.net_forces_w[env_ids, :, :] = net_forces_w.view(-1, self._num_bodies, 3)[env_ids]
         # update contact force history
+        # note: the newest forces overwrite the oldest ones in the circular buffer
         if self.cfg.history_length > 0:
-            self._data.net_forces_w_history[env_ids, 1:] = self._data.net_forces_w_history[env_ids, :-1].clone()
-            self._data.net_forces_w_history[env_ids, 0] = self._data.net_forces_w[env_ids]
+            history_index = (self._history_index[history_env_ids] + 1) % self.cfg.history_length
+            self._net_forces_w_history_buffer[history_env_ids, history_index] = self._data.net_forces_w[env_ids]
+            self._history_index[history_env_ids] = history_index
+            self._is_history_outdated = True
 
         # obtain the contact force matrix
         if len(self.cfg.filter_prim_paths_expr) != 0:
@@ -372,6 +432,15 @@ class ContactSensor(SensorBase):
                 is_contact, self._data.current_contact_time[env_ids] + elapsed_time.unsqueeze(-1), 0.0
             )
 
+    def _update_net_forces_w_history(self):
+        """Reorders the circular buffer of the net forces history from the most recent to the oldest entry."""
+        # indices of the entries in the circular buffer: (N, T)
+        indices = (self._history_index.unsqueeze(1) - self._history_offsets) % self.cfg.history_length
+        indices = indices[:, :, None, None].expand_as(self._net_forces_w_history_buffer)
+        # gather into the existing tensor so that references to it stay valid
+        torch.gather(self._net_forces_w_history_buffer, 1, indices, out=self._data.net_forces_w_history)
+        self._is_history_outdated = False
+
     def _set_debug_vis_impl(self, debug_vis: bool):
         # set visibility of markers
         # note: parent only deals with callbacks. not their visibility
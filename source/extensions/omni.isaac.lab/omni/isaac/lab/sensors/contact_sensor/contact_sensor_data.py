@@ -49,6 +49,8 @@ class ContactSensorData:
     and B is the number of bodies in each sensor.
 
     In the history dimension, the first index is the most recent and the last index is the oldest.
+    The sensor stores the history in a circular buffer and only reorders it into this tensor when it is read.
+    Reductions over the history are cheaper with :meth:`ContactSensor.compute_net_forces_history_norm`.
 
     Note:
         This quantity is the sum of the normal contact forces acting on the sensor bodies. It must not be confused
@@ -11,16 +11,13 @@ from typing import TYPE_CHECKING
 
 import carb
 import omni.physics.tensors.impl.api as physx
+import warp as wp
 from pxr import UsdPhysics
 
 import omni.isaac.lab.sim as sim_utils
 from omni.isaac.lab.markers import VisualizationMarkers
-from omni.isaac.lab.utils.math import (
-    combine_frame_transforms,
-    convert_quat,
-    is_identity_pose,
-    subtract_frame_transforms,
-)
+from omni.isaac.lab.utils.math import convert_quat, is_identity_pose
+from omni.isaac.lab.utils.warp.kernels import compute_frame_transforms
 
 from ..sensor_base import SensorBase
 from .frame_transformer_data import FrameTransformerData
@@ -123,18 +120,15 @@ class FrameTransformer(SensorBase):
         # resolve source frame offset
         source_frame_offset_pos = torch.tensor(self.cfg.source_frame_offset.pos, device=self.device)
         source_frame_offset_quat = torch.tensor(self.cfg.source_frame_offset.rot, device=self.device)
-        # Only need to perform offsetting of source frame if the position offsets is non-zero and rotation offset is
-        # not the identity quaternion for efficiency in _update_buffer_impl
-        self._apply_source_frame_offset = True
-        # Handle source frame offsets
         if is_identity_pose(source_frame_offset_pos, source_frame_offset_quat):
             carb.log_verbose(f"No offset application needed for source frame as it is identity: {self.cfg.prim_path}")
-            self._apply_source_frame_offset = False
         else:
             carb.log_verbose(f"Applying offset to source frame as it is not identity: {self.cfg.prim_path}")
-            # Store offsets as tensors (duplicating each env's offsets for ease of multiplication later)
-            self._source_frame_offset_pos = source_frame_offset_pos.unsqueeze(0).repeat(self._num_envs, 1)
-            self._source_frame_offset_quat = source_frame_offset_quat.unsqueeze(0).repeat(self._num_envs, 1)
+        # Store the offset once as a warp transform (position and quaternion in x, y, z, w)
+        self._source_frame_offset = wp.transformf(
+            wp.vec3f(*source_frame_offset_pos.tolist()),
+            wp.quatf(*convert_quat(source_frame_offset_quat, to="xyzw").tolist()),
+        )
 
         # Keep track of mapping from the rigid body name to the desired frame, as there may be multiple frames
         # based upon the same body name and we don't want to create unnecessary views
@@ -144,10 +138,6 @@ class FrameTransformer(SensorBase):
         # The frames whose offsets are not identity
         non_identity_offset_frames: list[str] = []
 
-        # Only need to perform offsetting of target frame if any of the position offsets are non-zero or any of the
-        # rotation offsets are not the identity quaternion for efficiency in _update_buffer_impl
-        self._apply_target_frame_offset = False
-
         # Collect all target frames, their associated body prim paths and their offsets so that we can extract
         # the prim, check that it has the appropriate rigid body API in a single loop.
         # First element is None because user can't specify source frame name
@@ -187,14 +177,13 @@ class FrameTransformer(SensorBase):
                 if offset is not None:
                     offset_pos = torch.tensor(offset.pos, device=self.device)
                     offset_quat = torch.tensor(offset.rot, device=self.device)
-                    # Check if we need to apply offsets (optimized code path in _update_buffer_impl)
+                    # Check if the offsets are identity
                     if not is_identity_pose(offset_pos, offset_quat):
                         non_identity_offset_frames.append(frame_name)
-                        self._apply_target_frame_offset = True
 
                     target_offsets[frame_name] = {"pos": offset_pos, "quat": offset_quat}
 
-        if not self._apply_target_frame_offset:
+        if len(non_identity_offset_frames) == 0:
             carb.log_info(
                 f"No offsets application needed from '{self.cfg.prim_path}' to target frames as all"
                 f" are identity: {frames[1:]}"
@@ -233,111 +222,94 @@ class FrameTransformer(SensorBase):
         self._target_frame_body_names = first_env_body_names[:]
         self._target_frame_body_names.remove(self._source_frame_body_name)
 
-        # Determine indices into all tracked body frames for both source and target frames
-        all_ids = torch.arange(self._num_envs * len(tracked_body_names))
-        self._source_frame_body_ids = torch.arange(self._num_envs) * len(tracked_body_names) + source_frame_index
-        self._target_frame_body_ids = all_ids[~torch.isin(all_ids, self._source_frame_body_ids)]
-
         # The name of each of the target frame(s) - either user specified or defaulted to the body name
         self._target_frame_names: list[str] = []
+        # The index of the body of each target frame within the bodies tracked per environment. If a body is
+        # needed for multiple frames (for instance "LF_SHANK" with different offsets), its index is duplicated
+        target_frame_body_indices = []
         # The position and rotation components of target frame offsets
         target_frame_offset_pos = []
         target_frame_offset_quat = []
-        # Stores the indices of bodies that need to be duplicated. For instance, if body "LF_SHANK" is needed
-        # for 2 frames, this list enables us to duplicate the body to both frames when doing the calculations
-        # when updating sensor in _update_buffers_impl
-        duplicate_frame_indices = []
 
         # Go through each body name and determine the number of duplicates we need for that frame
         # and extract the offsets. This is all done to handles the case where multiple frames
         # reference the same body, but have different names and/or offsets
-        for i, body_name in enumerate(self._target_frame_body_names):
+        for body_name in self._target_frame_body_names:
             for frame in body_names_to_frames[body_name]:
                 target_frame_offset_pos.append(target_offsets[frame]["pos"])
                 target_frame_offset_quat.append(target_offsets[frame]["quat"])
                 self._target_frame_names.append(frame)
-                duplicate_frame_indices.append(i)
-
-        # To handle multiple environments, need to expand so [0, 1, 1, 2] with 2 environments becomes
-        # [0, 1, 1, 2, 3, 4, 4, 5]. Again, this is a optimization to make _update_buffer_impl more efficient
-        duplicate_frame_indices = torch.tensor(duplicate_frame_indices, device=self.device)
-        num_target_body_frames = len(tracked_body_names) - 1
-        self._duplicate_frame_indices = torch.cat(
-            [duplicate_frame_indices + num_target_body_frames * env_num for env_num in range(self._num_envs)]
+                target_frame_body_indices.append(first_env_body_names.index(body_name))
+        num_target_frames = len(self._target_frame_names)
+
+        # Store the indices of the bodies and the offsets once per frame, since they are the same for all
+        # environments. The offsets are stored as warp transforms, i.e. position and quaternion in (x, y, z, w)
+        self._source_frame_body_index = source_frame_index
+        self._num_tracked_bodies = len(tracked_body_names)
+        self._target_frame_body_indices = wp.array(target_frame_body_indices, dtype=wp.int32, device=self.device)
+        target_frame_offsets = torch.cat(
+            [
+                torch.stack(target_frame_offset_pos),
+                convert_quat(torch.stack(target_frame_offset_quat), to="xyzw"),
+            ],
+            dim=-1,
         )
-
-        # Stack up all the frame offsets for shape (num_envs, num_frames, 3) and (num_envs, num_frames, 4)
-        self._target_frame_offset_pos = torch.stack(target_frame_offset_pos).repeat(self._num_envs, 1)
-        self._target_frame_offset_quat = torch.stack(target_frame_offset_quat).repeat(self._num_envs, 1)
+        self._target_frame_offsets = wp.from_torch(target_frame_offsets.contiguous(), dtype=wp.transformf)
+        # Indices of all the environments, used when all of them are updated
+        self._ALL_ENV_INDICES = torch.arange(self._num_envs, dtype=torch.int32, device=self.device)
 
         # fill the data buffer
         self._data.target_frame_names = self._target_frame_names
         self._data.source_pos_w = torch.zeros(self._num_envs, 3, device=self._device)
         self._data.source_quat_w = torch.zeros(self._num_envs, 4, device=self._device)
-        self._data.target_pos_w = torch.zeros(self._num_envs, len(duplicate_frame_indices), 3, device=self._device)
-        self._data.target_quat_w = torch.zeros(self._num_envs, len(duplicate_frame_indices), 4, device=self._device)
+        self._data.target_pos_w = torch.zeros(self._num_envs, num_target_frames, 3, device=self._device)
+        self._data.target_quat_w = torch.zeros(self._num_envs, num_target_frames, 4, device=self._device)
         self._data.target_pos_source = torch.zeros_like(self._data.target_pos_w)
         self._data.target_quat_source = torch.zeros_like(self._data.target_quat_w)
+        # create warp views of the data buffers so that the kernel writes into them directly
+        self._data_wp = {
+            "source_pos_w": wp.from_torch(self._data.source_pos_w, dtype=wp.vec3f),
+            "source_quat_w": wp.from_torch(self._data.source_quat_w, dtype=wp.vec4f),
+            "target_pos_w": wp.from_torch(self._data.target_pos_w, dtype=wp.vec3f),
+            "target_quat_w": wp.from_torch(self._data.target_quat_w, dtype=wp.vec4f),
+            "target_pos_source": wp.from_torch(self._data.target_pos_source, dtype=wp.vec3f),
+            "target_quat_source": wp.from_torch(self._data.target_quat_source, dtype=wp.vec4f),
+        }
 
     def _update_buffers_impl(self, env_ids: Sequence[int]):
         """Fills the buffers of the sensor data."""
         # default to all sensors
         if len(env_ids) == self._num_envs:
-            env_ids = ...
+            env_ids = self._ALL_ENV_INDICES
+        elif not isinstance(env_ids, torch.Tensor) or env_ids.dtype != torch.int32:
+            env_ids = torch.as_tensor(env_ids, dtype=torch.int32, device=self._device)
 
         # Extract transforms from view - shape is:
         # (the total number of source and target body frames being tracked * self._num_envs, 7)
-        transforms = self._frame_physx_view.get_transforms()
-        # Convert quaternions as PhysX uses xyzw form
-        transforms[:, 3:] = convert_quat(transforms[:, 3:], to="wxyz")
-
-        # Process source frame transform
-        source_frames = transforms[self._source_frame_body_ids]
-        # Only apply offset if the offsets will result in a coordinate frame transform
-        if self._apply_source_frame_offset:
-            source_pos_w, source_quat_w = combine_frame_transforms(
-                source_frames[:, :3],
-                source_frames[:, 3:],
-                self._source_frame_offset_pos,
-                self._source_frame_offset_quat,
-            )
-        else:
-            source_pos_w = source_frames[:, :3]
-            source_quat_w = source_frames[:, 3:]
-
-        # Process target frame transforms
-        target_frames = transforms[self._target_frame_body_ids]
-        duplicated_target_frame_pos_w = target_frames[self._duplicate_frame_indices, :3]
-        duplicated_target_frame_quat_w = target_frames[self._duplicate_frame_indices, 3:]
-        # Only apply offset if the offsets will result in a coordinate frame transform
-        if self._apply_target_frame_offset:
-            target_pos_w, target_quat_w = combine_frame_transforms(
-                duplicated_target_frame_pos_w,
-                duplicated_target_frame_quat_w,
-                self._target_frame_offset_pos,
-                self._target_frame_offset_quat,
-            )
-        else:
-            target_pos_w = duplicated_target_frame_pos_w
-            target_quat_w = duplicated_target_frame_quat_w
-
-        # Compute the transform of the target frame with respect to the source frame
-        total_num_frames = len(self._target_frame_names)
-        target_pos_source, target_quat_source = subtract_frame_transforms(
-            source_pos_w.unsqueeze(1).expand(-1, total_num_frames, -1).reshape(-1, 3),
-            source_quat_w.unsqueeze(1).expand(-1, total_num_frames, -1).reshape(-1, 4),
-            target_pos_w,
-            target_quat_w,
-        )
+        # note: PhysX stores the quaternions as (x, y, z, w), which matches the layout of warp transforms
+        transforms = self._frame_physx_view.get_transforms().view(self._num_envs, self._num_tracked_bodies, 7)
 
-        # Update buffers
+        # Compute the source and target frame transforms of the outdated environments in a single kernel
         # note: The frame names / ordering don't change so no need to update them after initialization
-        self._data.source_pos_w[:] = source_pos_w.view(-1, 3)
-        self._data.source_quat_w[:] = source_quat_w.view(-1, 4)
-        self._data.target_pos_w[:] = target_pos_w.view(-1, total_num_frames, 3)
-        self._data.target_quat_w[:] = target_quat_w.view(-1, total_num_frames, 4)
-        self._data.target_pos_source[:] = target_pos_source.view(-1, total_num_frames, 3)
-        self._data.target_quat_source[:] = target_quat_source.view(-1, total_num_frames, 4)
+        wp.launch(
+            kernel=compute_frame_transforms,
+            dim=(len(env_ids), len(self._target_frame_names)),
+            inputs=[
+                wp.from_torch(transforms.contiguous(), dtype=wp.transformf),
+                wp.from_torch(env_ids.contiguous()),
+                self._source_frame_body_index,
+                self._source_frame_offset,
+                self._target_frame_body_indices,
+                self._target_frame_offsets,
+                self._data_wp["source_pos_w"],
+                self._data_wp["source_quat_w"],
+                self._data_wp["target_pos_w"],
+                self._data_wp["target_quat_w"],
+                self._data_wp["target_pos_source"],
+                self._data_wp["target_quat_source"],
+            ],
+            device=self._device,
+        )
 
     def _set_debug_vis_impl(self, debug_vis: bool):
         # set visibility of markers
@@ -15,13 +15,14 @@ import carb
 import omni.physics.tensors.impl.api as physx
 import warp as wp
 from omni.isaac.core.prims import XFormPrimView
-from pxr import UsdGeom, UsdPhysics
+from pxr import Usd, UsdGeom, UsdPhysics
 
 import omni.isaac.lab.sim as sim_utils
 from omni.isaac.lab.markers import VisualizationMarkers
+from omni.isaac.lab.terrains import TerrainHeightMap, TerrainImporter
 from omni.isaac.lab.terrains.trimesh.utils import make_plane
-from omni.isaac.lab.utils.math import convert_quat, quat_apply, quat_apply_yaw
-from omni.isaac.lab.utils.warp import convert_to_warp_mesh, raycast_mesh
+from omni.isaac.lab.utils.math import convert_quat, quat_apply, yaw_quat
+from omni.isaac.lab.utils.warp import convert_to_warp_mesh, raycast_height_field, raycast_meshes
 
 from ..sensor_base import SensorBase
 from .ray_caster_data import RayCasterData
@@ -38,12 +39,18 @@ class RayCaster(SensorBase):
     a set of meshes with a given ray pattern.
 
     The meshes are parsed from the list of primitive paths provided in the configuration. These are then
-    converted to warp meshes and stored in the `warp_meshes` list. The ray-caster then ray-casts against
-    these warp meshes using the ray pattern provided in the configuration.
+    converted to warp meshes and stored in the :attr:`meshes` dictionary. A path either refers to a single mesh
+    that is shared by all the sensors (such as the terrain) or matches one mesh per sensor (such as an obstacle in
+    each environment). The ray-caster casts the rays of all the sensors against their meshes in a single kernel
+    launch and keeps the closest hit.
+
+    For height scanners (rays pointing straight down and tracking only the yaw of the sensor), the heights of a
+    terrain can be looked up in its height map instead of ray-casting against its mesh. This is enabled through
+    :attr:`RayCasterCfg.use_height_map`.
 
     .. note::
-        Currently, only static meshes are supported. Extending the warp mesh to support dynamic meshes
-        is a work in progress.
+        Currently, only static meshes are supported. The meshes matched per sensor are read in the world frame
+        at initialization. Extending the warp mesh to support dynamic meshes is a work in progress.
     """
 
     cfg: RayCasterCfg
@@ -156,54 +163,127 @@ class RayCaster(SensorBase):
 
     def _initialize_warp_meshes(self):
         # check number of mesh prims provided
-        if len(self.cfg.mesh_prim_paths) != 1:
-            raise NotImplementedError(
-                f"RayCaster currently only supports one mesh prim. Received: {len(self.cfg.mesh_prim_paths)}"
-            )
-
+        if len(self.cfg.mesh_prim_paths) == 0:
+            raise RuntimeError("No meshes found for ray-casting! Please provide at least one mesh prim path.")
+        # ids of the warp meshes to ray-cast against for each sensor
+        mesh_ids = list()
+        # tiled terrains to follow: (index of the mesh, mesh prim path, terrain importer, tiles version)
+        self._tiled_terrains = list()
         # read prims to ray-cast
         for mesh_prim_path in self.cfg.mesh_prim_paths:
-            # check if mesh already casted into warp mesh
-            if mesh_prim_path in RayCaster.meshes:
-                continue
+            # resolve the prims matching the path
+            prim_paths = sim_utils.find_matching_prim_paths(mesh_prim_path)
+            # a tiled terrain: the warp mesh of its resident tiles changes over time
+            terrain = TerrainImporter.tiled_terrains.get(mesh_prim_path)
+            if terrain is not None:
+                RayCaster.meshes[mesh_prim_path] = terrain.warp_meshes["terrain"]
+                self._tiled_terrains.append([len(mesh_ids), mesh_prim_path, terrain, terrain.tiles_version])
+                mesh_ids.append([RayCaster.meshes[mesh_prim_path].id] * self._view.count)
+            # a single mesh shared by all sensors
+            # note: the path itself is used as key to keep the existing behavior for shared meshes
+            elif len(prim_paths) <= 1:
+                if mesh_prim_path not in RayCaster.meshes:
+                    RayCaster.meshes[mesh_prim_path] = self._create_warp_mesh(mesh_prim_path, in_world_frame=False)
+                mesh_ids.append([RayCaster.meshes[mesh_prim_path].id] * self._view.count)
+            # one mesh per sensor
+            elif len(prim_paths) == self._view.count:
+                for prim_path in prim_paths:
+                    if prim_path not in RayCaster.meshes:
+                        RayCaster.meshes[prim_path] = self._create_warp_mesh(prim_path, in_world_frame=True)
+                mesh_ids.append([RayCaster.meshes[prim_path].id for prim_path in prim_paths])
+            else:
+                raise RuntimeError(
+                    f"The mesh prim path '{mesh_prim_path}' matches {len(prim_paths)} prims. Expected either one prim"
+                    f" shared by all the sensors or one prim per sensor ({self._view.count})."
+                )
+
+        # store the mesh ids as a tensor of shape (num_sensors, num_meshes)
+        # note: warp uses unsigned 64-bit integers for the ids, which are reinterpreted by the kernel
+        self._mesh_ids = torch.tensor(mesh_ids, dtype=torch.int64, device=self._device).T.contiguous()
+
+    def _update_tiled_terrain_meshes(self):
+        """Updates the warp meshes of the tiled terrains whose resident tiles changed."""
+        for tiled_terrain in self._tiled_terrains:
+            index, mesh_prim_path, terrain, tiles_version = tiled_terrain
+            if terrain.tiles_version != tiles_version:
+                RayCaster.meshes[mesh_prim_path] = terrain.warp_meshes["terrain"]
+                self._mesh_ids[:, index] = RayCaster.meshes[mesh_prim_path].id
+                tiled_terrain[3] = terrain.tiles_version
 
-            # check if the prim is a plane - handle PhysX plane as a special case
-            # if a plane exists then we need to create an infinite mesh that is a plane
+    def _create_warp_mesh(self, mesh_prim_path: str, in_world_frame: bool) -> wp.Mesh:
+        """Reads the mesh at the prim path and converts it into a warp mesh.
+
+        Args:
+            mesh_prim_path: The prim path of the mesh or of one of its ancestors.
+            in_world_frame: Whether to transform the vertices of the mesh into the world frame.
+
+        Returns:
+            The warp mesh.
+
+        Raises:
+            RuntimeError: If no mesh is found at the prim path.
+        """
+        # check if the prim is a plane - handle PhysX plane as a special case
+        # if a plane exists then we need to create an infinite mesh that is a plane
+        mesh_prim = sim_utils.get_first_matching_child_prim(mesh_prim_path, lambda prim: prim.GetTypeName() == "Plane")
+        # if we did not find a plane then we need to read the mesh
+        if mesh_prim is None:
+            # obtain the mesh prim
             mesh_prim = sim_utils.get_first_matching_child_prim(
-                mesh_prim_path, lambda prim: prim.GetTypeName() == "Plane"
+                mesh_prim_path, lambda prim: prim.GetTypeName() == "Mesh"
             )
-            # if we did not find a plane then we need to read the mesh
-            if mesh_prim is None:
-                # obtain the mesh prim
-                mesh_prim = sim_utils.get_first_matching_child_prim(
-                    mesh_prim_path, lambda prim: prim.GetTypeName() == "Mesh"
-                )
-                # check if valid
-                if mesh_prim is None or not mesh_prim.IsValid():
-                    raise RuntimeError(f"Invalid mesh prim path: {mesh_prim_path}")
-                # cast into UsdGeomMesh
-                mesh_prim = UsdGeom.Mesh(mesh_prim)
-                # read the vertices and faces
-                points = np.asarray(mesh_prim.GetPointsAttr().Get())
-                indices = np.asarray(mesh_prim.GetFaceVertexIndicesAttr().Get())
-                wp_mesh = convert_to_warp_mesh(points, indices, device=self.device)
-                # print info
-                carb.log_info(
-                    f"Read mesh prim: {mesh_prim.GetPath()} with {len(points)} vertices and {len(indices)} faces."
-                )
-            else:
-                mesh = make_plane(size=(2e6, 2e6), height=0.0, center_zero=True)
-                wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
-                # print info
-                carb.log_info(f"Created infinite plane mesh prim: {mesh_prim.GetPath()}.")
-            # add the warp mesh to the list
-            RayCaster.meshes[mesh_prim_path] = wp_mesh
-
-        # throw an error if no meshes are found
-        if all([mesh_prim_path not in RayCaster.meshes for mesh_prim_path in self.cfg.mesh_prim_paths]):
-            raise RuntimeError(
-                f"No meshes found for ray-casting! Please check the mesh prim paths: {self.cfg.mesh_prim_paths}"
+            # check if valid
+            if mesh_prim is None or not mesh_prim.IsValid():
+                raise RuntimeError(f"Invalid mesh prim path: {mesh_prim_path}")
+            # cast into UsdGeomMesh
+            mesh_prim = UsdGeom.Mesh(mesh_prim)
+            # read the vertices and faces
+            points = np.asarray(mesh_prim.GetPointsAttr().Get())
+            indices = np.asarray(mesh_prim.GetFaceVertexIndicesAttr().Get())
+            # print info
+            carb.log_info(
+                f"Read mesh prim: {mesh_prim.GetPath()} with {len(points)} vertices and {len(indices)} faces."
             )
+        else:
+            mesh = make_plane(size=(2e6, 2e6), height=0.0, center_zero=True)
+            points, indices = mesh.vertices, mesh.faces
+            # print info
+            carb.log_info(f"Created infinite plane mesh prim: {mesh_prim.GetPath()}.")
+        # transform the vertices into the world frame
+        if in_world_frame:
+            # note: USD uses row vectors, so the translation is in the last row of the matrix
+            transform = np.array(UsdGeom.Xformable(mesh_prim).ComputeLocalToWorldTransform(Usd.TimeCode.Default()))
+            points = points @ transform[:3, :3] + transform[3, :3]
+        return convert_to_warp_mesh(points, indices, device=self.device)
+
+    def _find_height_map(self) -> TerrainHeightMap | None:
+        """Finds the height map of the terrain to look up the heights of the rays in.
+
+        Returns:
+            The height map of the terrain, or None if the rays cannot be replaced by height look-ups.
+        """
+        # check that all the rays point straight down in the world frame
+        if not self.cfg.attach_yaw_only:
+            reason = "the rays do not only track the yaw orientation of the sensor"
+        elif not torch.allclose(
+            self.ray_directions, torch.tensor([0.0, 0.0, -1.0], device=self._device).expand_as(self.ray_directions)
+        ):
+            reason = "not all the rays point straight down"
+        elif len(self.cfg.mesh_prim_paths) != 1:
+            reason = "more than one mesh prim path is provided"
+        else:
+            # the mesh path refers to the terrain prim or to one of its children
+            mesh_prim_path = self.cfg.mesh_prim_paths[0]
+            for terrain_prim_path, height_map in TerrainImporter.height_maps.items():
+                if mesh_prim_path == terrain_prim_path or mesh_prim_path.startswith(terrain_prim_path + "/"):
+                    return height_map
+            reason = f"no height map is available for the mesh prim path '{mesh_prim_path}'"
+        # fall back to ray-casting against the meshes
+        carb.log_warn(
+            f"Unable to use a height map for the ray-caster at '{self.cfg.prim_path}' since {reason}. Ray-casting"
+            " against the meshes instead."
+        )
+        return None
 
     def _initialize_rays_impl(self):
         # compute ray stars and directions
@@ -214,15 +294,20 @@ class RayCaster(SensorBase):
         offset_quat = torch.tensor(list(self.cfg.offset.rot), device=self._device)
         self.ray_directions = quat_apply(offset_quat.repeat(len(self.ray_directions), 1), self.ray_directions)
         self.ray_starts += offset_pos
-        # repeat the rays for each sensor
-        self.ray_starts = self.ray_starts.repeat(self._view.count, 1, 1)
-        self.ray_directions = self.ray_directions.repeat(self._view.count, 1, 1)
+        # note: the rays are shared by all the sensors and are transformed into the world frame
+        #   of each sensor during the ray-casting. Thus, they are not repeated for each sensor.
+        # resolve the height map to look up the heights in
+        self._height_map = self._find_height_map() if self.cfg.use_height_map else None
         # prepare drift
         self.drift = torch.zeros(self._view.count, 3, device=self.device)
         # fill the data buffer
         self._data.pos_w = torch.zeros(self._view.count, 3, device=self._device)
         self._data.quat_w = torch.zeros(self._view.count, 4, device=self._device)
         self._data.ray_hits_w = torch.zeros(self._view.count, self.num_rays, 3, device=self._device)
+        if self.cfg.track_mesh_ids:
+            self._data.ray_mesh_ids = torch.full(
+                (self._view.count, self.num_rays), -1, dtype=torch.int32, device=self._device
+            )
 
     def _update_buffers_impl(self, env_ids: Sequence[int]):
         """Fills the buffers of the sensor data."""
@@ -246,25 +331,52 @@ class RayCaster(SensorBase):
         self._data.pos_w[env_ids] = pos_w
         self._data.quat_w[env_ids] = quat_w
 
+        # follow the resident tiles of the tiled terrains
+        if len(self._tiled_terrains) > 0:
+            self._update_tiled_terrain_meshes()
+
         # ray cast based on the sensor poses
+        # note: the rays are transformed into the world frame inside the ray-casting kernel
         if self.cfg.attach_yaw_only:
             # only yaw orientation is considered and directions are not rotated
-            ray_starts_w = quat_apply_yaw(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
-            ray_starts_w += pos_w.unsqueeze(1)
-            ray_directions_w = self.ray_directions[env_ids]
+            frame_quat = yaw_quat(quat_w)
+            rotate_directions = False
         else:
             # full orientation is considered
-            ray_starts_w = quat_apply(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
-            ray_starts_w += pos_w.unsqueeze(1)
-            ray_directions_w = quat_apply(quat_w.repeat(1, self.num_rays), self.ray_directions[env_ids])
-        # ray cast and store the hits
-        # TODO: Make this work for multiple meshes?
-        self._data.ray_hits_w[env_ids] = raycast_mesh(
-            ray_starts_w,
-            ray_directions_w,
-            max_dist=self.cfg.max_distance,
-            mesh=RayCaster.meshes[self.cfg.mesh_prim_paths[0]],
-        )[0]
+            frame_quat = quat_w
+            rotate_directions = True
+        # look up the heights in the height map
+        if self._height_map is not None:
+            ray_hits_w, _ = raycast_height_field(
+                self.ray_starts,
+                self._height_map.heights,
+                self._height_map.valid,
+                self._height_map.origin,
+                self._height_map.resolution,
+                mesh=RayCaster.meshes[self.cfg.mesh_prim_paths[0]],
+                max_dist=self.cfg.max_distance,
+                frame_pos=pos_w,
+                frame_quat=frame_quat,
+            )
+            self._data.ray_hits_w[env_ids] = ray_hits_w
+            if self.cfg.track_mesh_ids:
+                # note: there is a single mesh to hit
+                self._data.ray_mesh_ids[env_ids] = torch.where(torch.isinf(ray_hits_w[..., 2]), -1, 0).int()
+        else:
+            # ray cast against all the meshes and store the hits
+            ray_hits_w, _, _, _, ray_mesh_ids = raycast_meshes(
+                self.ray_starts,
+                self.ray_directions,
+                mesh_ids=self._mesh_ids[env_ids],
+                max_dist=self.cfg.max_distance,
+                frame_pos=pos_w,
+                frame_quat=frame_quat,
+                rotate_directions=rotate_directions,
+                return_mesh_id=self.cfg.track_mesh_ids,
+            )
+            self._data.ray_hits_w[env_ids] = ray_hits_w
+            if self.cfg.track_mesh_ids:
+                self._data.ray_mesh_ids[env_ids] = ray_mesh_ids
 
     def _set_debug_vis_impl(self, debug_vis: bool):
         # set visibility of markers
@@ -16,7 +16,7 @@ from omni.isaac.core.prims import XFormPrimView
 import omni.isaac.lab.utils.math as math_utils
 from omni.isaac.lab.sensors.camera import CameraData
 from omni.isaac.lab.sensors.camera.utils import convert_orientation_convention, create_rotation_matrix_from_view
-from omni.isaac.lab.utils.warp import raycast_mesh
+from omni.isaac.lab.utils.warp import raycast_meshes
 
 from .ray_caster import RayCaster
 
@@ -80,6 +80,8 @@ class RayCasterCamera(RayCaster):
         super().__init__(cfg)
         # create empty variables for storing output data
         self._data = CameraData()
+        # cached unprojection grid of the cameras (computed when first accessed)
+        self._unprojection_grid: torch.Tensor | None = None
 
     def __str__(self) -> str:
         """Returns: A string containing information about the instance."""
@@ -115,6 +117,20 @@ class RayCasterCamera(RayCaster):
         """Frame number when the measurement took place."""
         return self._frame
 
+    @property
+    def unprojection_grid(self) -> torch.Tensor:
+        """The points at unit depth that the pixels of the cameras unproject to. Shape is (N, H x W, 3).
+
+        The grid is computed from the intrinsic matrices when it is first accessed and cached until the intrinsic
+        matrices change. It can be passed to :meth:`omni.isaac.lab.utils.math.unproject_depth` and the pointcloud
+        utilities to unproject the depth images without recomputing it.
+        """
+        if self._unprojection_grid is None:
+            self._unprojection_grid = math_utils.compute_unprojection_grid(
+                self._data.intrinsic_matrices, *self.image_shape
+            )
+        return self._unprojection_grid
+
     """
     Operations.
     """
@@ -139,6 +155,8 @@ class RayCasterCamera(RayCaster):
         self.ray_starts[env_ids], self.ray_directions[env_ids] = self.cfg.pattern_cfg.func(
             self.cfg.pattern_cfg, self._data.intrinsic_matrices[env_ids], self._device
         )
+        # invalidate the unprojection grid
+        self._unprojection_grid = None
 
     def reset(self, env_ids: Sequence[int] | None = None):
         # reset the timestamps
@@ -259,24 +277,22 @@ class RayCasterCamera(RayCaster):
         # update the data
         self._data.pos_w[env_ids] = pos_w
         self._data.quat_w_world[env_ids] = quat_w
-
-        # note: full orientation is considered
-        ray_starts_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
-        ray_starts_w += pos_w.unsqueeze(1)
-        ray_directions_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self.ray_directions[env_ids])
+        # follow the resident tiles of the tiled terrains
+        if len(self._tiled_terrains) > 0:
+            self._update_tiled_terrain_meshes()
 
         # ray cast and store the hits
         # note: we set max distance to 1e6 during the ray-casting. THis is because we clip the distance
         # to the image plane and distance to the camera to the maximum distance afterwards in-order to
         # match the USD camera behavior.
-
-        # TODO: Make ray-casting work for multiple meshes?
-        # necessary for regular dictionaries.
-        self.ray_hits_w, ray_depth, ray_normal, _ = raycast_mesh(
-            ray_starts_w,
-            ray_directions_w,
-            mesh=RayCasterCamera.meshes[self.cfg.mesh_prim_paths[0]],
+        # note: full orientation is considered. The rays are transformed into the world frame inside the kernel.
+        self.ray_hits_w, ray_depth, ray_normal, _, _ = raycast_meshes(
+            self.ray_starts[env_ids],
+            self.ray_directions[env_ids],
+            mesh_ids=self._mesh_ids[env_ids],
             max_dist=1e6,
+            frame_pos=pos_w,
+            frame_quat=quat_w,
             return_distance=any(
                 [name in self.cfg.data_types for name in ["distance_to_image_plane", "distance_to_camera"]]
             ),
@@ -285,12 +301,8 @@ class RayCasterCamera(RayCaster):
         # update output buffers
         if "distance_to_image_plane" in self.cfg.data_types:
             # note: data is in camera frame so we only take the first component (z-axis of camera frame)
-            distance_to_image_plane = (
-                math_utils.quat_apply(
-                    math_utils.quat_inv(quat_w).repeat(1, self.num_rays),
-                    (ray_depth[:, :, None] * ray_directions_w),
-                )
-            )[:, :, 0]
+            #   the ray directions are already expressed in the camera frame
+            distance_to_image_plane = ray_depth * self.ray_directions[env_ids, :, 0]
             # apply the maximum distance after the transformation
             distance_to_image_plane = torch.clip(distance_to_image_plane, max=self.cfg.max_distance)
             self._data.output["distance_to_image_plane"][env_ids] = distance_to_image_plane.view(-1, *self.image_shape)
@@ -374,6 +386,8 @@ class RayCasterCamera(RayCaster):
 
         # save focal length
         self._focal_length = pattern_cfg.focal_length
+        # invalidate the unprojection grid
+        self._unprojection_grid = None
 
     def _compute_view_world_poses(self, env_ids: Sequence[int]) -> tuple[torch.Tensor, torch.Tensor]:
         """Obtains the pose of the view the camera is attached to in the world frame.
@@ -35,9 +35,13 @@ class RayCasterCfg(SensorBaseCfg):
     mesh_prim_paths: list[str] = MISSING
     """The list of mesh primitive paths to ray cast against.
 
+    Each path either refers to a single mesh that is shared by all the sensors (for instance, the terrain) or
+    is a regex expression matching one mesh per sensor (for instance, ``"{ENV_REGEX_NS}/Obstacle"``). The meshes
+    matched per sensor are read in the world frame. The rays are cast against all the meshes and the closest
+    hit is returned.
+
     Note:
-        Currently, only a single static mesh is supported. We are working on supporting multiple
-        static meshes and dynamic meshes.
+        Currently, only static meshes are supported. We are working on supporting dynamic meshes.
     """
 
     offset: OffsetCfg = OffsetCfg()
@@ -55,6 +59,25 @@ class RayCasterCfg(SensorBaseCfg):
     max_distance: float = 1e6
     """Maximum distance (in meters) from the sensor to ray cast to. Defaults to 1e6."""
 
+    track_mesh_ids: bool = False
+    """Whether to track the index of the mesh hit by each ray. Defaults to False.
+
+    If True, the index of the hit mesh in :attr:`mesh_prim_paths` is stored in
+    :attr:`~omni.isaac.lab.sensors.RayCasterData.ray_mesh_ids`.
+    """
+
+    use_height_map: bool = False
+    """Whether to look up the heights of the terrain instead of ray-casting against its mesh. Defaults to False.
+
+    This is only possible if :attr:`attach_yaw_only` is True, all the rays of the pattern point straight down
+    and :attr:`mesh_prim_paths` contains a single terrain imported with a height map (see
+    :attr:`~omni.isaac.lab.terrains.TerrainGeneratorCfg.build_height_map`). Otherwise, a warning is printed
+    and the rays are cast against the meshes.
+
+    The rays outside the height map or above regions that are not represented by it (such as overhangs or
+    mesh sub-terrains) are cast against the terrain mesh.
+    """
+
     drift_range: tuple[float, float] = (0.0, 0.0)
     """The range of drift (in meters) to add to the ray starting positions (xyz). Defaults to (0.0, 0.0).
 
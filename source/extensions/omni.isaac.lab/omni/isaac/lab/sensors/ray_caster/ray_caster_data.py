@@ -27,3 +27,12 @@ class RayCasterData:
     Shape is (N, B, 3), where N is the number of sensors, B is the number of rays
     in the scan pattern per sensor.
     """
+    ray_mesh_ids: torch.Tensor = None
+    """The index of the mesh hit by each ray in :attr:`~omni.isaac.lab.sensors.RayCasterCfg.mesh_prim_paths`.
+
+    Shape is (N, B), where N is the number of sensors, B is the number of rays in the scan pattern per sensor.
+    The value is -1 for rays that did not hit any mesh.
+
+    Note:
+        This quantity is only available if :attr:`~omni.isaac.lab.sensors.RayCasterCfg.track_mesh_ids` is True.
+    """
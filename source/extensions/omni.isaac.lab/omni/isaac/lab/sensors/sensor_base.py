@@ -195,7 +195,14 @@ class SensorBase(ABC):
     def update(self, dt: float, force_recompute: bool = False):
         # Update the timestamp for the sensors
         self._timestamp += dt
-        self._is_outdated |= self._timestamp - self._timestamp_last_update + 1e-6 >= self.cfg.update_period
+        if self._update_phases is None:
+            self._is_outdated |= self._timestamp - self._timestamp_last_update + 1e-6 >= self.cfg.update_period
+        else:
+            # an environment is outdated once it crosses the start of its next (phase-shifted) update period
+            period = self.cfg.update_period
+            current_period = torch.floor((self._timestamp + self._update_phases + 1e-6) / period)
+            last_update_period = torch.floor((self._timestamp_last_update + self._update_phases + 1e-6) / period)
+            self._is_outdated |= current_period > last_update_period
         # Update the buffers
         # TODO (from @mayank): Why is there a history length here when it doesn't mean anything in the sensor base?!?
         #   It is only for the contact sensor but there we should redefine the update function IMO.
@@ -227,6 +234,15 @@ class SensorBase(ABC):
         self._timestamp = torch.zeros(self._num_envs, device=self._device)
         # Timestamp from last update
         self._timestamp_last_update = torch.zeros_like(self._timestamp)
+        # Phases of the update periods of the environments (in seconds)
+        # note: the phases are spread over the physics steps in the update period so that the same number
+        #   of environments is updated at each step
+        num_steps_per_period = round(self.cfg.update_period / self._sim_physics_dt)
+        if self.cfg.stagger_update_phases and num_steps_per_period > 1:
+            env_phase_ids = torch.arange(self._num_envs, device=self._device) % num_steps_per_period
+            self._update_phases = env_phase_ids * (self.cfg.update_period / num_steps_per_period)
+        else:
+            self._update_phases = None
 
     @abstractmethod
     def _update_buffers_impl(self, env_ids: Sequence[int]):
@@ -34,6 +34,17 @@ class SensorBaseCfg:
     update_period: float = 0.0
     """Update period of the sensor buffers (in seconds). Defaults to 0.0 (update every step)."""
 
+    stagger_update_phases: bool = False
+    """Whether to spread the updates of the environments evenly over the update period. Defaults to False.
+
+    By default, the environments reset together become outdated on the same simulation step, which makes
+    the step time spike once every update period. If True, each environment is assigned a phase within the
+    update period, so that roughly ``num_envs / k`` environments are updated at each step, where ``k`` is the
+    number of physics steps in the update period. Each environment is still updated once every update period.
+
+    This only has an effect if :attr:`update_period` is larger than the physics time-step.
+    """
+
     history_length: int = 0
     """Number of past frames to store in the sensor buffers. Defaults to 0, which means that only
     the current data is stored (no history)."""
@@ -28,6 +28,12 @@ class HfTerrainBaseCfg(SubTerrainBaseCfg):
     slope_threshold: float | None = None
     """The slope threshold above which surfaces are made vertical. Defaults to None,
     in which case no correction is applied."""
+    simplify_flat_regions: bool = False
+    """Whether to merge the flat regions of the height field into larger triangles. Defaults to False.
+
+    This reduces the number of triangles of the terrain mesh without changing its surface. The merged
+    regions share their boundary vertices with the neighboring triangles only at their corners.
+    """
 
 
 """
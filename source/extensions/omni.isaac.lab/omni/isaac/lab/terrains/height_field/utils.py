@@ -15,6 +15,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .hf_terrains_cfg import HfTerrainBaseCfg
 
+_SCRATCH_BUFFER: np.ndarray | None = None
+"""The scratch buffer used for converting height fields to meshes (see :func:`_get_scratch_buffer`)."""
+
 
 def height_field_to_mesh(func: Callable) -> Callable:
     """Decorator to convert a height field function to a mesh function.
@@ -29,7 +32,9 @@ def height_field_to_mesh(func: Callable) -> Callable:
 
     Returns:
         The mesh function. The mesh function returns a tuple containing a list of ``trimesh``
-        mesh objects and the origin of the terrain.
+        mesh objects and the origin of the terrain. The height field (in m) is stored in the metadata of the
+        mesh under the key ``"height_field"``, together with a mask of the vertices moved by the slope
+        correction (``"height_field_moved"``).
     """
 
     @functools.wraps(func)
@@ -60,9 +65,26 @@ def height_field_to_mesh(func: Callable) -> Callable:
 
         # convert to trimesh
         vertices, triangles = convert_height_field_to_mesh(
-            heights, cfg.horizontal_scale, cfg.vertical_scale, cfg.slope_threshold
+            heights,
+            cfg.horizontal_scale,
+            cfg.vertical_scale,
+            cfg.slope_threshold,
+            simplify=cfg.simplify_flat_regions,
+            buffer=_get_scratch_buffer(3 * heights.size),
         )
         mesh = trimesh.Trimesh(vertices=vertices, faces=triangles)
+        # store the height field to allow looking up heights without ray-casting against the mesh
+        # note: the vertices moved by the slope correction do not lie on the grid anymore
+        grid_x, grid_y = np.meshgrid(
+            np.arange(heights.shape[0]) * cfg.horizontal_scale,
+            np.arange(heights.shape[1]) * cfg.horizontal_scale,
+            indexing="ij",
+        )
+        moved = (np.abs(vertices[:, 0] - grid_x.flatten()) > 1e-3 * cfg.horizontal_scale) | (
+            np.abs(vertices[:, 1] - grid_y.flatten()) > 1e-3 * cfg.horizontal_scale
+        )
+        mesh.metadata["height_field"] = heights.astype(np.float32) * cfg.vertical_scale
+        mesh.metadata["height_field_moved"] = moved.reshape(heights.shape)
         # compute origin
         x1 = int((cfg.size[0] * 0.5 - 1) / cfg.horizontal_scale)
         x2 = int((cfg.size[0] * 0.5 + 1) / cfg.horizontal_scale)
@@ -76,8 +98,25 @@ def height_field_to_mesh(func: Callable) -> Callable:
     return wrapper
 
 
+def _get_scratch_buffer(size: int) -> np.ndarray:
+    """Get a float32 scratch buffer with at least the given number of elements.
+
+    The buffer is shared by the calls within a process, so that the working arrays of the height field
+    conversion are not allocated again for each sub-terrain.
+    """
+    global _SCRATCH_BUFFER
+    if _SCRATCH_BUFFER is None or _SCRATCH_BUFFER.size < size:
+        _SCRATCH_BUFFER = np.empty(size, dtype=np.float32)
+    return _SCRATCH_BUFFER
+
+
 def convert_height_field_to_mesh(
-    height_field: np.ndarray, horizontal_scale: float, vertical_scale: float, slope_threshold: float | None = None
+    height_field: np.ndarray,
+    horizontal_scale: float,
+    vertical_scale: float,
+    slope_threshold: float | None = None,
+    simplify: bool = False,
+    buffer: np.ndarray | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Convert a height-field array to a triangle mesh represented by vertices and triangles.
 
@@ -102,12 +141,22 @@ def convert_height_field_to_mesh(
                   /  |
         (x_1,y_1)A---A'(x_1',y_1)
 
+    If :attr:`simplify` is True, the flat regions of the height field are merged into rectangles of two
+    triangles each. A cell of the grid is flat if its four vertices have the same height and are not moved
+    by the slope correction. The vertices inside the merged regions are not referenced by any triangle anymore
+    but are kept in the vertex array, so that the vertices always match the grid of the height field.
+
     Args:
         height_field: The input height-field array.
         horizontal_scale: The discretization of the terrain along the x and y axis.
         vertical_scale: The discretization of the terrain along the z axis.
         slope_threshold: The slope threshold above which surfaces are made vertical.
             Defaults to None, in which case no correction is applied.
+        simplify: Whether to merge the flat regions of the height field into larger triangles.
+            Defaults to False.
+        buffer: A float32 scratch buffer with at least ``3 * height_field.size`` elements used for the slope
+            correction. It can be reused across calls to avoid allocating the working arrays for each height
+            field. Defaults to None, in which case a new buffer is allocated.
 
     Returns:
         The vertices and triangles of the mesh:
@@ -118,21 +167,23 @@ def convert_height_field_to_mesh(
     """
     # read height field
     num_rows, num_cols = height_field.shape
-    # create a mesh grid of the height field
-    y = np.linspace(0, (num_cols - 1) * horizontal_scale, num_cols)
-    x = np.linspace(0, (num_rows - 1) * horizontal_scale, num_rows)
-    yy, xx = np.meshgrid(y, x)
-    # copy height field to avoid modifying the original array
-    hf = height_field.copy()
+    hf = height_field
+    # create vertices for the mesh on the grid of the height field
+    vertices = np.empty((num_rows, num_cols, 3), dtype=np.float32)
+    vertices[..., 0] = (np.arange(num_rows) * horizontal_scale)[:, None]
+    vertices[..., 1] = (np.arange(num_cols) * horizontal_scale)[None, :]
+    vertices[..., 2] = hf * vertical_scale
 
     # correct vertical surfaces above the slope threshold
+    moved = None
     if slope_threshold is not None:
         # scale slope threshold based on the horizontal and vertical scale
         slope_threshold *= horizontal_scale / vertical_scale
-        # allocate arrays to store the movement of the vertices
-        move_x = np.zeros((num_rows, num_cols))
-        move_y = np.zeros((num_rows, num_cols))
-        move_corners = np.zeros((num_rows, num_cols))
+        # resolve the arrays to store the movement of the vertices
+        if buffer is None or buffer.size < 3 * hf.size:
+            buffer = np.empty(3 * hf.size, dtype=np.float32)
+        move_x, move_y, move_corners = buffer[: 3 * hf.size].reshape(3, num_rows, num_cols)
+        buffer[: 3 * hf.size] = 0.0
         # move vertices along the x-axis
         move_x[: num_rows - 1, :] += hf[1:num_rows, :] - hf[: num_rows - 1, :] > slope_threshold
         move_x[1:num_rows, :] -= hf[: num_rows - 1, :] - hf[1:num_rows, :] > slope_threshold
@@ -146,28 +197,92 @@ def convert_height_field_to_mesh(
         move_corners[1:num_rows, 1:num_cols] -= (
             hf[: num_rows - 1, : num_cols - 1] - hf[1:num_rows, 1:num_cols] > slope_threshold
         )
-        xx += (move_x + move_corners * (move_x == 0)) * horizontal_scale
-        yy += (move_y + move_corners * (move_y == 0)) * horizontal_scale
-
-    # create vertices for the mesh
-    vertices = np.zeros((num_rows * num_cols, 3), dtype=np.float32)
-    vertices[:, 0] = xx.flatten()
-    vertices[:, 1] = yy.flatten()
-    vertices[:, 2] = hf.flatten() * vertical_scale
+        vertices[..., 0] += (move_x + move_corners * (move_x == 0)) * horizontal_scale
+        vertices[..., 1] += (move_y + move_corners * (move_y == 0)) * horizontal_scale
+        # store the vertices moved by the correction (required to find the flat cells)
+        if simplify:
+            moved = (move_x != 0) | (move_y != 0) | (move_corners != 0)
+    vertices = vertices.reshape(-1, 3)
+
     # create triangles for the mesh
-    triangles = -np.ones((2 * (num_rows - 1) * (num_cols - 1), 3), dtype=np.uint32)
-    for i in range(num_rows - 1):
-        ind0 = np.arange(0, num_cols - 1) + i * num_cols
-        ind1 = ind0 + 1
-        ind2 = ind0 + num_cols
-        ind3 = ind2 + 1
-        start = 2 * i * (num_cols - 1)
-        stop = start + 2 * (num_cols - 1)
-        triangles[start:stop:2, 0] = ind0
-        triangles[start:stop:2, 1] = ind3
-        triangles[start:stop:2, 2] = ind1
-        triangles[start + 1 : stop : 2, 0] = ind0
-        triangles[start + 1 : stop : 2, 1] = ind2
-        triangles[start + 1 : stop : 2, 2] = ind3
+    # note: the index of the lower corner of each cell of the grid. dim: (num_rows - 1, num_cols - 1)
+    ind0 = np.arange(num_rows - 1, dtype=np.uint32)[:, None] * num_cols + np.arange(num_cols - 1, dtype=np.uint32)
+    if not simplify:
+        triangles = _create_cell_triangles(ind0, ind0 + 1, ind0 + num_cols, ind0 + num_cols + 1)
+    else:
+        # find the flat cells of the grid
+        flat = (hf[:-1, :-1] == hf[1:, :-1]) & (hf[:-1, :-1] == hf[:-1, 1:]) & (hf[:-1, :-1] == hf[1:, 1:])
+        if moved is not None:
+            flat &= ~(moved[:-1, :-1] | moved[1:, :-1] | moved[:-1, 1:] | moved[1:, 1:])
+        # triangulate the cells that are not flat
+        ind0_rough = ind0[~flat]
+        rough_triangles = _create_cell_triangles(
+            ind0_rough, ind0_rough + 1, ind0_rough + num_cols, ind0_rough + num_cols + 1
+        )
+        # merge the flat cells into rectangles and triangulate them
+        row_start, row_end, col_start, col_end = _merge_flat_cells(flat, hf[:-1, :-1])
+        flat_triangles = _create_cell_triangles(
+            (row_start * num_cols + col_start).astype(np.uint32),
+            (row_start * num_cols + col_end).astype(np.uint32),
+            (row_end * num_cols + col_start).astype(np.uint32),
+            (row_end * num_cols + col_end).astype(np.uint32),
+        )
+        triangles = np.concatenate([rough_triangles, flat_triangles])
 
     return vertices, triangles
+
+
+def _create_cell_triangles(ind0: np.ndarray, ind1: np.ndarray, ind2: np.ndarray, ind3: np.ndarray) -> np.ndarray:
+    """Create the two triangles of rectangular cells from the indices of their corners.
+
+    The corners are ordered as (lower x, lower y), (lower x, upper y), (upper x, lower y) and (upper x, upper y).
+
+    Returns:
+        The triangles of the cells. Shape is (2 * num_cells, 3).
+    """
+    triangles = np.empty((*ind0.shape, 2, 3), dtype=np.uint32)
+    triangles[..., 0, 0] = ind0
+    triangles[..., 0, 1] = ind3
+    triangles[..., 0, 2] = ind1
+    triangles[..., 1, 0] = ind0
+    triangles[..., 1, 1] = ind2
+    triangles[..., 1, 2] = ind3
+    return triangles.reshape(-1, 3)
+
+
+def _merge_flat_cells(flat: np.ndarray, heights: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Merge the flat cells of a grid into rectangles of cells at the same height.
+
+    The cells are first merged into runs along the y-axis. The runs with the same extent and height
+    in consecutive rows are then merged into rectangles.
+
+    Args:
+        flat: The mask of the flat cells. Shape is (num_rows - 1, num_cols - 1).
+        heights: The height of the cells. Shape is (num_rows - 1, num_cols - 1).
+
+    Returns:
+        The start and end rows and the start and end columns of the rectangles (in grid vertices).
+    """
+    # merge the flat cells into runs along each row
+    rows, cols = np.nonzero(flat)
+    cell_heights = heights[rows, cols]
+    new_run = np.ones(len(rows), dtype=bool)
+    new_run[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1] + 1) | (cell_heights[1:] != cell_heights[:-1])
+    run_starts = np.flatnonzero(new_run)
+    run_ends = np.append(run_starts[1:], len(rows)) - 1
+    run_rows, run_col_start, run_col_end = rows[run_starts], cols[run_starts], cols[run_ends] + 1
+    run_heights = cell_heights[run_starts]
+    # merge the runs with the same columns and height in consecutive rows
+    order = np.lexsort((run_rows, run_heights, run_col_end, run_col_start))
+    run_rows, run_col_start, run_col_end = run_rows[order], run_col_start[order], run_col_end[order]
+    run_heights = run_heights[order]
+    new_rect = np.ones(len(order), dtype=bool)
+    new_rect[1:] = (
+        (run_col_start[1:] != run_col_start[:-1])
+        | (run_col_end[1:] != run_col_end[:-1])
+        | (run_heights[1:] != run_heights[:-1])
+        | (run_rows[1:] != run_rows[:-1] + 1)
+    )
+    rect_starts = np.flatnonzero(new_rect)
+    rect_ends = np.append(rect_starts[1:], len(order)) - 1
+    return run_rows[rect_starts], run_rows[rect_ends] + 1, run_col_start[rect_starts], run_col_end[rect_starts]
@@ -0,0 +1,41 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from dataclasses import dataclass
+
+
+@dataclass
+class TerrainHeightMap:
+    """Dense height map of a terrain sampled on a regular grid.
+
+    The height map stores the heights of the terrain at the vertices of a regular grid in the xy-plane. Within
+    each cell of the grid, the terrain is represented by the two triangles that share the diagonal from the
+    vertex ``(i, j)`` to the vertex ``(i + 1, j + 1)``. This is the same triangulation as used for converting
+    height fields into meshes (see :func:`~omni.isaac.lab.terrains.height_field.utils.convert_height_field_to_mesh`).
+    Thus, looking up a height in the height map gives the same result as ray-casting straight down against the
+    terrain mesh wherever the mesh follows the grid.
+
+    The cells where the terrain mesh deviates from the grid (for instance, sub-terrains generated as meshes or
+    vertical surfaces created by the slope correction) are marked as invalid. For these, ray-casting against
+    the terrain mesh is required.
+    """
+
+    heights: torch.Tensor
+    """The heights of the terrain at the vertices of the grid (in m). Shape is (num_cells_x + 1, num_cells_y + 1)."""
+
+    valid: torch.Tensor
+    """Whether the height map matches the terrain mesh in each cell of the grid.
+
+    Shape is (num_cells_x, num_cells_y) and the data type is bool.
+    """
+
+    origin: tuple[float, float]
+    """The position of the vertex ``(0, 0)`` of the grid in the terrain frame (in m)."""
+
+    resolution: float
+    """The spacing between the vertices of the grid along the x and y axes (in m)."""
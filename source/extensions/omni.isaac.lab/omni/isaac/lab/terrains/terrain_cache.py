@@ -0,0 +1,167 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import json
+import numpy as np
+import os
+import shutil
+import time
+
+from omni.isaac.lab.utils.io import dump_yaml
+
+TERRAIN_CACHE_VERSION = 1
+"""The version of the format of the terrain cache.
+
+The entries written with a different version are ignored when loading and are eventually evicted.
+"""
+
+
+class TerrainCache:
+    """A cache of terrain data stored as binary arrays.
+
+    Each entry of the cache is a directory named after its key (the MD5 hash of the configuration that generated
+    the data). It contains one ``.npy`` file per array, which are loaded as memory-mapped arrays. This avoids
+    parsing text files (such as OBJ meshes) and copying the data that is not accessed.
+
+    The entries are written into a temporary directory that is renamed once complete. A file ``meta.json`` in
+    the entry stores the version of the cache format. The entries without it or with a different version are
+    ignored.
+
+    The cache directory also contains a manifest (``manifest.json``) that records the size and the last access
+    time of each entry. It is used to evict the least recently used entries when the cache exceeds its maximum
+    size. The manifest is only an index: the entries missing from it (for instance, written by another process)
+    are added with the modification time of their directory.
+    """
+
+    def __init__(self, cache_dir: str):
+        """Initializes the cache.
+
+        Args:
+            cache_dir: The directory of the cache.
+        """
+        self.cache_dir = cache_dir
+
+    """
+    Operations.
+    """
+
+    def load(self, key: str) -> dict[str, np.ndarray] | None:
+        """Loads the arrays of an entry.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The memory-mapped arrays of the entry, or None if the entry does not exist or has a different version.
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        meta = self._read_json(os.path.join(entry_dir, "meta.json"))
+        if meta is None or meta.get("version") != TERRAIN_CACHE_VERSION:
+            return None
+        try:
+            return {name: np.load(os.path.join(entry_dir, f"{name}.npy"), mmap_mode="r") for name in meta["arrays"]}
+        except (OSError, ValueError):
+            # the entry is corrupted
+            return None
+
+    def save(self, key: str, arrays: dict[str, np.ndarray], cfg: object | None = None):
+        """Saves the arrays of an entry.
+
+        If the entry already exists (for instance, written by another process), it is left untouched.
+
+        Args:
+            key: The key of the entry.
+            arrays: The arrays to save. The keys must be valid file names.
+            cfg: The configuration that generated the data. It is saved as YAML file for inspection.
+                Defaults to None.
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        # write the entry into a temporary directory
+        tmp_dir = f"{entry_dir}.tmp-{os.getpid()}"
+        os.makedirs(tmp_dir, exist_ok=True)
+        for name, array in arrays.items():
+            np.save(os.path.join(tmp_dir, f"{name}.npy"), np.ascontiguousarray(array))
+        if cfg is not None:
+            dump_yaml(os.path.join(tmp_dir, "cfg.yaml"), cfg)
+        with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+            json.dump({"version": TERRAIN_CACHE_VERSION, "arrays": list(arrays.keys())}, f)
+        # move the entry to its final location
+        # note: entries from older versions of the cache are replaced
+        if os.path.isdir(entry_dir) and self.load(key) is None:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+        try:
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # another process wrote the entry in the meantime
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def update_manifest(self, keys: list[str], max_size: float | None = None):
+        """Records the access to the input entries and evicts the least recently used entries.
+
+        Args:
+            keys: The keys of the entries that were accessed. These are never evicted.
+            max_size: The maximum size of the cache (in GB). Defaults to None, in which case no entry is evicted.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        manifest_path = os.path.join(self.cache_dir, "manifest.json")
+        manifest = self._read_json(manifest_path)
+        if manifest is None or manifest.get("version") != TERRAIN_CACHE_VERSION:
+            manifest = {"version": TERRAIN_CACHE_VERSION, "entries": {}}
+        entries: dict[str, dict] = manifest["entries"]
+        # synchronize the manifest with the entries on disk
+        # note: the temporary directories of entries being written are skipped
+        entry_names = {
+            name
+            for name in os.listdir(self.cache_dir)
+            if os.path.isdir(os.path.join(self.cache_dir, name)) and ".tmp-" not in name
+        }
+        for name in list(entries.keys()):
+            if name not in entry_names:
+                del entries[name]
+        for name in entry_names:
+            if name not in entries:
+                entry_dir = os.path.join(self.cache_dir, name)
+                entries[name] = {"size": self._get_dir_size(entry_dir), "last_access": os.path.getmtime(entry_dir)}
+        # record the access to the input entries
+        now = time.time()
+        for key in keys:
+            if key in entries:
+                entries[key]["last_access"] = now
+        # evict the least recently used entries
+        if max_size is not None:
+            total_size = sum(entry["size"] for entry in entries.values())
+            for name in sorted(entries, key=lambda name: entries[name]["last_access"]):
+                if total_size <= max_size * 1e9:
+                    break
+                if name in keys:
+                    continue
+                shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+                total_size -= entries.pop(name)["size"]
+        # write the manifest
+        # note: the manifest is replaced atomically so that concurrent readers never see a partial file
+        tmp_path = f"{manifest_path}.tmp-{os.getpid()}"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+
+    """
+    Helper functions.
+    """
+
+    @staticmethod
+    def _read_json(path: str) -> dict | None:
+        """Reads a JSON file, or returns None if it does not exist or is invalid."""
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _get_dir_size(path: str) -> int:
+        """Computes the size of the files in a directory (in bytes)."""
+        return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
@@ -0,0 +1,172 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .terrain_importer_cfg import TerrainCurriculumCfg
+
+
+class TerrainCurriculum:
+    """A curriculum over the difficulty levels of a terrain.
+
+    The terrain comprises of sub-terrains arranged in a grid, where the rows correspond to the difficulty levels
+    and the columns to the terrain types. Each environment is assigned a level and a type. Its origin is the origin
+    of the corresponding sub-terrain. The curriculum moves the environments between the levels based on whether they
+    solved their current level (see :meth:`update`).
+
+    All the quantities of the curriculum (the levels and types of the environments, the success rates of the levels
+    and the origins of the sub-terrains) are stored as tensors on the device of the terrain origins. Updating the
+    curriculum and resolving the origins of the environments are done with tensor operations only, so that they do
+    not synchronize the host with the device.
+
+    The promotion policy decides whether the environments that solved (or failed) their level move to the next
+    (or previous) level:
+
+    * ``"deterministic"``: The environments always move.
+    * ``"stochastic"``: The environments move with a fixed probability.
+    * ``"adaptive"``: The environments move with a probability based on the success rate of their level. They
+      are promoted more readily from the levels that most environments solve, and demoted more readily from the
+      levels that most environments fail.
+
+    The environments that solve the last level are sent to a random level.
+    """
+
+    levels: torch.Tensor
+    """The levels of the environments. Shape is (num_envs,)."""
+    types: torch.Tensor
+    """The terrain types of the environments. Shape is (num_envs,)."""
+    success_rates: torch.Tensor
+    """The success rates of the levels. Shape is (num_levels,).
+
+    These are exponential moving averages of the fraction of environments that solve each level
+    (see :attr:`TerrainCurriculumCfg.success_rate_smoothing`). They are initialized to
+    :attr:`TerrainCurriculumCfg.target_success_rate`.
+    """
+
+    def __init__(
+        self, cfg: TerrainCurriculumCfg, terrain_origins: torch.Tensor, num_envs: int, max_init_level: int | None = None
+    ):
+        """Initializes the curriculum.
+
+        The environments are evenly distributed over the terrain types and their initial levels are sampled
+        uniformly up to the maximum initial level.
+
+        Args:
+            cfg: The configuration of the curriculum.
+            terrain_origins: The origins of the sub-terrains. Shape is (num_levels, num_types, 3).
+            num_envs: The number of environments.
+            max_init_level: The maximum initial level of the environments. Defaults to None, in which case
+                all the levels are used.
+
+        Raises:
+            ValueError: If the promotion policy is "adaptive" and the target success rate is not in the range (0, 1).
+        """
+        # check inputs
+        if cfg.promotion_policy == "adaptive" and not 0.0 < cfg.target_success_rate < 1.0:
+            raise ValueError(
+                "The target success rate of the adaptive promotion policy must be in the range (0, 1). Received:"
+                f" {cfg.target_success_rate}."
+            )
+        # store inputs
+        self.cfg = cfg
+        self.device = terrain_origins.device
+        self.num_levels, self.num_types = terrain_origins.shape[:2]
+        # flatten the origins to look them up with a single index
+        self._origins = terrain_origins.reshape(-1, 3)
+
+        # resolve the maximum initial level
+        if max_init_level is None:
+            max_init_level = self.num_levels - 1
+        else:
+            max_init_level = min(max_init_level, self.num_levels - 1)
+        # assign the levels and types of the environments
+        self.levels = torch.randint(0, max_init_level + 1, (num_envs,), device=self.device)
+        self.types = torch.div(
+            torch.arange(num_envs, device=self.device), (num_envs / self.num_types), rounding_mode="floor"
+        ).to(torch.long)
+        # statistics of the levels
+        self.success_rates = torch.full((self.num_levels,), cfg.target_success_rate, device=self.device)
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs_per_level(self) -> torch.Tensor:
+        """The number of environments at each level. Shape is (num_levels,)."""
+        num_envs = torch.zeros(self.num_levels, dtype=torch.long, device=self.device)
+        return num_envs.scatter_add_(0, self.levels, torch.ones_like(self.levels))
+
+    """
+    Operations.
+    """
+
+    def update(self, env_ids: Sequence[int] | torch.Tensor | slice, move_up: torch.Tensor, move_down: torch.Tensor):
+        """Updates the levels of the environments.
+
+        The success rates of the current levels of the environments are updated first. The promotion policy then
+        decides which of the environments move up or down.
+
+        Args:
+            env_ids: The indices of the environments to update.
+            move_up: Whether each environment solved its level. Shape is (len(env_ids),).
+            move_down: Whether each environment failed its level. Shape is (len(env_ids),).
+        """
+        levels = self.levels[env_ids]
+        move_up = move_up.bool()
+        move_down = move_down.bool() & ~move_up
+        # update the success rates of the levels
+        attempts = torch.zeros(self.num_levels, device=self.device).scatter_add_(
+            0, levels, torch.ones_like(levels, dtype=torch.float)
+        )
+        successes = torch.zeros(self.num_levels, device=self.device).scatter_add_(0, levels, move_up.float())
+        self.success_rates.lerp_(
+            successes / attempts.clamp(min=1.0), (attempts > 0).float() * self.cfg.success_rate_smoothing
+        )
+
+        # resolve the probabilities of moving
+        if self.cfg.promotion_policy == "stochastic":
+            prob_up = torch.full_like(levels, self.cfg.promotion_probability, dtype=torch.float)
+            prob_down = torch.full_like(levels, self.cfg.demotion_probability, dtype=torch.float)
+        elif self.cfg.promotion_policy == "adaptive":
+            success_rates = self.success_rates[levels]
+            target = self.cfg.target_success_rate
+            prob_up = self.cfg.promotion_probability * torch.clamp(success_rates / target, max=1.0)
+            prob_down = self.cfg.demotion_probability * torch.clamp((1.0 - success_rates) / (1.0 - target), max=1.0)
+        elif self.cfg.promotion_policy != "deterministic":
+            raise ValueError(f"Invalid promotion policy: {self.cfg.promotion_policy}.")
+        if self.cfg.promotion_policy != "deterministic":
+            sample = torch.rand_like(prob_up)
+            move_up = move_up & (sample < prob_up)
+            move_down = move_down & (sample < prob_down)
+
+        # update the levels
+        levels = levels + 1 * move_up - 1 * move_down
+        # environments that solve the last level are sent to a random one
+        # the minimum level is zero
+        self.levels[env_ids] = torch.where(
+            levels >= self.num_levels,
+            torch.randint_like(levels, self.num_levels),
+            torch.clip(levels, 0),
+        )
+
+    def get_origins(self, env_ids: Sequence[int] | torch.Tensor | slice | None = None) -> torch.Tensor:
+        """Looks up the origins of the environments from their levels and types.
+
+        Args:
+            env_ids: The indices of the environments. Defaults to None, in which case all environments are used.
+
+        Returns:
+            The origins of the environments. Shape is (len(env_ids), 3).
+        """
+        # resolve all indices
+        if env_ids is None:
+            env_ids = slice(None)
+        return self._origins[self.levels[env_ids] * self.num_types + self.types[env_ids]]
@@ -3,22 +3,25 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import contextlib
+import multiprocessing
 import numpy as np
-import os
 import torch
 import trimesh
+from concurrent.futures import ProcessPoolExecutor
 
 import carb
 
 from omni.isaac.lab.utils.dict import dict_to_md5_hash
-from omni.isaac.lab.utils.io import dump_yaml
 from omni.isaac.lab.utils.timer import Timer
 from omni.isaac.lab.utils.warp import convert_to_warp_mesh
 
 from .height_field import HfTerrainBaseCfg
+from .height_map import TerrainHeightMap
+from .terrain_cache import TerrainCache
 from .terrain_generator_cfg import FlatPatchSamplingCfg, SubTerrainBaseCfg, TerrainGeneratorCfg
 from .trimesh.utils import make_border
-from .utils import color_meshes_by_height, find_flat_patches
+from .utils import color_meshes_by_height, find_flat_patches_batched
 
 
 class TerrainGenerator:
@@ -67,6 +70,15 @@ class TerrainGenerator:
     sub-terrain configurations. This means that if the same sub-terrain configuration is used
     multiple times, the terrain is only generated once and then reused. This is useful when
     generating complex sub-terrains that take a long time to generate.
+    If :attr:`~TerrainGeneratorCfg.cache_terrain_mesh` is also set to True, the assembled terrain is cached as
+    well. Loading it skips the generation of the sub-terrains, the sampling of the flat patches and the assembly
+    of the terrain altogether. The cache stores binary arrays and is bounded in size by
+    :attr:`~TerrainGeneratorCfg.max_cache_size`.
+
+    If :attr:`~TerrainGeneratorCfg.num_workers` is greater than one, the sub-terrains are generated in a pool of
+    worker processes. The meshes are sent back to the main process as arrays of vertices and faces, where they are
+    assembled into the terrain. Since every sub-terrain is generated with its own seed (derived from the seed of the
+    generator and its row and column indices), the generated terrain does not depend on the number of workers.
 
     .. attention::
 
@@ -79,7 +91,10 @@ class TerrainGenerator:
     terrain_mesh: trimesh.Trimesh
     """A single trimesh.Trimesh object for all the generated sub-terrains."""
     terrain_meshes: list[trimesh.Trimesh]
-    """List of trimesh.Trimesh objects for all the generated sub-terrains."""
+    """List of trimesh.Trimesh objects for all the generated sub-terrains.
+
+    If the assembled terrain is loaded from the cache, the list only contains the terrain mesh.
+    """
     terrain_origins: np.ndarray
     """The origin of each sub-terrain. Shape is (num_rows, num_cols, 3)."""
     flat_patches: dict[str, torch.Tensor]
@@ -92,6 +107,12 @@ class TerrainGenerator:
     For instance, the key "root_spawn" maps to a tensor containing the flat patches for spawning an asset.
     Similarly, the key "target_spawn" maps to a tensor containing the flat patches for setting targets.
     """
+    height_map: TerrainHeightMap | None
+    """The dense height map of the terrain. Defaults to None.
+
+    The height map is only built if :attr:`TerrainGeneratorCfg.build_height_map` is True. It is expressed in
+    the same frame as the terrain mesh.
+    """
 
     def __init__(self, cfg: TerrainGeneratorCfg, device: str = "cpu"):
         """Initialize the terrain generator.
@@ -134,13 +155,57 @@ class TerrainGenerator:
         # note: we create a new random number generator to avoid affecting the global state
         #  in the other places where random numbers are used.
         self.np_rng = np.random.default_rng(seed)
+        # store the seed to derive the seeds of the sub-terrains
+        self._seed = int(seed)
 
         # buffer for storing valid patches
         self.flat_patches = {}
         # create a list of all sub-terrains
         self.terrain_meshes = list()
         self.terrain_origins = np.zeros((self.cfg.num_rows, self.cfg.num_cols, 3))
+        # sub-terrains to sample flat patches on: (row, col, sub-terrain cfg, XY-bounds of the sub-terrain)
+        self._flat_patch_sub_terrains = list()
+        # buffers for assembling the height map
+        self.height_map = None
+        if self.cfg.build_height_map:
+            self._init_height_map()
+
+        # keys of the entries of the terrain cache used by the terrain
+        self._cache_keys = list()
+
+        # load the assembled terrain from the cache if it exists, otherwise generate it
+        terrain_hash = self._get_terrain_cache_key() if self.cfg.use_cache and self.cfg.cache_terrain_mesh else None
+        if terrain_hash is None or not self._load_terrain_from_cache(terrain_hash):
+            self._generate_terrain()
+            if terrain_hash is not None:
+                self._save_terrain_to_cache(terrain_hash)
+        # record the access to the cache and evict the least recently used entries
+        if self.cfg.use_cache:
+            TerrainCache(self.cfg.cache_dir).update_manifest(self._cache_keys, max_size=self.cfg.max_cache_size)
 
+    def __str__(self):
+        """Return a string representation of the terrain generator."""
+        msg = "Terrain Generator:"
+        msg += f"\n\tSeed: {self.cfg.seed}"
+        msg += f"\n\tNumber of rows: {self.cfg.num_rows}"
+        msg += f"\n\tNumber of columns: {self.cfg.num_cols}"
+        msg += f"\n\tSub-terrain size: {self.cfg.size}"
+        msg += f"\n\tSub-terrain types: {list(self.cfg.sub_terrains.keys())}"
+        msg += f"\n\tCurriculum: {self.cfg.curriculum}"
+        msg += f"\n\tDifficulty range: {self.cfg.difficulty_range}"
+        msg += f"\n\tColor scheme: {self.cfg.color_scheme}"
+        msg += f"\n\tUse cache: {self.cfg.use_cache}"
+        if self.cfg.use_cache:
+            msg += f"\n\tCache directory: {self.cfg.cache_dir}"
+
+        return msg
+
+    """
+    Terrain generator functions.
+    """
+
+    def _generate_terrain(self):
+        """Generate the sub-terrains and assemble them into the terrain mesh."""
         # parse configuration and add sub-terrains
         # create terrains based on curriculum or randomly
         if self.cfg.curriculum:
@@ -174,30 +239,15 @@ class TerrainGenerator:
         # -- terrain origins
         self.terrain_origins += transform[:3, -1]
         # -- valid patches
+        if len(self._flat_patch_sub_terrains) > 0:
+            with Timer("[INFO] Sampling flat patches took"):
+                self._sample_flat_patches(transform)
         terrain_origins_torch = torch.tensor(self.terrain_origins, dtype=torch.float, device=self.device).unsqueeze(2)
         for name, value in self.flat_patches.items():
             self.flat_patches[name] = value + terrain_origins_torch
-
-    def __str__(self):
-        """Return a string representation of the terrain generator."""
-        msg = "Terrain Generator:"
-        msg += f"\n\tSeed: {self.cfg.seed}"
-        msg += f"\n\tNumber of rows: {self.cfg.num_rows}"
-        msg += f"\n\tNumber of columns: {self.cfg.num_cols}"
-        msg += f"\n\tSub-terrain size: {self.cfg.size}"
-        msg += f"\n\tSub-terrain types: {list(self.cfg.sub_terrains.keys())}"
-        msg += f"\n\tCurriculum: {self.cfg.curriculum}"
-        msg += f"\n\tDifficulty range: {self.cfg.difficulty_range}"
-        msg += f"\n\tColor scheme: {self.cfg.color_scheme}"
-        msg += f"\n\tUse cache: {self.cfg.use_cache}"
-        if self.cfg.use_cache:
-            msg += f"\n\tCache directory: {self.cfg.cache_dir}"
-
-        return msg
-
-    """
-    Terrain generator functions.
-    """
+        # -- height map
+        if self.cfg.build_height_map:
+            self.height_map = self._create_height_map(origin=tuple(transform[:2, -1]))
 
     def _generate_random_terrains(self):
         """Add terrains based on randomly sampled difficulty parameter."""
@@ -208,6 +258,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # randomly sample sub-terrains
+        sub_terrains = []
         for index in range(self.cfg.num_rows * self.cfg.num_cols):
             # coordinate index of the sub-terrain
             (sub_row, sub_col) = np.unravel_index(index, (self.cfg.num_rows, self.cfg.num_cols))
@@ -215,10 +266,10 @@ class TerrainGenerator:
             sub_index = self.np_rng.choice(len(proportions), p=proportions)
             # randomly sample difficulty parameter
             difficulty = self.np_rng.uniform(*self.cfg.difficulty_range)
-            # generate terrain
-            mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_index])
-            # add to sub-terrains
-            self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_index])
+            # store the sub-terrain to generate
+            sub_terrains.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_index]))
+        # generate terrains and add them to sub-terrains
+        self._add_sub_terrains(sub_terrains)
 
     def _generate_curriculum_terrains(self):
         """Add terrains based on the difficulty parameter."""
@@ -237,6 +288,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # curriculum-based sub-terrains
+        sub_terrains = []
         for sub_col in range(self.cfg.num_cols):
             for sub_row in range(self.cfg.num_rows):
                 # vary the difficulty parameter linearly over the number of rows
@@ -248,10 +300,10 @@ class TerrainGenerator:
                 lower, upper = self.cfg.difficulty_range
                 difficulty = (sub_row + self.np_rng.uniform()) / self.cfg.num_rows
                 difficulty = lower + (upper - lower) * difficulty
-                # generate terrain
-                mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_indices[sub_col]])
-                # add to sub-terrains
-                self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_indices[sub_col]])
+                # store the sub-terrain to generate
+                sub_terrains.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_indices[sub_col]]))
+        # generate terrains and add them to sub-terrains
+        self._add_sub_terrains(sub_terrains)
 
     """
     Internal helper functions.
@@ -279,13 +331,67 @@ class TerrainGenerator:
         # add the border to the list of meshes
         self.terrain_meshes.append(border)
 
+    def _add_sub_terrains(self, sub_terrains: list[tuple[int, int, float, SubTerrainBaseCfg]]):
+        """Generate the input sub-terrains and add them to the list of sub-terrains.
+
+        Based on :attr:`TerrainGeneratorCfg.num_workers`, the sub-terrains are either generated one after the
+        other or in a pool of worker processes. In both cases, each sub-terrain is generated with a seed derived
+        from the seed of the generator and its row and column indices. The sub-terrains are then added in the
+        order of the input list.
+
+        Args:
+            sub_terrains: The sub-terrains to generate. Each entry contains the row index, the column index,
+                the difficulty and the configuration of the sub-terrain.
+        """
+        # resolve the seed of each sub-terrain
+        # note: the seed does not depend on the order of generation
+        seeds = [
+            int(np.random.SeedSequence((self._seed, row, col)).generate_state(1)[0]) for row, col, _, _ in sub_terrains
+        ]
+        difficulties = [difficulty for _, _, difficulty, _ in sub_terrains]
+        sub_cfgs = [sub_cfg for _, _, _, sub_cfg in sub_terrains]
+        # record the entries of the terrain cache used by the sub-terrains
+        if self.cfg.use_cache:
+            for difficulty, sub_cfg, seed in zip(difficulties, sub_cfgs, seeds):
+                self._cache_keys.append(_resolve_sub_terrain_cfg(difficulty, sub_cfg, self.cfg, seed)[1])
+        # check if the worker processes can be forked
+        # note: spawning the workers would re-run the main script, which launches the simulation app
+        num_workers = min(self.cfg.num_workers, len(sub_terrains))
+        if num_workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+            carb.log_warn(
+                "Generating the sub-terrains in parallel requires forking processes, which is not supported on this"
+                " platform. Generating the sub-terrains serially instead."
+            )
+            num_workers = 1
+
+        if num_workers > 1:
+            # generate the sub-terrains in the worker processes
+            with ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context("fork")) as pool:
+                results = pool.map(
+                    _generate_sub_terrain_arrays,
+                    difficulties,
+                    sub_cfgs,
+                    [self.cfg] * len(sub_terrains),
+                    seeds,
+                )
+                # add the sub-terrains in order as they come in
+                for (row, col, _, sub_cfg), (vertices, faces, metadata, origin) in zip(sub_terrains, results):
+                    mesh = trimesh.Trimesh(vertices=vertices, faces=faces, metadata=metadata, process=False)
+                    self._add_sub_terrain(mesh, origin, row, col, sub_cfg)
+        else:
+            # generate the sub-terrains one after the other
+            for (row, col, _, sub_cfg), difficulty, seed in zip(sub_terrains, difficulties, seeds):
+                mesh, origin = self._get_terrain_mesh(difficulty, sub_cfg, seed)
+                self._add_sub_terrain(mesh, origin, row, col, sub_cfg)
+
     def _add_sub_terrain(
         self, mesh: trimesh.Trimesh, origin: np.ndarray, row: int, col: int, sub_terrain_cfg: SubTerrainBaseCfg
     ):
         """Add input sub-terrain to the list of sub-terrains.
 
         This function adds the input sub-terrain mesh to the list of sub-terrains and updates the origin
-        of the sub-terrain in the list of origins. It also samples flat patches if specified.
+        of the sub-terrain in the list of origins. If flat patches are specified, the sub-terrain is recorded
+        to sample them on the assembled terrain (see :meth:`_sample_flat_patches`).
 
         Args:
             mesh: The mesh of the sub-terrain.
@@ -293,12 +399,35 @@ class TerrainGenerator:
             row: The row index of the sub-terrain.
             col: The column index of the sub-terrain.
         """
-        # sample flat patches if specified
+        # add the height field of the sub-terrain to the height map
+        if self.cfg.build_height_map:
+            self._add_to_height_map(mesh, row, col)
+
+        # transform the mesh to the correct position
+        transform = np.eye(4)
+        transform[0:2, -1] = (row + 0.5) * self.cfg.size[0], (col + 0.5) * self.cfg.size[1]
+        mesh.apply_transform(transform)
+        # add mesh to the list
+        self.terrain_meshes.append(mesh)
+        # add origin to the list
+        self.terrain_origins[row, col] = origin + transform[:3, -1]
+        # record the sub-terrain to sample flat patches on once the terrain is assembled
         if sub_terrain_cfg.flat_patch_sampling is not None:
-            carb.log_info(f"Sampling flat patches for sub-terrain at (row, col):  ({row}, {col})")
-            # convert the mesh to warp mesh
-            wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
-            # sample flat patches based on each patch configuration for that sub-terrain
+            self._flat_patch_sub_terrains.append((row, col, sub_terrain_cfg, mesh.bounds[:, :2]))
+
+    def _sample_flat_patches(self, transform: np.ndarray):
+        """Sample the flat patches of all the sub-terrains on the assembled terrain mesh.
+
+        The patches of all the sub-terrains and patch configurations are sampled together with
+        :func:`find_flat_patches_batched`, so that each sampling iteration ray-casts once against the terrain mesh.
+        The patches of a sub-terrain are sampled within its bounds and stored relative to its origin.
+
+        Args:
+            transform: The transform applied to the sub-terrains to center the terrain mesh.
+        """
+        # collect the search spaces of all the sub-terrains and patch configurations
+        keys, origins, bounds, patch_cfgs = [], [], [], []
+        for row, col, sub_terrain_cfg, sub_terrain_bounds in self._flat_patch_sub_terrains:
             for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
                 patch_cfg: FlatPatchSamplingCfg
                 # create the flat patches tensor (if not already created)
@@ -306,28 +435,184 @@ class TerrainGenerator:
                     self.flat_patches[name] = torch.zeros(
                         (self.cfg.num_rows, self.cfg.num_cols, patch_cfg.num_patches, 3), device=self.device
                     )
-                # add the flat patches to the tensor
-                self.flat_patches[name][row, col] = find_flat_patches(
-                    wp_mesh=wp_mesh,
-                    origin=origin,
-                    num_patches=patch_cfg.num_patches,
-                    patch_radius=patch_cfg.patch_radius,
-                    x_range=patch_cfg.x_range,
-                    y_range=patch_cfg.y_range,
-                    z_range=patch_cfg.z_range,
-                    max_height_diff=patch_cfg.max_height_diff,
+                keys.append((name, row, col))
+                origins.append(self.terrain_origins[row, col])
+                bounds.append(sub_terrain_bounds + transform[:2, -1])
+                patch_cfgs.append(patch_cfg)
+        if len(patch_cfgs) == 0:
+            return
+        # convert the terrain mesh to warp mesh
+        wp_mesh = convert_to_warp_mesh(self.terrain_mesh.vertices, self.terrain_mesh.faces, device=self.device)
+        # sample the flat patches of all the search spaces
+        flat_patches = find_flat_patches_batched(
+            wp_mesh=wp_mesh,
+            num_patches=[patch_cfg.num_patches for patch_cfg in patch_cfgs],
+            patch_radius=[patch_cfg.patch_radius for patch_cfg in patch_cfgs],
+            origins=torch.tensor(np.array(origins), dtype=torch.float),
+            x_ranges=[patch_cfg.x_range for patch_cfg in patch_cfgs],
+            y_ranges=[patch_cfg.y_range for patch_cfg in patch_cfgs],
+            z_ranges=[patch_cfg.z_range for patch_cfg in patch_cfgs],
+            max_height_diff=[patch_cfg.max_height_diff for patch_cfg in patch_cfgs],
+            bounds=torch.tensor(np.array(bounds), dtype=torch.float),
+        )
+        # add the flat patches to the tensors
+        for (name, row, col), patches in zip(keys, flat_patches):
+            self.flat_patches[name][row, col] = patches
+
+    def _get_terrain_cache_key(self) -> str:
+        """Compute the key of the assembled terrain in the terrain cache.
+
+        The key depends on all the parameters that affect the generated terrain, including the resolved seed.
+        """
+        cfg_dict = self.cfg.to_dict()
+        # remove the parameters that do not affect the generated terrain
+        for name in ["num_workers", "use_cache", "cache_dir", "cache_terrain_mesh", "max_cache_size"]:
+            cfg_dict.pop(name)
+        return dict_to_md5_hash({"generator": cfg_dict, "seed": self._seed})
+
+    def _load_terrain_from_cache(self, key: str) -> bool:
+        """Load the assembled terrain from the terrain cache.
+
+        Args:
+            key: The key of the assembled terrain in the cache.
+
+        Returns:
+            True if the terrain was found in the cache, False otherwise.
+        """
+        arrays = TerrainCache(self.cfg.cache_dir).load(key)
+        if arrays is None:
+            return False
+        with Timer("[INFO] Loading terrain from cache took"):
+            # terrain mesh
+            # note: the sub-terrains are not stored separately
+            self.terrain_mesh = trimesh.Trimesh(
+                vertices=arrays["vertices"],
+                faces=arrays["faces"],
+                vertex_colors=arrays.get("vertex_colors"),
+                process=False,
+            )
+            self.terrain_meshes = [self.terrain_mesh]
+            # terrain origins
+            self.terrain_origins = np.array(arrays["terrain_origins"])
+            # flat patches
+            for name, value in arrays.items():
+                if name.startswith("flat_patches_"):
+                    self.flat_patches[name[len("flat_patches_") :]] = torch.tensor(
+                        np.asarray(value), device=self.device
+                    )
+            # height map
+            if self.cfg.build_height_map:
+                self.height_map = TerrainHeightMap(
+                    heights=torch.tensor(np.asarray(arrays["height_map_heights"]), device=self.device),
+                    valid=torch.tensor(np.asarray(arrays["height_map_valid"]), device=self.device),
+                    origin=(float(arrays["height_map_origin"][0]), float(arrays["height_map_origin"][1])),
+                    resolution=self.cfg.horizontal_scale,
                 )
+        # record the access to the cache
+        self._cache_keys.append(key)
+        return True
 
-        # transform the mesh to the correct position
-        transform = np.eye(4)
-        transform[0:2, -1] = (row + 0.5) * self.cfg.size[0], (col + 0.5) * self.cfg.size[1]
-        mesh.apply_transform(transform)
-        # add mesh to the list
-        self.terrain_meshes.append(mesh)
-        # add origin to the list
-        self.terrain_origins[row, col] = origin + transform[:3, -1]
+    def _save_terrain_to_cache(self, key: str):
+        """Save the assembled terrain into the terrain cache.
+
+        Args:
+            key: The key of the assembled terrain in the cache.
+        """
+        arrays = {
+            "vertices": self.terrain_mesh.vertices,
+            "faces": self.terrain_mesh.faces,
+            "terrain_origins": self.terrain_origins,
+        }
+        if self.cfg.color_scheme != "none":
+            arrays["vertex_colors"] = self.terrain_mesh.visual.vertex_colors
+        for name, value in self.flat_patches.items():
+            arrays[f"flat_patches_{name}"] = value.cpu().numpy()
+        if self.height_map is not None:
+            arrays["height_map_heights"] = self.height_map.heights.cpu().numpy()
+            arrays["height_map_valid"] = self.height_map.valid.cpu().numpy()
+            arrays["height_map_origin"] = np.array(self.height_map.origin)
+        TerrainCache(self.cfg.cache_dir).save(key, arrays, cfg=self.cfg)
+        # record the access to the cache
+        self._cache_keys.append(key)
+
+    def _init_height_map(self):
+        """Allocate the buffers for assembling the height map of the terrain."""
+        # number of cells of each sub-terrain
+        self._height_map_tile_shape = (
+            round(self.cfg.size[0] / self.cfg.horizontal_scale),
+            round(self.cfg.size[1] / self.cfg.horizontal_scale),
+        )
+        num_vertices = (
+            self.cfg.num_rows * self._height_map_tile_shape[0] + 1,
+            self.cfg.num_cols * self._height_map_tile_shape[1] + 1,
+        )
+        # heights at the vertices of the grid
+        self._height_map_heights = np.zeros(num_vertices, dtype=np.float32)
+        # vertices that are already set by a sub-terrain
+        self._height_map_written = np.zeros(num_vertices, dtype=bool)
+        # vertices where the mesh does not follow the grid
+        self._height_map_invalid = np.zeros(num_vertices, dtype=bool)
+        # cells covered by a height field sub-terrain
+        self._height_map_covered = np.zeros((num_vertices[0] - 1, num_vertices[1] - 1), dtype=bool)
 
-    def _get_terrain_mesh(self, difficulty: float, cfg: SubTerrainBaseCfg) -> tuple[trimesh.Trimesh, np.ndarray]:
+    def _add_to_height_map(self, mesh: trimesh.Trimesh, row: int, col: int):
+        """Add the height field of the input sub-terrain to the height map.
+
+        The sub-terrains that are not generated from a height field do not carry a height field. Their cells
+        remain invalid.
+
+        Args:
+            mesh: The mesh of the sub-terrain.
+            row: The row index of the sub-terrain.
+            col: The column index of the sub-terrain.
+        """
+        heights = mesh.metadata.get("height_field")
+        nx, ny = self._height_map_tile_shape
+        # check that the height field spans the sub-terrain on the grid of the height map
+        if heights is None or heights.shape != (nx + 1, ny + 1):
+            return
+        # vertices of the sub-terrain in the height map
+        # note: the vertices on the edges are shared with the neighboring sub-terrains
+        vertex_slice = (slice(row * nx, (row + 1) * nx + 1), slice(col * ny, (col + 1) * ny + 1))
+        # the shared vertices must have the same heights, otherwise the mesh has vertical surfaces there
+        written = self._height_map_written[vertex_slice]
+        conflicts = written & ~np.isclose(self._height_map_heights[vertex_slice], heights)
+        # store the heights
+        self._height_map_heights[vertex_slice] = heights
+        self._height_map_written[vertex_slice] = True
+        self._height_map_invalid[vertex_slice] |= mesh.metadata["height_field_moved"] | conflicts
+        self._height_map_covered[row * nx : (row + 1) * nx, col * ny : (col + 1) * ny] = True
+
+    def _create_height_map(self, origin: tuple[float, float]) -> TerrainHeightMap:
+        """Create the height map of the terrain from the assembled height fields.
+
+        Args:
+            origin: The position of the vertex ``(0, 0)`` of the grid in the terrain frame.
+
+        Returns:
+            The height map of the terrain.
+        """
+        # a cell is invalid if the triangles of any of its neighboring vertices do not follow the grid
+        # note: the slope correction moves the vertices by at most one cell along each axis. Thus, the
+        #   triangles of a moved vertex cover the cells up to two cells away from it.
+        num_cells = self._height_map_covered.shape
+        padded_invalid = np.pad(self._height_map_invalid, 2)
+        invalid = np.zeros(num_cells, dtype=bool)
+        for i in range(4):
+            for j in range(4):
+                invalid |= padded_invalid[1 + i : 1 + i + num_cells[0], 1 + j : 1 + j + num_cells[1]]
+        valid = self._height_map_covered & ~invalid
+        # create the height map
+        return TerrainHeightMap(
+            heights=torch.tensor(self._height_map_heights, device=self.device),
+            valid=torch.tensor(valid, device=self.device),
+            origin=(float(origin[0]), float(origin[1])),
+            resolution=self.cfg.horizontal_scale,
+        )
+
+    def _get_terrain_mesh(
+        self, difficulty: float, cfg: SubTerrainBaseCfg, seed: int | None = None
+    ) -> tuple[trimesh.Trimesh, np.ndarray]:
         """Generate a sub-terrain mesh based on the input difficulty parameter.
 
         If caching is enabled, the sub-terrain is cached and loaded from the cache if it exists.
@@ -340,48 +625,139 @@ class TerrainGenerator:
         Args:
             difficulty: The difficulty parameter.
             cfg: The configuration of the sub-terrain.
+            seed: The seed of the sub-terrain. Defaults to None, in which case the current state of NumPy's global
+                random number generator is used.
 
         Returns:
             The sub-terrain mesh and origin.
         """
-        # copy the configuration
-        cfg = cfg.copy()
-        # add other parameters to the sub-terrain configuration
-        cfg.difficulty = float(difficulty)
-        cfg.seed = self.cfg.seed
-        # generate hash for the sub-terrain
-        sub_terrain_hash = dict_to_md5_hash(cfg.to_dict())
-        # generate the file name
-        sub_terrain_cache_dir = os.path.join(self.cfg.cache_dir, sub_terrain_hash)
-        sub_terrain_obj_filename = os.path.join(sub_terrain_cache_dir, "mesh.obj")
-        sub_terrain_csv_filename = os.path.join(sub_terrain_cache_dir, "origin.csv")
-        sub_terrain_meta_filename = os.path.join(sub_terrain_cache_dir, "cfg.yaml")
-
-        # check if hash exists - if true, load the mesh and origin and return
-        if self.cfg.use_cache and os.path.exists(sub_terrain_obj_filename):
+        return _generate_sub_terrain(difficulty, cfg, self.cfg, seed)
+
+
+"""
+Sub-terrain generation.
+"""
+
+
+def _generate_sub_terrain(
+    difficulty: float, cfg: SubTerrainBaseCfg, generator_cfg: TerrainGeneratorCfg, seed: int | None
+) -> tuple[trimesh.Trimesh, np.ndarray]:
+    """Generate a sub-terrain mesh based on the input difficulty parameter.
+
+    This function is defined at the module level so that it can be called from the worker processes of the
+    terrain generator. See :meth:`TerrainGenerator._get_terrain_mesh` for more details.
+
+    Args:
+        difficulty: The difficulty parameter.
+        cfg: The configuration of the sub-terrain.
+        generator_cfg: The configuration of the terrain generator.
+        seed: The seed of the sub-terrain. If None, the current state of NumPy's global random number
+            generator is used.
+
+    Returns:
+        The sub-terrain mesh and origin.
+    """
+    # resolve the configuration and its key in the cache
+    cfg, sub_terrain_hash = _resolve_sub_terrain_cfg(difficulty, cfg, generator_cfg, seed)
+
+    # check if hash exists - if true, load the mesh and origin and return
+    if generator_cfg.use_cache:
+        arrays = TerrainCache(generator_cfg.cache_dir).load(sub_terrain_hash)
+        if arrays is not None:
             # load existing mesh
-            mesh = trimesh.load_mesh(sub_terrain_obj_filename, process=False)
-            origin = np.loadtxt(sub_terrain_csv_filename, delimiter=",")
+            mesh = trimesh.Trimesh(vertices=arrays["vertices"], faces=arrays["faces"], process=False)
+            # restore the height field of the mesh (if any)
+            for name in ["height_field", "height_field_moved"]:
+                if name in arrays:
+                    mesh.metadata[name] = np.asarray(arrays[name])
             # return the generated mesh
-            return mesh, origin
+            return mesh, np.array(arrays["origin"])
 
-        # generate the terrain
+    # generate the terrain
+    # note: the sub-terrain functions draw from the global random number generators
+    with _seeded_random_state(seed):
         meshes, origin = cfg.function(difficulty, cfg)
-        mesh = trimesh.util.concatenate(meshes)
-        # offset mesh such that they are in their center
-        transform = np.eye(4)
-        transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
-        mesh.apply_transform(transform)
-        # change origin to be in the center of the sub-terrain
-        origin += transform[0:3, -1]
+    mesh = trimesh.util.concatenate(meshes)
+    # offset mesh such that they are in their center
+    transform = np.eye(4)
+    transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
+    mesh.apply_transform(transform)
+    # change origin to be in the center of the sub-terrain
+    origin += transform[0:3, -1]
+
+    # if caching is enabled, save the mesh and origin
+    if generator_cfg.use_cache:
+        arrays = {"vertices": mesh.vertices, "faces": mesh.faces, "origin": origin}
+        for name in ["height_field", "height_field_moved"]:
+            if name in mesh.metadata:
+                arrays[name] = mesh.metadata[name]
+        TerrainCache(generator_cfg.cache_dir).save(sub_terrain_hash, arrays, cfg=cfg)
+    # return the generated mesh
+    return mesh, origin
+
+
+def _resolve_sub_terrain_cfg(
+    difficulty: float, cfg: SubTerrainBaseCfg, generator_cfg: TerrainGeneratorCfg, seed: int | None
+) -> tuple[SubTerrainBaseCfg, str]:
+    """Resolve the configuration of a sub-terrain and its key in the terrain cache.
+
+    Args:
+        difficulty: The difficulty parameter.
+        cfg: The configuration of the sub-terrain.
+        generator_cfg: The configuration of the terrain generator.
+        seed: The seed of the sub-terrain. If None, the seed of the terrain generator is used for the key.
+
+    Returns:
+        The configuration of the sub-terrain with its difficulty and seed, and its key in the terrain cache.
+    """
+    # copy the configuration
+    cfg = cfg.copy()
+    # add other parameters to the sub-terrain configuration
+    cfg.difficulty = float(difficulty)
+    cfg.seed = seed if seed is not None else generator_cfg.seed
+    # generate hash for the sub-terrain
+    return cfg, dict_to_md5_hash(cfg.to_dict())
 
-        # if caching is enabled, save the mesh and origin
-        if self.cfg.use_cache:
-            # create the cache directory
-            os.makedirs(sub_terrain_cache_dir, exist_ok=True)
-            # save the data
-            mesh.export(sub_terrain_obj_filename)
-            np.savetxt(sub_terrain_csv_filename, origin, delimiter=",", header="x,y,z")
-            dump_yaml(sub_terrain_meta_filename, cfg)
-        # return the generated mesh
-        return mesh, origin
+
+@contextlib.contextmanager
+def _seeded_random_state(seed: int | None):
+    """Context manager to seed the global random number generators of NumPy and PyTorch (on CPU).
+
+    The states of the generators are restored when leaving the context so that the random numbers drawn
+    elsewhere are not affected.
+
+    Args:
+        seed: The seed of the generators. If None, the generators are left untouched.
+    """
+    if seed is None:
+        yield
+        return
+    numpy_state = np.random.get_state()
+    with torch.random.fork_rng(devices=[]):
+        np.random.seed(seed)
+        torch.random.default_generator.manual_seed(seed)
+        try:
+            yield
+        finally:
+            np.random.set_state(numpy_state)
+
+
+def _generate_sub_terrain_arrays(
+    difficulty: float, cfg: SubTerrainBaseCfg, generator_cfg: TerrainGeneratorCfg, seed: int | None
+) -> tuple[np.ndarray, np.ndarray, dict, np.ndarray]:
+    """Generate a sub-terrain mesh and return it as arrays.
+
+    This function is called in the worker processes of the terrain generator. The mesh is returned as arrays
+    since these are cheaper to send back to the main process than the mesh object.
+
+    Args:
+        difficulty: The difficulty parameter.
+        cfg: The configuration of the sub-terrain.
+        generator_cfg: The configuration of the terrain generator.
+        seed: The seed of the sub-terrain.
+
+    Returns:
+        The vertices, faces and metadata of the sub-terrain mesh, and the origin of the sub-terrain.
+    """
+    mesh, origin = _generate_sub_terrain(difficulty, cfg, generator_cfg, seed)
+    return np.asarray(mesh.vertices), np.asarray(mesh.faces), mesh.metadata, origin
@@ -170,6 +170,14 @@ class TerrainGeneratorCfg:
     This value is passed on to all the height field sub-terrain configurations.
     """
 
+    build_height_map: bool = False
+    """Whether to assemble the height fields of the sub-terrains into a dense height map. Defaults to False.
+
+    The height map allows looking up the height of the terrain instead of ray-casting against its mesh (see
+    :attr:`omni.isaac.lab.sensors.RayCasterCfg.use_height_map`). Only the height field sub-terrains are part
+    of the height map. The regions covered by other sub-terrains are marked as invalid.
+    """
+
     sub_terrains: dict[str, SubTerrainBaseCfg] = MISSING
     """Dictionary of sub-terrain configurations.
 
@@ -184,13 +192,43 @@ class TerrainGeneratorCfg:
     of difficulty. Otherwise, the terrains will be generated based on this range in a random order.
     """
 
+    num_workers: int = 1
+    """The number of worker processes used to generate the sub-terrains. Defaults to 1.
+
+    If greater than one, the sub-terrains are generated in a pool of worker processes and assembled in the main
+    process. Each sub-terrain is generated with a seed derived from :attr:`seed` and its row and column indices.
+    Thus, the generated terrain is the same for any number of workers.
+
+    Note:
+        The worker processes are forked from the main process. On platforms that do not support forking
+        (such as Windows), the sub-terrains are generated in the main process.
+    """
+
     use_cache: bool = False
     """Whether to load the sub-terrain from cache if it exists. Defaults to True.
 
     If enabled, the generated terrains are stored in the cache directory. When generating terrains, the cache
     is checked to see if the terrain already exists. If it does, the terrain is loaded from the cache. Otherwise,
     the terrain is generated and stored in the cache. Caching can be used to speed up terrain generation.
+
+    The cache stores the meshes as binary arrays that are memory-mapped when loading. Its entries are keyed by the
+    MD5 hash of the configuration that generated them.
     """
 
     cache_dir: str = "/tmp/isaaclab/terrains"
     """The directory where the terrain cache is stored. Defaults to "/tmp/isaaclab/terrains"."""
+
+    cache_terrain_mesh: bool = True
+    """Whether to also cache the assembled terrain if :attr:`use_cache` is True. Defaults to True.
+
+    If enabled, the assembled terrain mesh is stored in the cache together with the origins and the flat patches
+    of the sub-terrains (and the height map, if built). When loading the terrain from the cache, the generation
+    of the sub-terrains, the sampling of the flat patches and the assembly of the terrain are skipped.
+    """
+
+    max_cache_size: float | None = None
+    """The maximum size of the cache directory (in GB). Defaults to None, in which case the cache is unbounded.
+
+    If the cache exceeds this size, the least recently used entries are removed after generating the terrain.
+    The entries used by the current terrain are never removed.
+    """
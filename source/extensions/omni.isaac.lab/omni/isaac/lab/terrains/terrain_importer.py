@@ -8,8 +8,10 @@ from __future__ import annotations
 import numpy as np
 import torch
 import trimesh
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import TYPE_CHECKING, ClassVar
 
+import omni.isaac.core.utils.prims as prim_utils
 import warp
 from pxr import UsdGeom
 
@@ -18,6 +20,8 @@ from omni.isaac.lab.markers import VisualizationMarkers
 from omni.isaac.lab.markers.config import FRAME_MARKER_CFG
 from omni.isaac.lab.utils.warp import convert_to_warp_mesh
 
+from .height_map import TerrainHeightMap
+from .terrain_curriculum import TerrainCurriculum
 from .terrain_generator import TerrainGenerator
 from .trimesh.utils import make_plane
 from .utils import create_prim_from_mesh
@@ -41,6 +45,13 @@ class TerrainImporter:
     If a curriculum is used, it is possible to update the environment origins to terrain origins that correspond
     to a harder difficulty. This is done by calling :func:`update_terrain_levels`. The idea comes from game-based
     curriculum. For example, in a game, the player starts with easy levels and progresses to harder levels.
+
+    If :attr:`TerrainImporterCfg.tiled` is True, the generated terrain is split into one mesh per sub-terrain
+    (tile). Only the tiles occupied by the environment origins (and their neighbors) are imported into the
+    simulator, together with the border of the terrain. The set of resident tiles is updated whenever the
+    environment origins change and the least recently used tiles are removed once there are more than
+    :attr:`TerrainImporterCfg.max_resident_tiles`. The mesh ``"terrain"`` in :attr:`meshes` and
+    :attr:`warp_meshes` then contains the resident tiles only.
     """
 
     meshes: dict[str, trimesh.Trimesh]
@@ -54,6 +65,30 @@ class TerrainImporter:
     """
     env_origins: torch.Tensor
     """The origins of the environments. Shape is (num_envs, 3)."""
+    height_map: TerrainHeightMap | None
+    """The dense height map of the terrain. Defaults to None.
+
+    The height map is only available for the terrains created by the terrain generator with
+    :attr:`TerrainGeneratorCfg.build_height_map` enabled. It is expressed in the frame of the terrain prim.
+    """
+    height_maps: ClassVar[dict[str, TerrainHeightMap]] = {}
+    """The height maps of all the imported terrains.
+
+    The keys correspond to the prim paths of the terrain importers (:attr:`TerrainImporterCfg.prim_path`), and
+    the values are the corresponding height maps. This allows the ray-casting sensors to look up the heights of
+    a terrain from its prim path.
+    """
+    tiled_terrains: ClassVar[dict[str, TerrainImporter]] = {}
+    """The imported terrains that are tiled (see :attr:`TerrainImporterCfg.tiled`).
+
+    The keys correspond to the prim paths of the terrain importers, and the values are the terrain importers.
+    This allows the ray-casting sensors to follow the warp mesh of the resident tiles, which changes over time.
+    """
+    tiles_version: int
+    """The number of times the resident tiles were updated. Defaults to 0.
+
+    This is only incremented for tiled terrains. It allows to detect when the warp mesh of the terrain changed.
+    """
 
     def __init__(self, cfg: TerrainImporterCfg):
         """Initialize the terrain importer.
@@ -76,8 +111,14 @@ class TerrainImporter:
         self.warp_meshes = dict()
         self.env_origins = None
         self.terrain_origins = None
+        self.height_map = None
+        self.tiles_version = 0
         # private variables
         self._terrain_flat_patches = dict()
+        self._tile_meshes: dict[tuple[int, int], trimesh.Trimesh] = dict()
+        self._border_mesh: trimesh.Trimesh | None = None
+        self._resident_tiles: OrderedDict[tuple[int, int], None] = OrderedDict()
+        self._occupied_tiles: torch.Tensor | None = None
 
         # auto-import the terrain based on the config
         if self.cfg.terrain_type == "generator":
@@ -86,11 +127,20 @@ class TerrainImporter:
                 raise ValueError("Input terrain type is 'generator' but no value provided for 'terrain_generator'.")
             # generate the terrain
             terrain_generator = TerrainGenerator(cfg=self.cfg.terrain_generator, device=self.device)
-            self.import_mesh("terrain", terrain_generator.terrain_mesh)
+            if self.cfg.tiled:
+                # split the terrain into tiles that are imported on demand
+                self.import_tiles(terrain_generator.terrain_mesh, self.cfg.terrain_generator.size)
+                TerrainImporter.tiled_terrains[self.cfg.prim_path] = self
+            else:
+                self.import_mesh("terrain", terrain_generator.terrain_mesh)
             # configure the terrain origins based on the terrain generator
             self.configure_env_origins(terrain_generator.terrain_origins)
             # refer to the flat patches
             self._terrain_flat_patches = terrain_generator.flat_patches
+            # register the height map
+            if terrain_generator.height_map is not None:
+                self.height_map = terrain_generator.height_map
+                TerrainImporter.height_maps[self.cfg.prim_path] = self.height_map
         elif self.cfg.terrain_type == "usd":
             # check if config is provided
             if self.cfg.usd_path is None:
@@ -133,6 +183,15 @@ class TerrainImporter:
         """
         return self._terrain_flat_patches
 
+    @property
+    def resident_tiles(self) -> list[tuple[int, int]]:
+        """The (row, column) indices of the tiles imported into the simulator.
+
+        The tiles are sorted from the least to the most recently used. This is only available if the terrain is
+        tiled. For other terrains, the function returns an empty list.
+        """
+        return list(self._resident_tiles.keys())
+
     """
     Operations - Visibility.
     """
@@ -232,6 +291,63 @@ class TerrainImporter:
             physics_material=self.cfg.physics_material,
         )
 
+    def import_tiles(self, mesh: trimesh.Trimesh, size: tuple[float, float]):
+        """Split a terrain mesh into tiles that are imported into the simulator on demand.
+
+        The mesh is assumed to be centered at the origin and to comprise of sub-terrains of the given size
+        arranged in a grid, with the number of rows and columns of the terrain origins. Each face of the mesh is
+        assigned to the tile that contains its center. The faces outside of the grid form the border of the
+        terrain, which is imported directly under the prim path ``cfg.prim_path/border``.
+
+        The tiles are imported under the prim paths ``cfg.prim_path/tile_{row}_{col}`` once they are occupied by
+        an environment (see :meth:`configure_env_origins` and :meth:`update_env_origins`).
+
+        Args:
+            mesh: The terrain mesh to split.
+            size: The size of the sub-terrains along the x and y axes (in m).
+
+        Raises:
+            ValueError: If a terrain with the key ``"terrain"`` already exists.
+        """
+        # check if key exists
+        if "terrain" in self.meshes:
+            raise ValueError(f"Mesh with key terrain already exists. Existing keys: {self.meshes.keys()}.")
+        num_rows, num_cols = self.cfg.terrain_generator.num_rows, self.cfg.terrain_generator.num_cols
+        # compute the tile of each face from its center
+        # note: the faces outside of the grid are assigned to the border (last index)
+        centers = mesh.triangles_center
+        rows = np.floor(centers[:, 0] / size[0] + 0.5 * num_rows).astype(np.int64)
+        cols = np.floor(centers[:, 1] / size[1] + 0.5 * num_cols).astype(np.int64)
+        inside = (rows >= 0) & (rows < num_rows) & (cols >= 0) & (cols < num_cols)
+        tile_ids = np.where(inside, rows * num_cols + cols, num_rows * num_cols)
+        # group the faces by tile
+        order = np.argsort(tile_ids, kind="stable")
+        splits = np.cumsum(np.bincount(tile_ids, minlength=num_rows * num_cols + 1))[:-1]
+        vertex_colors = mesh.visual.vertex_colors if mesh.visual.kind == "vertex" else None
+        for tile_id, face_ids in enumerate(np.split(order, splits)):
+            if len(face_ids) == 0:
+                continue
+            # extract the vertices of the tile
+            vertex_ids, faces = np.unique(mesh.faces[face_ids], return_inverse=True)
+            tile_mesh = trimesh.Trimesh(
+                vertices=mesh.vertices[vertex_ids],
+                faces=faces.reshape(-1, 3),
+                vertex_colors=vertex_colors[vertex_ids] if vertex_colors is not None else None,
+                process=False,
+            )
+            if tile_id < num_rows * num_cols:
+                self._tile_meshes[divmod(tile_id, num_cols)] = tile_mesh
+            else:
+                self._border_mesh = tile_mesh
+        # import the border of the terrain
+        if self._border_mesh is not None:
+            create_prim_from_mesh(
+                self.cfg.prim_path + "/border",
+                self._border_mesh,
+                visual_material=self.cfg.visual_material,
+                physics_material=self.cfg.physics_material,
+            )
+
     def import_usd(self, key: str, usd_path: str):
         """Import a mesh from a USD file.
 
@@ -294,6 +410,9 @@ class TerrainImporter:
             self.terrain_origins = origins.to(self.device, dtype=torch.float)
             # compute environment origins
             self.env_origins = self._compute_env_origins_curriculum(self.cfg.num_envs, self.terrain_origins)
+            # import the tiles occupied by the environments
+            if self.cfg.tiled:
+                self._update_resident_tiles()
         else:
             self.terrain_origins = None
             # check if env spacing is valid
@@ -308,16 +427,12 @@ class TerrainImporter:
         if self.terrain_origins is None:
             return
         # update terrain level for the envs
-        self.terrain_levels[env_ids] += 1 * move_up - 1 * move_down
-        # robots that solve the last level are sent to a random one
-        # the minimum level is zero
-        self.terrain_levels[env_ids] = torch.where(
-            self.terrain_levels[env_ids] >= self.max_terrain_level,
-            torch.randint_like(self.terrain_levels[env_ids], self.max_terrain_level),
-            torch.clip(self.terrain_levels[env_ids], 0),
-        )
+        self.curriculum.update(env_ids, move_up, move_down)
         # update the env origins
-        self.env_origins[env_ids] = self.terrain_origins[self.terrain_levels[env_ids], self.terrain_types[env_ids]]
+        self.env_origins[env_ids] = self.curriculum.get_origins(env_ids)
+        # import the tiles occupied by the environments
+        if self.cfg.tiled:
+            self._update_resident_tiles()
 
     """
     Internal helpers.
@@ -325,26 +440,90 @@ class TerrainImporter:
 
     def _compute_env_origins_curriculum(self, num_envs: int, origins: torch.Tensor) -> torch.Tensor:
         """Compute the origins of the environments defined by the sub-terrains origins."""
-        # extract number of rows and cols
-        num_rows, num_cols = origins.shape[:2]
-        # maximum initial level possible for the terrains
-        if self.cfg.max_init_terrain_level is None:
-            max_init_level = num_rows - 1
-        else:
-            max_init_level = min(self.cfg.max_init_terrain_level, num_rows - 1)
+        # create the curriculum over the terrain levels
+        self.curriculum = TerrainCurriculum(
+            self.cfg.curriculum, origins, num_envs, max_init_level=self.cfg.max_init_terrain_level
+        )
         # store maximum terrain level possible
-        self.max_terrain_level = num_rows
-        # define all terrain levels and types available
-        self.terrain_levels = torch.randint(0, max_init_level + 1, (num_envs,), device=self.device)
-        self.terrain_types = torch.div(
-            torch.arange(num_envs, device=self.device),
-            (num_envs / num_cols),
-            rounding_mode="floor",
-        ).to(torch.long)
-        # create tensor based on number of environments
-        env_origins = torch.zeros(num_envs, 3, device=self.device)
-        env_origins[:] = origins[self.terrain_levels, self.terrain_types]
-        return env_origins
+        self.max_terrain_level = self.curriculum.num_levels
+        # refer to the terrain levels and types of the environments
+        # note: the curriculum updates these tensors in-place
+        self.terrain_levels = self.curriculum.levels
+        self.terrain_types = self.curriculum.types
+        # look up the origins of the environments
+        return self.curriculum.get_origins()
+
+    def _update_resident_tiles(self):
+        """Import the tiles occupied by the environments and remove the least recently used ones.
+
+        The tiles occupied by the environments and their neighbors (see :attr:`TerrainImporterCfg.tile_neighborhood`)
+        are marked as used. The missing ones are imported into the simulator. If there are more resident tiles
+        than :attr:`TerrainImporterCfg.max_resident_tiles`, the least recently used tiles that are not occupied are
+        removed. If the resident tiles changed, the mesh of the terrain and its warp mesh are rebuilt from the
+        resident tiles.
+
+        The occupied tiles are compared with the ones of the previous call on the device. If they are the same,
+        the method returns without reading the tiles back to the host.
+        """
+        num_rows, num_cols = self.terrain_origins.shape[:2]
+        # find the tiles occupied by the environments and their neighbors
+        occupied = torch.zeros(num_rows, num_cols, device=self.device)
+        occupied[self.terrain_levels, self.terrain_types] = 1.0
+        if self.cfg.tile_neighborhood > 0:
+            kernel_size = 2 * self.cfg.tile_neighborhood + 1
+            occupied = torch.nn.functional.max_pool2d(
+                occupied[None, None], kernel_size, stride=1, padding=self.cfg.tile_neighborhood
+            )[0, 0]
+        # check if the occupied tiles changed
+        # note: only the result of the comparison is transferred to the host
+        occupied = occupied > 0
+        if self._occupied_tiles is not None and torch.equal(occupied, self._occupied_tiles):
+            return
+        self._occupied_tiles = occupied
+        required = [tuple(tile) for tile in occupied.nonzero().tolist()]
+        # mark the resident tiles as used and collect the missing ones
+        missing = list()
+        for tile in required:
+            if tile in self._resident_tiles:
+                self._resident_tiles.move_to_end(tile)
+            else:
+                missing.append(tile)
+        # remove the least recently used tiles
+        # note: the required tiles were moved to the end, so the eviction stops at the first one
+        evicted = list()
+        if self.cfg.max_resident_tiles is not None:
+            required_set = set(required)
+            num_evicted = len(self._resident_tiles) + len(missing) - self.cfg.max_resident_tiles
+            for tile in self._resident_tiles:
+                if len(evicted) >= num_evicted or tile in required_set:
+                    break
+                evicted.append(tile)
+        # check if the resident tiles changed
+        if len(missing) == 0 and len(evicted) == 0:
+            return
+        for tile in evicted:
+            del self._resident_tiles[tile]
+            if tile in self._tile_meshes:
+                prim_utils.delete_prim(self.cfg.prim_path + f"/tile_{tile[0]}_{tile[1]}")
+        for tile in missing:
+            self._resident_tiles[tile] = None
+            if tile in self._tile_meshes:
+                create_prim_from_mesh(
+                    self.cfg.prim_path + f"/tile_{tile[0]}_{tile[1]}",
+                    self._tile_meshes[tile],
+                    visual_material=self.cfg.visual_material,
+                    physics_material=self.cfg.physics_material,
+                )
+        # rebuild the mesh of the resident tiles
+        meshes = [self._tile_meshes[tile] for tile in self._resident_tiles if tile in self._tile_meshes]
+        if self._border_mesh is not None:
+            meshes.append(self._border_mesh)
+        self.meshes["terrain"] = trimesh.util.concatenate(meshes)
+        device = "cuda" if "cuda" in self.device else "cpu"
+        self.warp_meshes["terrain"] = convert_to_warp_mesh(
+            self.meshes["terrain"].vertices, self.meshes["terrain"].faces, device=device
+        )
+        self.tiles_version += 1
 
     def _compute_env_origins_grid(self, num_envs: int, env_spacing: float) -> torch.Tensor:
         """Compute the origins of the environments in a grid based on configured spacing."""
@@ -17,6 +17,44 @@ if TYPE_CHECKING:
     from .terrain_generator_cfg import TerrainGeneratorCfg
 
 
+@configclass
+class TerrainCurriculumCfg:
+    """Configuration for the curriculum over the terrain levels.
+
+    Please check the class :class:`omni.isaac.lab.terrains.TerrainCurriculum` for more details.
+    """
+
+    promotion_policy: Literal["deterministic", "stochastic", "adaptive"] = "deterministic"
+    """The policy deciding whether the environments move between levels. Defaults to "deterministic".
+
+    Available options are "deterministic", "stochastic", and "adaptive".
+    """
+
+    promotion_probability: float = 1.0
+    """The probability of moving an environment that solved its level to the next level. Defaults to 1.0.
+
+    Used by the "stochastic" policy, and as the maximum probability by the "adaptive" policy.
+    """
+
+    demotion_probability: float = 1.0
+    """The probability of moving an environment that failed its level to the previous level. Defaults to 1.0.
+
+    Used by the "stochastic" policy, and as the maximum probability by the "adaptive" policy.
+    """
+
+    target_success_rate: float = 0.5
+    """The success rate of a level at which the "adaptive" policy moves the environments with the maximum
+    probabilities. Defaults to 0.5.
+
+    Below it, the probability of promotion decreases linearly with the success rate. Above it, the probability
+    of demotion decreases linearly with the failure rate. It must be in the range (0, 1).
+    """
+
+    success_rate_smoothing: float = 0.05
+    """The smoothing factor of the exponential moving averages of the success rates of the levels.
+    Defaults to 0.05."""
+
+
 @configclass
 class TerrainImporterCfg:
     """Configuration for the terrain manager."""
@@ -95,5 +133,38 @@ class TerrainImporterCfg:
       This parameter is used only when sub-terrain origins are defined.
     """
 
+    tiled: bool = False
+    """Whether to import the sub-terrains as tiles on demand. Defaults to False.
+
+    If True, the generated terrain is split into one mesh per sub-terrain (tile) and only the tiles occupied by
+    the environment origins are imported into the simulator. This reduces the memory usage and the import time
+    of large terrains, since each environment only occupies a few tiles at a time.
+
+    Note:
+      This parameter is used only when the ``terrain_type`` is ``"generator"``.
+    """
+
+    tile_neighborhood: int = 1
+    """The number of tiles around each occupied tile that are imported as well. Defaults to 1.
+
+    The neighboring tiles allow the robots to leave the tile of their environment origin. This parameter
+    is used only when :attr:`tiled` is True.
+    """
+
+    max_resident_tiles: int | None = None
+    """The maximum number of tiles kept in the simulator. Defaults to None, in which case no tile is removed.
+
+    Once exceeded, the least recently used tiles that are not occupied by any environment are removed. The
+    occupied tiles are never removed, even if they exceed this number. This parameter is used only when
+    :attr:`tiled` is True.
+    """
+
+    curriculum: TerrainCurriculumCfg = TerrainCurriculumCfg()
+    """The configuration of the curriculum over the terrain levels.
+
+    Note:
+      This parameter is used only when sub-terrain origins are defined.
+    """
+
     debug_vis: bool = False
     """Whether to enable visualization of terrain origins for the terrain. Defaults to False."""
@@ -290,7 +290,9 @@ def random_grid_terrain(
     num_boxes_y = int(cfg.size[1] / cfg.grid_width)
     # constant parameters
     terrain_height = 1.0
-    device = torch.device("cuda") if torch.cuda.is_available() else torch.device("cpu")
+    # note: the grid is created on the CPU so that the terrain does not depend on the device and can be
+    #   generated in the worker processes of the terrain generator (which cannot use CUDA)
+    device = torch.device("cpu")
 
     # generate the border
     border_width = cfg.size[0] - min(num_boxes_x, num_boxes_y) * cfg.grid_width
@@ -156,6 +156,8 @@ def find_flat_patches(
     3. Reject patches that are outside the z range or have a height difference that is too large.
     4. Keep sampling until all patches are valid.
 
+    To find patches for several search spaces at once, use :func:`find_flat_patches_batched`.
+
     Args:
         wp_mesh: The warp mesh to find patches in.
         num_patches: The desired number of patches to find.
@@ -178,66 +180,137 @@ def find_flat_patches(
     """
     # set device to warp mesh device
     device = wp.device_to_torch(wp_mesh.device)
-
-    # resolve inputs to consistent type
-    # -- patch radii
-    if isinstance(patch_radius, float):
-        patch_radius = [patch_radius]
-    # -- origin
+    # resolve the origin to a tensor
     if isinstance(origin, np.ndarray):
         origin = torch.from_numpy(origin).to(torch.float).to(device)
     elif isinstance(origin, torch.Tensor):
-        origin = origin.to(device)
+        origin = origin.to(torch.float).to(device)
     else:
         origin = torch.tensor(origin, dtype=torch.float, device=device)
 
-    # create ranges for the x and y coordinates around the origin.
-    # The provided ranges are bounded by the mesh's bounding box.
-    x_range = (
-        max(x_range[0] + origin[0].item(), wp_mesh.points.numpy()[:, 0].min()),
-        min(x_range[1] + origin[0].item(), wp_mesh.points.numpy()[:, 0].max()),
-    )
-    y_range = (
-        max(y_range[0] + origin[1].item(), wp_mesh.points.numpy()[:, 1].min()),
-        min(y_range[1] + origin[1].item(), wp_mesh.points.numpy()[:, 1].max()),
-    )
-    z_range = (
-        z_range[0] + origin[2].item(),
-        z_range[1] + origin[2].item(),
-    )
+    return find_flat_patches_batched(
+        wp_mesh=wp_mesh,
+        num_patches=[num_patches],
+        patch_radius=[patch_radius],
+        origins=origin.view(1, 3),
+        x_ranges=[x_range],
+        y_ranges=[y_range],
+        z_ranges=[z_range],
+        max_height_diff=[max_height_diff],
+    )[0]
+
+
+def find_flat_patches_batched(
+    wp_mesh: wp.Mesh,
+    num_patches: list[int],
+    patch_radius: list[float | list[float]],
+    origins: torch.Tensor,
+    x_ranges: list[tuple[float, float]],
+    y_ranges: list[tuple[float, float]],
+    z_ranges: list[tuple[float, float]],
+    max_height_diff: list[float],
+    bounds: torch.Tensor | None = None,
+    max_iterations: int = 10000,
+) -> list[torch.Tensor]:
+    """Finds flat patches in the input mesh for multiple search spaces at once.
+
+    This function performs the same rejection sampling as :func:`find_flat_patches` for a batch of search
+    spaces, such as the sub-terrains of a terrain and their patch configurations. At each iteration, the
+    patches that are still invalid in all the search spaces are re-sampled and checked with a single ray-cast
+    against the mesh. The bounding box of the mesh is computed only once.
+
+    Each search space is defined by its origin, the ranges around it and the parameters of the patches.
+    The x and y ranges are bounded by the corresponding entry of :attr:`bounds`, or by the bounding box of
+    the mesh if it is not provided.
+
+    Args:
+        wp_mesh: The warp mesh to find patches in.
+        num_patches: The desired number of patches to find for each search space.
+        patch_radius: The radii used to form patches for each search space. If a list is provided,
+            multiple patch sizes are checked.
+        origins: The origins of the search spaces in the mesh frame. Shape is (N, 3).
+        x_ranges: The ranges of X coordinates to sample from for each search space.
+        y_ranges: The ranges of Y coordinates to sample from for each search space.
+        z_ranges: The ranges of valid Z coordinates used for filtering patches for each search space.
+        max_height_diff: The maximum allowable distance between the lowest and highest points
+            on a patch for each search space.
+        bounds: The lower and upper XY-coordinates of the region to sample from for each search space
+            in the mesh frame. Shape is (N, 2, 2). Defaults to None, in which case the bounding box of the
+            mesh is used.
+        max_iterations: The maximum number of sampling iterations. Defaults to 10000.
+
+    Returns:
+        A list with a tensor of shape (num_patches, 3) for each search space containing the flat patches.
+        The patches are defined relative to the origin of their search space.
+
+    Raises:
+        RuntimeError: If the function fails to find valid patches. This can happen if the input parameters
+            are not suitable for finding valid patches and maximum number of iterations is reached.
+    """
+    # set device to warp mesh device
+    device = wp.device_to_torch(wp_mesh.device)
+    origins = origins.to(torch.float).to(device)
+    num_spaces = len(num_patches)
+
+    # resolve the region to sample from for each search space
+    if bounds is None:
+        points = wp.to_torch(wp_mesh.points)
+        mesh_bounds = torch.stack([points[:, :2].min(dim=0)[0], points[:, :2].max(dim=0)[0]])
+        bounds = mesh_bounds.unsqueeze(0).repeat(num_spaces, 1, 1)
+    else:
+        bounds = bounds.to(torch.float).to(device)
+    # -- ranges around the origins, bounded by the region. dim: (N, 2)
+    x_ranges = torch.tensor(x_ranges, dtype=torch.float, device=device) + origins[:, 0:1]
+    y_ranges = torch.tensor(y_ranges, dtype=torch.float, device=device) + origins[:, 1:2]
+    z_ranges = torch.tensor(z_ranges, dtype=torch.float, device=device) + origins[:, 2:3]
+    x_ranges[:, 0] = torch.maximum(x_ranges[:, 0], bounds[:, 0, 0])
+    x_ranges[:, 1] = torch.minimum(x_ranges[:, 1], bounds[:, 1, 0])
+    y_ranges[:, 0] = torch.maximum(y_ranges[:, 0], bounds[:, 0, 1])
+    y_ranges[:, 1] = torch.minimum(y_ranges[:, 1], bounds[:, 1, 1])
 
     # create a circle of points around (0, 0) to query validity of the patches
     # the ring of points is uniformly distributed around the circle
+    # note: the rings of the search spaces with fewer radii are padded by repeating their last radius,
+    #   which does not change the minimum and maximum heights of the patch
+    patch_radius = [[radius] if isinstance(radius, (int, float)) else list(radius) for radius in patch_radius]
+    max_num_radii = max(len(radii) for radii in patch_radius)
+    radii = torch.tensor(
+        [radii + [radii[-1]] * (max_num_radii - len(radii)) for radii in patch_radius], device=device
+    )  # dim: (N, max_num_radii)
     angle = torch.linspace(0, 2 * np.pi, 10, device=device)
-    query_x = []
-    query_y = []
-    for radius in patch_radius:
-        query_x.append(radius * torch.cos(angle))
-        query_y.append(radius * torch.sin(angle))
-    query_x = torch.cat(query_x).unsqueeze(1)  # dim: (num_radii * 10, 1)
-    query_y = torch.cat(query_y).unsqueeze(1)  # dim: (num_radii * 10, 1)
-    # dim: (num_radii * 10, 3)
-    query_points = torch.cat([query_x, query_y, torch.zeros_like(query_x)], dim=-1)
+    # dim: (N, max_num_radii * 10)
+    query_x = (radii.unsqueeze(-1) * torch.cos(angle)).flatten(1)
+    query_y = (radii.unsqueeze(-1) * torch.sin(angle)).flatten(1)
+    # dim: (N, max_num_radii * 10, 3)
+    query_points = torch.stack([query_x, query_y, torch.zeros_like(query_x)], dim=-1)
+
+    # expand the parameters of the search spaces to their patches
+    num_patches_tensor = torch.tensor(num_patches, device=device)
+    space_ids = torch.repeat_interleave(torch.arange(num_spaces, device=device), num_patches_tensor)
+    max_height_diff = torch.tensor(max_height_diff, dtype=torch.float, device=device)
 
     # create buffers
     # -- a buffer to store indices of points that are not valid
-    points_ids = torch.arange(num_patches, device=device)
+    points_ids = torch.arange(len(space_ids), device=device)
     # -- a buffer to store the flat patches locations
-    flat_patches = torch.zeros(num_patches, 3, device=device)
+    flat_patches = torch.zeros(len(space_ids), 3, device=device)
 
     # sample points and raycast to find the height.
     # 1. Reject points that are outside the z_range or have a height difference that is too large.
     # 2. Keep sampling until all points are valid.
     iter_count = 0
-    while len(points_ids) > 0 and iter_count < 10000:
+    while len(points_ids) > 0 and iter_count < max_iterations:
+        patch_space_ids = space_ids[points_ids]
         # sample points in the 2D region around the origin
-        pos_x = torch.empty(len(points_ids), device=device).uniform_(*x_range)
-        pos_y = torch.empty(len(points_ids), device=device).uniform_(*y_range)
-        flat_patches[points_ids, :2] = torch.stack([pos_x, pos_y], dim=-1)
+        x_range = x_ranges[patch_space_ids]
+        y_range = y_ranges[patch_space_ids]
+        pos = torch.rand(len(points_ids), 2, device=device)
+        flat_patches[points_ids, 0] = x_range[:, 0] + pos[:, 0] * (x_range[:, 1] - x_range[:, 0])
+        flat_patches[points_ids, 1] = y_range[:, 0] + pos[:, 1] * (y_range[:, 1] - y_range[:, 0])
 
         # define the query points to check validity of the patch
-        # dim: (num_patches, num_radii * 10, 3)
-        points = flat_patches[points_ids].unsqueeze(1) + query_points
+        # dim: (num_patches, max_num_radii * 10, 3)
+        points = flat_patches[points_ids].unsqueeze(1) + query_points[patch_space_ids]
         points[..., 2] = 100.0
         # ray-cast direction is downwards
         dirs = torch.zeros_like(points)
@@ -253,9 +326,14 @@ def find_flat_patches(
 
         # check validity
         # -- height is within the z range
-        not_valid = torch.any(torch.logical_or(heights < z_range[0], heights > z_range[1]), dim=1)
+        z_range = z_ranges[patch_space_ids]
+        not_valid = torch.any(
+            torch.logical_or(heights < z_range[:, 0:1], heights > z_range[:, 1:2]),
+            dim=1,
+        )
         # -- height difference is within the max height difference
-        not_valid = torch.logical_or(not_valid, (heights.max(dim=1)[0] - heights.min(dim=1)[0]) > max_height_diff)
+        height_diff = heights.max(dim=1)[0] - heights.min(dim=1)[0]
+        not_valid = torch.logical_or(not_valid, height_diff > max_height_diff[patch_space_ids])
 
         # remove invalid patches indices
         points_ids = points_ids[not_valid]
@@ -264,12 +342,14 @@ def find_flat_patches(
 
     # check all patches are valid
     if len(points_ids) > 0:
+        invalid_space_ids = torch.unique(space_ids[points_ids]).tolist()
         raise RuntimeError(
             "Failed to find valid patches! Please check the input parameters."
             f"\n\tMaximum number of iterations reached: {iter_count}"
             f"\n\tNumber of invalid patches: {len(points_ids)}"
-            f"\n\tMaximum height difference: {max_height_diff}"
+            f"\n\tMaximum height difference: {[max_height_diff[i].item() for i in invalid_space_ids]}"
         )
 
-    # return the flat patches (in the mesh frame)
-    return flat_patches - origin
+    # return the flat patches (relative to the origins of the search spaces)
+    flat_patches -= origins[space_ids]
+    return list(torch.split(flat_patches, list(num_patches)))
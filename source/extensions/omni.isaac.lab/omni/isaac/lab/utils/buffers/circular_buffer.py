@@ -3,6 +3,8 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+from __future__ import annotations
+
 import torch
 from collections.abc import Sequence
 
@@ -17,6 +19,10 @@ class CircularBuffer:
 
     The shape of the appended data is expected to be (batch_size, ...), where the first dimension is the
     batch dimension. Correspondingly, the shape of the ring buffer is (max_len, batch_size, ...).
+
+    The data can be read either through indexing (which checks that every batch index holds data) or through
+    :meth:`get` and :meth:`get_lags`. The latter do not synchronize the host with the device and can write the
+    result into a pre-allocated tensor, which makes them suitable for calls at every physics step.
     """
 
     def __init__(self, max_len: int, batch_size: int, device: str):
@@ -39,13 +45,20 @@ class CircularBuffer:
 
         # max length tensor for comparisons
         self._max_len = torch.full((batch_size,), max_len, dtype=torch.int, device=device)
+        self._max_length = max_len
         # number of data pushes passed since the last call to :meth:`reset`
         self._num_pushes = torch.zeros(batch_size, dtype=torch.long, device=device)
+        # lags of the entries from the oldest to the most recent one (used for reading the complete buffer)
+        self._history_lags = torch.arange(max_len - 1, -1, -1, dtype=torch.long, device=device)
         # the pointer to the current head of the circular buffer (-1 means not initialized)
         self._pointer: int = -1
+        # scratch buffer for the indices read by :meth:`get`
+        self._index_buffer = torch.zeros(batch_size, dtype=torch.long, device=device)
         # the actual buffer for data storage
         # note: this is initialized on the first call to :meth:`append`
         self._buffer: torch.Tensor = None  # type: ignore
+        # view of the buffer with the length and batch dimensions merged. Shape is (max_len * batch_size, ...).
+        self._flat_buffer: torch.Tensor = None  # type: ignore
 
     """
     Properties.
@@ -64,17 +77,30 @@ class CircularBuffer:
     @property
     def max_length(self) -> int:
         """The maximum length of the ring buffer."""
-        return int(self._max_len[0].item())
+        return self._max_length
 
     @property
     def current_length(self) -> torch.Tensor:
         """The current length of the buffer. Shape is (batch_size,).
 
         Since the buffer is circular, the current length is the minimum of the number of pushes
-        and the maximum length.
+        and the maximum length. A batch index holds valid data if its current length is non-zero.
         """
         return torch.minimum(self._num_pushes, self._max_len)
 
+    @property
+    def buffer(self) -> torch.Tensor:
+        """Complete circular buffer with the most recent entry at the end and the oldest entry at the beginning.
+
+        The entries are gathered from the underlying storage based on the current head of the buffer. If fewer
+        entries than the maximum length have been pushed since the last call to :meth:`reset`, the missing older
+        entries are filled with the oldest pushed entry. The shape is (batch_size, max_length, ...).
+
+        Raises:
+            RuntimeError: If the buffer is empty.
+        """
+        return self.get_lags(self._history_lags)
+
     """
     Operations.
     """
@@ -110,6 +136,7 @@ class CircularBuffer:
         if self._buffer is None:
             self._pointer = -1
             self._buffer = torch.empty((self.max_length, *data.shape), dtype=data.dtype, device=self._device)
+            self._flat_buffer = self._buffer.view(-1, *data.shape[1:])
         # move the head to the next slot
         self._pointer = (self._pointer + 1) % self.max_length
         # add the new data to the last layer
@@ -117,12 +144,99 @@ class CircularBuffer:
         # increment number of number of pushes
         self._num_pushes += 1
 
+    def get(self, key: torch.Tensor, out: torch.Tensor | None = None) -> torch.Tensor:
+        """Retrieve the data from the circular buffer in last-in-first-out (LIFO) fashion.
+
+        Different to indexing the buffer, this function does not check on the host whether all the batch indices
+        hold data. It therefore does not synchronize with the device. For batch indices without any pushes since
+        the last call to :meth:`reset`, the returned data is stale. Their validity can be checked on the device
+        through :attr:`current_length`.
+
+        If the requested index is larger than the number of pushes since the last call to :meth:`reset`,
+        the oldest stored data is returned.
+
+        Args:
+            key: The index to retrieve from the circular buffer. Shape is (batch_size,).
+            out: The tensor to write the data into. Defaults to None, in which case a new tensor is allocated.
+                Shape is (batch_size, ...).
+
+        Returns:
+            The data from the circular buffer. Shape is (batch_size, ...).
+
+        Raises:
+            ValueError: If the input key has a different batch size than the buffer.
+            RuntimeError: If no data was ever appended to the buffer.
+        """
+        # check the batch size
+        if len(key) != self.batch_size:
+            raise ValueError(f"The argument 'key' has length {key.shape[0]}, while expecting {self.batch_size}")
+        # check if the buffer is allocated
+        if self._buffer is None:
+            raise RuntimeError("Attempting to retrieve data on an empty circular buffer. Please append data first.")
+
+        # compute the flat index in-place to avoid allocating intermediate tensors
+        index = self._index_buffer
+        # admissible lag
+        torch.sub(self._num_pushes, 1, out=index).clamp_(min=0, max=self.max_length - 1)
+        torch.minimum(index, key, out=index)
+        # the index in the circular buffer (pointer points to the most recent entry)
+        index.neg_().add_(self._pointer).remainder_(self.max_length)
+        # the index in the flattened buffer
+        index.mul_(self.batch_size).add_(self._ALL_INDICES)
+        # return output
+        return torch.index_select(self._flat_buffer, 0, index, out=out)
+
+    def get_lags(self, lags: torch.Tensor, out: torch.Tensor | None = None) -> torch.Tensor:
+        """Retrieve the data at several lags from the circular buffer with a single gather.
+
+        Similar to :meth:`get`, this function does not synchronize with the device and the data of the batch
+        indices without any pushes since the last call to :meth:`reset` is stale. Lags larger than the number
+        of pushes since the last call to :meth:`reset` return the oldest stored data.
+
+        Args:
+            lags: The lags to retrieve. Shape is (num_lags,) to read the same lags for all batch indices or
+                (batch_size, num_lags) to read different lags for each batch index.
+            out: The tensor to write the data into. It must be contiguous. Defaults to None, in which case a new
+                tensor is allocated. Shape is (batch_size, num_lags, ...).
+
+        Returns:
+            The data from the circular buffer. Shape is (batch_size, num_lags, ...).
+
+        Raises:
+            ValueError: If the input lags have a different batch size than the buffer.
+            RuntimeError: If no data was ever appended to the buffer.
+        """
+        # resolve shared lags
+        if lags.dim() == 1:
+            lags = lags.unsqueeze(0)
+        # check the batch size
+        elif lags.shape[0] != self.batch_size:
+            raise ValueError(f"The argument 'lags' has length {lags.shape[0]}, while expecting {self.batch_size}")
+        # check if the buffer is allocated
+        if self._buffer is None:
+            raise RuntimeError("Attempting to retrieve data on an empty circular buffer. Please append data first.")
+
+        # admissible lags for each batch index. Shape is (batch_size, num_lags)
+        valid_lags = torch.minimum(lags, (self._num_pushes - 1).clamp(min=0, max=self.max_length - 1).unsqueeze(1))
+        # the index in the flattened buffer (pointer points to the most recent entry)
+        index = torch.remainder(self._pointer - valid_lags, self.max_length) * self.batch_size
+        index += self._ALL_INDICES.unsqueeze(1)
+        # return output
+        if out is None:
+            return self._flat_buffer[index]
+        torch.index_select(self._flat_buffer, 0, index.flatten(), out=out.view(-1, *self._flat_buffer.shape[1:]))
+        return out
+
     def __getitem__(self, key: torch.Tensor) -> torch.Tensor:
         """Retrieve the data from the circular buffer in last-in-first-out (LIFO) fashion.
 
         If the requested index is larger than the number of pushes since the last call to :meth:`reset`,
         the oldest stored data is returned.
 
+        .. note::
+            This function checks that all the batch indices hold data, which synchronizes the host with
+            the device. Use :meth:`get` to avoid this.
+
         Args:
             key: The index to retrieve from the circular buffer. The index should be less than the number of pushes
                 since the last call to :meth:`reset`. Shape is (batch_size,).
@@ -141,9 +255,5 @@ class CircularBuffer:
         if torch.any(self._num_pushes == 0) or self._buffer is None:
             raise RuntimeError("Attempting to retrieve data on an empty circular buffer. Please append data first.")
 
-        # admissible lag
-        valid_keys = torch.minimum(key, self._num_pushes - 1)
-        # the index in the circular buffer (pointer points to the last+1 index)
-        index_in_buffer = torch.remainder(self._pointer - valid_keys, self.max_length)
         # return output
-        return self._buffer[index_in_buffer, self._ALL_INDICES]
+        return self.get(key)
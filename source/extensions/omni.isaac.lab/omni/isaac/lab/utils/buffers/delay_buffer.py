@@ -156,7 +156,7 @@ class DelayBuffer:
         """
         self._circular_buffer.reset(batch_ids)
 
-    def compute(self, data: torch.Tensor) -> torch.Tensor:
+    def compute(self, data: torch.Tensor, out: torch.Tensor | None = None) -> torch.Tensor:
         """Append the input data to the buffer and returns a stale version of the data based on time lag delay.
 
         If the requested delay is larger than the number of buffered data points since the last reset,
@@ -164,8 +164,14 @@ class DelayBuffer:
         is stored in the buffer, the function will return the latest data. If the delay is set to 2 and three
         data points are stored, the function will return the first data point.
 
+        The function does not synchronize the host with the device. Several quantities that share the same
+        delays (for instance, joint position, velocity and effort targets) can be delayed with a single call by
+        stacking them along a dimension after the batch dimension.
+
         Args:
            data: The input data. Shape is (batch_size, ...).
+           out: The tensor to write the delayed data into. Defaults to None, in which case a new tensor is
+                allocated. Shape is (batch_size, ...).
 
         Returns:
             The delayed version of the data from the stored buffer. Shape is (batch_size, ...).
@@ -173,5 +179,5 @@ class DelayBuffer:
         # add the new data to the last layer
         self._circular_buffer.append(data)
         # return output
-        delayed_data = self._circular_buffer[self._time_lags]
-        return delayed_data.clone()
+        # note: the gather creates a copy of the stored data, so the buffer is never exposed to the caller
+        return self._circular_buffer.get(self._time_lags, out=out)
@@ -0,0 +1,151 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Sub-module for replaying functions on persistent tensors as CUDA graphs."""
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Callable
+
+import carb
+
+
+class CudaGraphFunction:
+    """Wrapper that replays a function operating on persistent tensors as a CUDA graph.
+
+    Launching many small kernels from Python is often limited by the launch overhead rather than the
+    computation itself. A `CUDA graph`_ records the kernels launched by the function once and replays
+    them with a single launch afterwards.
+
+    The wrapped function takes no arguments and returns nothing. It must read its inputs from and write its
+    outputs into tensors whose memory does not change between calls (for instance, the data buffers of the
+    assets). Since only the recorded kernels are replayed, any Python logic inside the function (branches,
+    counters, lazy updates of buffers) is frozen at the time of capture.
+
+    The function is called eagerly for the first few calls to warm up the lazily initialized resources (such as
+    the cuBLAS handles). It is then captured into a graph which is replayed on all subsequent calls. If the
+    capture fails (for instance, because the function synchronizes with the host), a warning is printed and
+    the function is called eagerly from then on.
+
+    On devices other than CUDA, or if disabled, the function is always called eagerly.
+
+    Example usage:
+
+    .. code-block:: python
+
+        import torch
+
+        from omni.isaac.lab.utils.cuda_graph import CudaGraphFunction
+
+        inputs = torch.rand(4096, 12, device="cuda:0")
+        outputs = torch.zeros_like(inputs)
+
+        def compute():
+            torch.mul(inputs, 2.0, out=outputs)
+            outputs.clamp_(max=1.0)
+
+        graphed_compute = CudaGraphFunction(compute, device="cuda:0")
+        for _ in range(10):
+            inputs.copy_(torch.rand_like(inputs))
+            graphed_compute()
+
+    .. _CUDA graph: https://pytorch.org/docs/stable/notes/cuda.html#cuda-graphs
+    """
+
+    def __init__(self, func: Callable[[], None], device: str, num_warmup_calls: int = 3, enabled: bool = True):
+        """Initializes the wrapper.
+
+        Args:
+            func: The function to call. It takes no arguments and returns nothing.
+            device: The device on which the function operates.
+            num_warmup_calls: The number of eager calls before capturing the graph. Defaults to 3.
+            enabled: Whether to use a CUDA graph. Defaults to True.
+        """
+        # store inputs
+        self._func = func
+        self._device = device
+        self._num_warmup_calls = num_warmup_calls
+        # graphs are only supported on CUDA devices
+        self._enabled = enabled and "cuda" in device and torch.cuda.is_available()
+        # number of eager calls done so far
+        self._num_calls = 0
+        # the captured graph (None until captured)
+        self._graph: torch.cuda.CUDAGraph | None = None
+
+    """
+    Properties.
+    """
+
+    @property
+    def is_enabled(self) -> bool:
+        """Whether the function is (or will be) replayed as a CUDA graph."""
+        return self._enabled
+
+    @property
+    def is_captured(self) -> bool:
+        """Whether the function has been captured into a CUDA graph."""
+        return self._graph is not None
+
+    """
+    Operations.
+    """
+
+    def __call__(self):
+        """Calls the function or replays its captured graph."""
+        # replay the captured graph
+        if self._graph is not None:
+            self._graph.replay()
+        # call the function eagerly
+        elif not self._enabled:
+            self._func()
+        # warm up the function on a side stream (as required for capturing graphs)
+        elif self._num_calls < self._num_warmup_calls:
+            current_stream = torch.cuda.current_stream(self._device)
+            side_stream = torch.cuda.Stream(self._device)
+            side_stream.wait_stream(current_stream)
+            with torch.cuda.stream(side_stream):
+                self._func()
+            current_stream.wait_stream(side_stream)
+            self._num_calls += 1
+        # capture the graph
+        else:
+            self._capture()
+
+    def reset(self):
+        """Discards the captured graph.
+
+        This should be called if the memory of the tensors used by the function changes. The function is
+        warmed up and captured again on the next calls.
+        """
+        self._graph = None
+        self._num_calls = 0
+
+    """
+    Helper functions.
+    """
+
+    def _capture(self):
+        """Captures the function into a CUDA graph and replays it once."""
+        graph = torch.cuda.CUDAGraph()
+        try:
+            with torch.cuda.graph(graph):
+                self._func()
+        except RuntimeError as e:
+            # wait for the capture stream to finish and release the partially captured graph
+            torch.cuda.synchronize(self._device)
+            graph = None
+            carb.log_warn(
+                f"Unable to capture the function '{getattr(self._func, '__qualname__', self._func)}' into a CUDA"
+                f" graph. The function is called eagerly from now on. Reason: {e}"
+            )
+            self._enabled = False
+            # note: a failed capture does not execute the function
+            self._func()
+            return
+        # store the graph
+        self._graph = graph
+        # note: capturing does not execute the recorded kernels
+        self._graph.replay()
@@ -987,7 +987,53 @@ Projection operations.
 
 
 @torch.jit.script
-def unproject_depth(depth: torch.Tensor, intrinsics: torch.Tensor) -> torch.Tensor:
+def compute_unprojection_grid(intrinsics: torch.Tensor, height: int, width: int) -> torch.Tensor:
+    r"""Computes the points at unit depth that the pixels of an image unproject to.
+
+    .. math::
+        p_{3D} = K^{-1} \times [u, v, 1]^T
+
+    where :math:`u` and :math:`v` are the pixel coordinates and :math:`K` is the intrinsic matrix.
+
+    The grid only depends on the intrinsic matrix and the image size. It can be computed once and passed
+    to :meth:`unproject_depth` to unproject all the depth images of a camera with an element-wise product.
+
+    Args:
+        intrinsics: A tensor providing camera's calibration matrix. Shape is (3, 3) or (N, 3, 3).
+        height: The height of the image.
+        width: The width of the image.
+
+    Returns:
+        The 3D coordinates of the pixels at unit depth. Shape is (H x W, 3) or (N, H x W, 3). The pixels are
+        ordered in the same way as the points returned by :meth:`unproject_depth`.
+    """
+    intrinsics_batch = intrinsics
+    # make sure inputs are batched
+    if intrinsics_batch.dim() == 2:
+        intrinsics_batch = intrinsics_batch[None]  # (3, 3) -> (1, 3, 3)
+    # create image points in homogeneous coordinates (3, H x W)
+    indices_u = torch.arange(width, device=intrinsics.device, dtype=intrinsics.dtype)
+    indices_v = torch.arange(height, device=intrinsics.device, dtype=intrinsics.dtype)
+    img_indices = torch.stack(torch.meshgrid([indices_u, indices_v], indexing="ij"), dim=0).reshape(2, -1)
+    pixels = torch.nn.functional.pad(img_indices, (0, 0, 0, 1), mode="constant", value=1.0)
+    pixels = pixels.unsqueeze(0)  # (3, H x W) -> (1, 3, H x W)
+
+    # unproject points into 3D space
+    points = torch.matmul(torch.inverse(intrinsics_batch), pixels)  # (N, 3, H x W)
+    points = points / points[:, -1, :].unsqueeze(1)  # normalize by last coordinate
+    points = points.transpose(1, 2)  # (N, H x W, 3)
+
+    # return points in same shape as input
+    if intrinsics.dim() == 2:
+        points = points.squeeze(0)
+
+    return points
+
+
+# @torch.jit.script
+def unproject_depth(
+    depth: torch.Tensor, intrinsics: torch.Tensor, unprojection_grid: torch.Tensor | None = None
+) -> torch.Tensor:
     r"""Unproject depth image into a pointcloud.
 
     This function converts depth images into points given the calibration matrix of the camera.
@@ -1004,9 +1050,14 @@ def unproject_depth(depth: torch.Tensor, intrinsics: torch.Tensor) -> torch.Tens
     The function assumes that the width and height are both greater than 1. This makes the function
     deal with many possible shapes of depth images and intrinsics matrices.
 
+    The term :math:`K^{-1} \times [u, v, 1]^T` only depends on the intrinsics. If it is provided through the
+    ``unprojection_grid`` (see :meth:`compute_unprojection_grid`), it is not recomputed.
+
     Args:
         depth: The depth measurement. Shape is (H, W) or or (H, W, 1) or (N, H, W) or (N, H, W, 1).
         intrinsics: A tensor providing camera's calibration matrix. Shape is (3, 3) or (N, 3, 3).
+        unprojection_grid: The points at unit depth of the pixels. Shape is (H x W, 3) or (N, H x W, 3).
+            Defaults to None, in which case it is computed from the intrinsics.
 
     Returns:
         The 3D coordinates of points. Shape is (P, 3) or (N, P, 3).
@@ -1015,8 +1066,7 @@ def unproject_depth(depth: torch.Tensor, intrinsics: torch.Tensor) -> torch.Tens
         ValueError: When depth is not of shape (H, W) or (H, W, 1) or (N, H, W) or (N, H, W, 1).
         ValueError: When intrinsics is not of shape (3, 3) or (N, 3, 3).
     """
-    depth_batch = depth.clone()
-    intrinsics_batch = intrinsics.clone()
+    depth_batch = depth
     # check if inputs are batched
     is_batched = depth_batch.dim() == 4 or (depth_batch.dim() == 3 and depth_batch.shape[-1] != 1)
     # make sure inputs are batched
@@ -1026,31 +1076,23 @@ def unproject_depth(depth: torch.Tensor, intrinsics: torch.Tensor) -> torch.Tens
         depth_batch = depth_batch[None]  # (H, W) -> (1, H, W)
     if depth_batch.dim() == 4 and depth_batch.shape[-1] == 1:
         depth_batch = depth_batch.squeeze(dim=3)  # (N, H, W, 1) -> (N, H, W)
-    if intrinsics_batch.dim() == 2:
-        intrinsics_batch = intrinsics_batch[None]  # (3, 3) -> (1, 3, 3)
     # check shape of inputs
     if depth_batch.dim() != 3:
         raise ValueError(f"Expected depth images to have dim = 2 or 3 or 4: got shape {depth.shape}")
-    if intrinsics_batch.dim() != 3:
+    if intrinsics.dim() != 2 and intrinsics.dim() != 3:
         raise ValueError(f"Expected intrinsics to have shape (3, 3) or (N, 3, 3): got shape {intrinsics.shape}")
 
     # get image height and width
     im_height, im_width = depth_batch.shape[1:]
-    # create image points in homogeneous coordinates (3, H x W)
-    indices_u = torch.arange(im_width, device=depth.device, dtype=depth.dtype)
-    indices_v = torch.arange(im_height, device=depth.device, dtype=depth.dtype)
-    img_indices = torch.stack(torch.meshgrid([indices_u, indices_v], indexing="ij"), dim=0).reshape(2, -1)
-    pixels = torch.nn.functional.pad(img_indices, (0, 0, 0, 1), mode="constant", value=1.0)
-    pixels = pixels.unsqueeze(0)  # (3, H x W) -> (1, 3, H x W)
-
-    # unproject points into 3D space
-    points = torch.matmul(torch.inverse(intrinsics_batch), pixels)  # (N, 3, H x W)
-    points = points / points[:, -1, :].unsqueeze(1)  # normalize by last coordinate
-    # flatten depth image (N, H, W) -> (N, H x W)
-    depth_batch = depth_batch.transpose_(1, 2).reshape(depth_batch.shape[0], -1).unsqueeze(2)
-    depth_batch = depth_batch.expand(-1, -1, 3)
+    # resolve the points at unit depth (N, H x W, 3)
+    if unprojection_grid is None:
+        unprojection_grid = compute_unprojection_grid(intrinsics.to(depth.dtype), im_height, im_width)
+    if unprojection_grid.dim() == 2:
+        unprojection_grid = unprojection_grid[None]  # (H x W, 3) -> (1, H x W, 3)
+    # flatten depth image (N, H, W) -> (N, H x W, 1)
+    depth_batch = depth_batch.transpose(1, 2).reshape(depth_batch.shape[0], -1).unsqueeze(2)
     # scale points by depth
-    points_xyz = points.transpose_(1, 2) * depth_batch  # (N, H x W, 3)
+    points_xyz = unprojection_grid * depth_batch  # (N, H x W, 3)
 
     # return points in same shape as input
     if not is_batched:
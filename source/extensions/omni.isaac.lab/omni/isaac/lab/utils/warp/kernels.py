@@ -5,6 +5,8 @@
 
 """Custom kernels for warp."""
 
+from typing import Any
+
 import warp as wp
 
 
@@ -74,21 +76,247 @@ def raycast_mesh_kernel(
 
 
 @wp.kernel
+def raycast_meshes_kernel(
+    meshes: wp.array2d(dtype=wp.uint64),
+    ray_starts: wp.array2d(dtype=wp.vec3),
+    ray_directions: wp.array2d(dtype=wp.vec3),
+    frame_pos: wp.array(dtype=wp.vec3),
+    frame_quat: wp.array(dtype=wp.quat),
+    ray_hits: wp.array2d(dtype=wp.vec3),
+    ray_distance: wp.array2d(dtype=wp.float32),
+    ray_normal: wp.array2d(dtype=wp.vec3),
+    ray_face_id: wp.array2d(dtype=wp.int32),
+    ray_mesh_id: wp.array2d(dtype=wp.int32),
+    max_dist: float = 1e6,
+    shared_rays: int = False,
+    transform_rays: int = False,
+    rotate_directions: int = True,
+    return_distance: int = False,
+    return_normal: int = False,
+    return_face_id: int = False,
+    return_mesh_id: int = False,
+):
+    """Performs ray-casting against multiple meshes and keeps the closest hit.
+
+    Each batch of rays is cast against its own set of meshes. This allows ray-casting against meshes that are
+    shared across all the batches (such as the terrain) together with meshes that are instanced per batch
+    (such as obstacles in each environment). For each ray, the meshes are queried one after the other with
+    the maximum distance shortened to the closest hit found so far.
+
+    The rays can be shared across the batches (for instance, the ray pattern of a sensor) and expressed in a
+    frame per batch (for instance, the pose of each sensor). In this case, the rays are transformed into the
+    world frame inside the kernel, which avoids storing the rays of every batch.
+
+    Args:
+        meshes: The ids of the meshes to ray-cast against for each batch. Shape is (B, M), where B is the number
+            of batches and M is the number of meshes per batch.
+        ray_starts: The input ray start positions. Shape is (B, N, 3), or (1, N, 3) if `shared_rays` is True.
+        ray_directions: The input ray directions. Shape is (B, N, 3), or (1, N, 3) if `shared_rays` is True.
+        frame_pos: The positions of the frames in which the rays are expressed. Shape is (B, 3), if
+            `transform_rays` is True. Otherwise, this array is not used.
+        frame_quat: The orientations (x, y, z, w) of the frames in which the rays are expressed. Shape is (B, 4),
+            if `transform_rays` is True. Otherwise, this array is not used.
+        ray_hits: The output ray hit positions. Shape is (B, N, 3).
+        ray_distance: The output ray hit distances. Shape is (B, N), if `return_distance` is True. Otherwise,
+            this array is not used.
+        ray_normal: The output ray hit normals. Shape is (B, N, 3), if `return_normal` is True. Otherwise,
+            this array is not used.
+        ray_face_id: The output ray hit face ids. Shape is (B, N), if `return_face_id` is True. Otherwise,
+            this array is not used.
+        ray_mesh_id: The output indices of the hit meshes in the second dimension of :obj:`meshes`. Shape is
+            (B, N), if `return_mesh_id` is True. Otherwise, this array is not used.
+        max_dist: The maximum ray-cast distance. Defaults to 1e6.
+        shared_rays: Whether the same rays are used for all the batches. Defaults to False.
+        transform_rays: Whether to transform the rays from the frames of the batches into the world frame.
+            Defaults to False.
+        rotate_directions: Whether to rotate the ray directions by the frame orientations. Only used if
+            `transform_rays` is True. Defaults to True.
+        return_distance: Whether to return the ray hit distances. Defaults to False.
+        return_normal: Whether to return the ray hit normals. Defaults to False.
+        return_face_id: Whether to return the ray hit face ids. Defaults to False.
+        return_mesh_id: Whether to return the ray hit mesh ids. Defaults to False.
+    """
+    # get the thread id
+    batch_id, ray_id = wp.tid()
+
+    # read the rays
+    pattern_id = batch_id
+    if shared_rays == 1:
+        pattern_id = 0
+    ray_start = ray_starts[pattern_id, ray_id]
+    ray_direction = ray_directions[pattern_id, ray_id]
+    # transform the rays into the world frame
+    if transform_rays == 1:
+        ray_start = wp.quat_rotate(frame_quat[batch_id], ray_start) + frame_pos[batch_id]
+        if rotate_directions == 1:
+            ray_direction = wp.quat_rotate(frame_quat[batch_id], ray_direction)
+
+    t = float(0.0)  # hit distance along ray
+    u = float(0.0)  # hit face barycentric u
+    v = float(0.0)  # hit face barycentric v
+    sign = float(0.0)  # hit face sign
+    n = wp.vec3()  # hit face normal
+    f = int(0)  # hit face index
+
+    # closest hit across the meshes
+    closest_t = float(max_dist)
+    closest_n = wp.vec3()
+    closest_f = int(-1)
+    closest_mesh = int(-1)
+
+    # ray cast against each mesh and keep the closest hit
+    for mesh_id in range(meshes.shape[1]):
+        hit_success = wp.mesh_query_ray(
+            meshes[batch_id, mesh_id], ray_start, ray_direction, closest_t, t, u, v, sign, n, f
+        )
+        if hit_success and t < closest_t:
+            closest_t = t
+            closest_n = n
+            closest_f = f
+            closest_mesh = mesh_id
+
+    # if the ray hit, store the hit data
+    if closest_mesh >= 0:
+        ray_hits[batch_id, ray_id] = ray_start + closest_t * ray_direction
+        if return_distance == 1:
+            ray_distance[batch_id, ray_id] = closest_t
+        if return_normal == 1:
+            ray_normal[batch_id, ray_id] = closest_n
+        if return_face_id == 1:
+            ray_face_id[batch_id, ray_id] = closest_f
+        if return_mesh_id == 1:
+            ray_mesh_id[batch_id, ray_id] = closest_mesh
+
+
+@wp.kernel
+def raycast_height_field_kernel(
+    heights: wp.array2d(dtype=wp.float32),
+    valid: wp.array2d(dtype=wp.uint8),
+    mesh: wp.uint64,
+    ray_starts: wp.array2d(dtype=wp.vec3),
+    frame_pos: wp.array(dtype=wp.vec3),
+    frame_quat: wp.array(dtype=wp.quat),
+    ray_hits: wp.array2d(dtype=wp.vec3),
+    ray_distance: wp.array2d(dtype=wp.float32),
+    origin_x: float,
+    origin_y: float,
+    resolution: float,
+    max_dist: float = 1e6,
+    shared_rays: int = False,
+    transform_rays: int = False,
+    use_mesh: int = False,
+    return_distance: int = False,
+):
+    """Performs ray-casting straight down against a terrain given by a height map.
+
+    Instead of traversing the BVH of the terrain mesh, the height below each ray is looked up in the height map.
+    Within each cell of the grid, the height is interpolated on the two triangles that share the diagonal from
+    the vertex ``(i, j)`` to the vertex ``(i + 1, j + 1)``, which is the triangulation of the terrain mesh. For
+    the rays outside the height map or above invalid cells (for instance, overhangs or vertical surfaces), the
+    ray-casting falls back to the mesh.
+
+    All the rays point along the negative z-axis. Their directions are thus not needed.
+
+    Args:
+        heights: The heights of the terrain at the vertices of the grid. Shape is (X + 1, Y + 1).
+        valid: Whether the height map matches the terrain mesh in each cell of the grid. Shape is (X, Y).
+        mesh: The id of the terrain mesh used for the rays outside the valid cells. Only used if `use_mesh`
+            is True.
+        ray_starts: The input ray start positions. Shape is (B, N, 3), or (1, N, 3) if `shared_rays` is True.
+        frame_pos: The positions of the frames in which the rays are expressed. Shape is (B, 3), if
+            `transform_rays` is True. Otherwise, this array is not used.
+        frame_quat: The orientations (x, y, z, w) of the frames in which the rays are expressed. Shape is (B, 4),
+            if `transform_rays` is True. Otherwise, this array is not used. The ray directions are not rotated.
+        ray_hits: The output ray hit positions. Shape is (B, N, 3).
+        ray_distance: The output ray hit distances. Shape is (B, N), if `return_distance` is True. Otherwise,
+            this array is not used.
+        origin_x: The x-coordinate of the vertex ``(0, 0)`` of the grid.
+        origin_y: The y-coordinate of the vertex ``(0, 0)`` of the grid.
+        resolution: The spacing between the vertices of the grid.
+        max_dist: The maximum ray-cast distance. Defaults to 1e6.
+        shared_rays: Whether the same rays are used for all the batches. Defaults to False.
+        transform_rays: Whether to transform the ray starts from the frames of the batches into the world frame.
+            Defaults to False.
+        use_mesh: Whether to ray-cast against the mesh outside the valid cells. Defaults to False.
+        return_distance: Whether to return the ray hit distances. Defaults to False.
+    """
+    # get the thread id
+    batch_id, ray_id = wp.tid()
+
+    # read the rays
+    pattern_id = batch_id
+    if shared_rays == 1:
+        pattern_id = 0
+    ray_start = ray_starts[pattern_id, ray_id]
+    # transform the rays into the world frame
+    if transform_rays == 1:
+        ray_start = wp.quat_rotate(frame_quat[batch_id], ray_start) + frame_pos[batch_id]
+
+    # find the cell of the grid below the ray
+    x = (ray_start[0] - origin_x) / resolution
+    y = (ray_start[1] - origin_y) / resolution
+    i = int(wp.floor(x))
+    j = int(wp.floor(y))
+
+    hit_success = bool(False)
+    hit_t = float(0.0)
+    if i >= 0 and j >= 0 and i < valid.shape[0] and j < valid.shape[1] and valid[i, j] == wp.uint8(1):
+        # interpolate the height on the triangle of the cell containing the ray
+        fx = x - float(i)
+        fy = y - float(j)
+        h00 = heights[i, j]
+        h11 = heights[i + 1, j + 1]
+        if fx >= fy:
+            h10 = heights[i + 1, j]
+            height = h00 + fx * (h10 - h00) + fy * (h11 - h10)
+        else:
+            h01 = heights[i, j + 1]
+            height = h00 + fy * (h01 - h00) + fx * (h11 - h01)
+        # the ray hits if the terrain is below its start and within the maximum distance
+        hit_t = ray_start[2] - height
+        hit_success = hit_t >= 0.0 and hit_t <= max_dist
+    elif use_mesh == 1:
+        t = float(0.0)  # hit distance along ray
+        u = float(0.0)  # hit face barycentric u
+        v = float(0.0)  # hit face barycentric v
+        sign = float(0.0)  # hit face sign
+        n = wp.vec3()  # hit face normal
+        f = int(0)  # hit face index
+        # ray cast against the mesh
+        hit_success = wp.mesh_query_ray(mesh, ray_start, wp.vec3(0.0, 0.0, -1.0), max_dist, t, u, v, sign, n, f)
+        hit_t = t
+
+    # if the ray hit, store the hit data
+    if hit_success:
+        ray_hits[batch_id, ray_id] = wp.vec3(ray_start[0], ray_start[1], ray_start[2] - hit_t)
+        if return_distance == 1:
+            ray_distance[batch_id, ray_id] = hit_t
+
+
+@wp.kernel(enable_backward=False)
 def reshape_tiled_image(
     tiled_image_buffer: wp.array(dtype=float),
-    batched_image: wp.array(dtype=float, ndim=4),
+    batched_image: wp.array(dtype=Any, ndim=4),
     image_height: int,
     image_width: int,
     num_channels: int,
     num_tiles_x: int,
     offset: int,
+    clip_min: float,
+    clip_max: float,
+    scale: float,
+    bias: float,
 ):
-    """Reshapes a tiled image into a batch of images.
+    r"""Reshapes a tiled image into a batch of images.
 
     This function reshapes the input tiled image buffer into a batch of images. The input image buffer
     is assumed to be tiled in the x and y directions. The output image is a batch of images with the
     specified height, width, and number of channels.
 
+    The pixel values are clipped and mapped linearly before they are cast to the data type of the output
+    image, i.e. :math:`y = \text{clip}(x, x_{min}, x_{max}) \cdot scale + bias`. This allows writing
+    low-precision or quantized images directly.
+
     Args:
         tiled_image_buffer: The input image buffer. Shape is (height * width * num_channels * num_cameras,).
         batched_image: The output image. Shape is (num_cameras, height, width, num_channels).
@@ -97,6 +325,10 @@ def reshape_tiled_image(
         num_channels: The number of channels in the image.
         num_tiles_x: The number of tiles in x-direction.
         offset: The offset in the image buffer. This is used when multiple image types are concatenated in the buffer.
+        clip_min: The minimum pixel value before the mapping.
+        clip_max: The maximum pixel value before the mapping.
+        scale: The scale of the mapping.
+        bias: The bias of the mapping. For integer outputs, adding 0.5 rounds the values to the nearest integer.
     """
     # get the thread id
     camera_id, height_id, width_id = wp.tid()
@@ -114,4 +346,71 @@ def reshape_tiled_image(
 
     # copy the pixel values into the batched image
     for i in range(num_channels):
-        batched_image[camera_id, height_id, width_id, i] = tiled_image_buffer[pixel_start + i]
+        value = wp.clamp(tiled_image_buffer[pixel_start + i], clip_min, clip_max) * scale + bias
+        batched_image[camera_id, height_id, width_id, i] = batched_image.dtype(value)
+
+
+@wp.kernel(enable_backward=False)
+def compute_frame_transforms(
+    body_transforms: wp.array(dtype=wp.transformf, ndim=2),
+    env_ids: wp.array(dtype=wp.int32),
+    source_body_index: int,
+    source_offset: wp.transformf,
+    target_body_indices: wp.array(dtype=wp.int32),
+    target_offsets: wp.array(dtype=wp.transformf),
+    source_pos_w: wp.array(dtype=wp.vec3f),
+    source_quat_w: wp.array(dtype=wp.vec4f),
+    target_pos_w: wp.array(dtype=wp.vec3f, ndim=2),
+    target_quat_w: wp.array(dtype=wp.vec4f, ndim=2),
+    target_pos_source: wp.array(dtype=wp.vec3f, ndim=2),
+    target_quat_source: wp.array(dtype=wp.vec4f, ndim=2),
+):
+    """Computes the transforms of the target frames with respect to the source frame.
+
+    The body transforms are read in the layout of the PhysX tensor API, i.e. the position followed by the
+    quaternion in (x, y, z, w). The output quaternions are written in (w, x, y, z). Only the environments
+    in :obj:`env_ids` are updated.
+
+    Args:
+        body_transforms: The transforms of the tracked bodies in the world frame. Shape is (num_envs, num_bodies).
+        env_ids: The indices of the environments to update. Shape is (num_env_ids,).
+        source_body_index: The index of the body of the source frame in the tracked bodies.
+        source_offset: The offset of the source frame from its body.
+        target_body_indices: The indices of the bodies of the target frames in the tracked bodies.
+            Shape is (num_frames,).
+        target_offsets: The offsets of the target frames from their bodies. Shape is (num_frames,).
+        source_pos_w: The output positions of the source frame in the world frame. Shape is (num_envs,).
+        source_quat_w: The output orientations of the source frame in the world frame. Shape is (num_envs,).
+        target_pos_w: The output positions of the target frames in the world frame.
+            Shape is (num_envs, num_frames).
+        target_quat_w: The output orientations of the target frames in the world frame.
+            Shape is (num_envs, num_frames).
+        target_pos_source: The output positions of the target frames in the source frame.
+            Shape is (num_envs, num_frames).
+        target_quat_source: The output orientations of the target frames in the source frame.
+            Shape is (num_envs, num_frames).
+    """
+    # get the thread id
+    index, frame_id = wp.tid()
+    env_id = env_ids[index]
+
+    # apply the offsets to the body transforms
+    source_w = wp.transform_multiply(body_transforms[env_id, source_body_index], source_offset)
+    target_w = wp.transform_multiply(body_transforms[env_id, target_body_indices[frame_id]], target_offsets[frame_id])
+    # compute the transform of the target frame with respect to the source frame
+    target_source = wp.transform_multiply(wp.transform_inverse(source_w), target_w)
+
+    # write the source frame once per environment
+    if frame_id == 0:
+        source_quat = wp.transform_get_rotation(source_w)
+        source_pos_w[env_id] = wp.transform_get_translation(source_w)
+        source_quat_w[env_id] = wp.vec4f(source_quat[3], source_quat[0], source_quat[1], source_quat[2])
+    # write the target frame
+    target_quat = wp.transform_get_rotation(target_w)
+    target_pos_w[env_id, frame_id] = wp.transform_get_translation(target_w)
+    target_quat_w[env_id, frame_id] = wp.vec4f(target_quat[3], target_quat[0], target_quat[1], target_quat[2])
+    relative_quat = wp.transform_get_rotation(target_source)
+    target_pos_source[env_id, frame_id] = wp.transform_get_translation(target_source)
+    target_quat_source[env_id, frame_id] = wp.vec4f(
+        relative_quat[3], relative_quat[0], relative_quat[1], relative_quat[2]
+    )
@@ -124,6 +124,293 @@ def raycast_mesh(
     return ray_hits.to(device).view(shape), ray_distance, ray_normal, ray_face_id
 
 
+def raycast_meshes(
+    ray_starts: torch.Tensor,
+    ray_directions: torch.Tensor,
+    mesh_ids: torch.Tensor,
+    max_dist: float = 1e6,
+    frame_pos: torch.Tensor | None = None,
+    frame_quat: torch.Tensor | None = None,
+    rotate_directions: bool = True,
+    return_distance: bool = False,
+    return_normal: bool = False,
+    return_face_id: bool = False,
+    return_mesh_id: bool = False,
+) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None]:
+    """Performs ray-casting against multiple meshes with a single kernel launch.
+
+    Each batch of rays is cast against its own set of meshes, and the closest hit across the meshes is returned.
+    Meshes shared across all the batches (such as the terrain) are repeated in every row of :attr:`mesh_ids`,
+    while meshes instanced per batch (such as obstacles in each environment) appear in the row of their batch.
+
+    The rays are either given per batch or shared across all the batches. If the frame poses are provided, the
+    rays are expressed in the frame of their batch and transformed into the world frame inside the kernel. This
+    way, a ray pattern shared by all the sensors is never repeated for each sensor.
+
+    Note that the `ray_starts` and `ray_directions` should have compatible shapes and data types to ensure
+    proper execution. Additionally, they all must be in the same frame.
+
+    Args:
+        ray_starts: The starting position of the rays. Shape (B, N, 3), or (N, 3) if shared across the batches.
+        ray_directions: The ray directions for each ray. Shape (B, N, 3), or (N, 3) if shared across the batches.
+        mesh_ids: The ids of the warp meshes (:attr:`warp.Mesh.id`) to ray-cast against for each batch.
+            The tensor must be of type int64 and on the device of the meshes. Shape (B, M).
+        max_dist: The maximum distance to ray-cast. Defaults to 1e6.
+        frame_pos: The positions of the frames in which the rays are expressed. Shape (B, 3). Defaults to None,
+            in which case the rays are expressed in the world frame.
+        frame_quat: The orientations (w, x, y, z) of the frames in which the rays are expressed. Shape (B, 4).
+            Defaults to None, in which case the frames are not rotated.
+        rotate_directions: Whether to rotate the ray directions by the frame orientations. Defaults to True.
+        return_distance: Whether to return the distance of the ray until it hits the mesh. Defaults to False.
+        return_normal: Whether to return the normal of the mesh face the ray hits. Defaults to False.
+        return_face_id: Whether to return the face id of the mesh face the ray hits. Defaults to False.
+        return_mesh_id: Whether to return the index of the mesh (in the second dimension of :attr:`mesh_ids`)
+            the ray hits. Defaults to False.
+
+    Returns:
+        The ray hit position. Shape (B, N, 3).
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit distance. Shape (B, N).
+            Will only return if :attr:`return_distance` is True, else returns None.
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit normal. Shape (B, N, 3).
+            Will only return if :attr:`return_normal` is True else returns None.
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit face id. Shape (B, N).
+            Will only return if :attr:`return_face_id` is True else returns None.
+            The returned tensor contains :obj:`int(-1)` for missed hits.
+        The ray hit mesh index. Shape (B, N).
+            Will only return if :attr:`return_mesh_id` is True else returns None.
+            The returned tensor contains :obj:`int(-1)` for missed hits.
+    """
+    # extract device and shape information
+    device = ray_starts.device
+    # device of the meshes
+    torch_device = mesh_ids.device
+    num_batches = mesh_ids.shape[0]
+    # reshape the tensors
+    shared_rays = ray_starts.dim() == 2
+    ray_starts = ray_starts.to(torch_device).view(1 if shared_rays else num_batches, -1, 3).contiguous()
+    ray_directions = ray_directions.to(torch_device).view(1 if shared_rays else num_batches, -1, 3).contiguous()
+    num_rays = ray_starts.shape[1]
+    # create output tensor for the ray hits
+    ray_hits = torch.full((num_batches, num_rays, 3), float("inf"), device=torch_device)
+
+    # map the memory to warp arrays
+    mesh_ids_wp = wp.from_torch(mesh_ids.contiguous(), dtype=wp.uint64)
+    ray_starts_wp = wp.from_torch(ray_starts, dtype=wp.vec3)
+    ray_directions_wp = wp.from_torch(ray_directions, dtype=wp.vec3)
+    ray_hits_wp = wp.from_torch(ray_hits, dtype=wp.vec3)
+
+    # resolve the frames of the rays
+    transform_rays = frame_pos is not None or frame_quat is not None
+    if transform_rays:
+        if frame_pos is None:
+            frame_pos = torch.zeros(num_batches, 3, device=torch_device)
+        if frame_quat is None:
+            frame_quat = torch.zeros(num_batches, 4, device=torch_device)
+            frame_quat[:, 0] = 1.0
+        # note: warp uses the (x, y, z, w) convention for quaternions
+        frame_pos_wp = wp.from_torch(frame_pos.to(torch_device).contiguous(), dtype=wp.vec3)
+        frame_quat_wp = wp.from_torch(frame_quat.to(torch_device).roll(-1, dims=-1).contiguous(), dtype=wp.quat)
+    else:
+        frame_pos_wp = wp.empty((1,), dtype=wp.vec3, device=str(torch_device))
+        frame_quat_wp = wp.empty((1,), dtype=wp.quat, device=str(torch_device))
+
+    if return_distance:
+        ray_distance = torch.full((num_batches, num_rays), float("inf"), device=torch_device)
+        ray_distance_wp = wp.from_torch(ray_distance, dtype=wp.float32)
+    else:
+        ray_distance = None
+        ray_distance_wp = wp.empty((1, 1), dtype=wp.float32, device=str(torch_device))
+
+    if return_normal:
+        ray_normal = torch.full((num_batches, num_rays, 3), float("inf"), device=torch_device)
+        ray_normal_wp = wp.from_torch(ray_normal, dtype=wp.vec3)
+    else:
+        ray_normal = None
+        ray_normal_wp = wp.empty((1, 1), dtype=wp.vec3, device=str(torch_device))
+
+    if return_face_id:
+        ray_face_id = torch.full((num_batches, num_rays), -1, dtype=torch.int32, device=torch_device)
+        ray_face_id_wp = wp.from_torch(ray_face_id, dtype=wp.int32)
+    else:
+        ray_face_id = None
+        ray_face_id_wp = wp.empty((1, 1), dtype=wp.int32, device=str(torch_device))
+
+    if return_mesh_id:
+        ray_mesh_id = torch.full((num_batches, num_rays), -1, dtype=torch.int32, device=torch_device)
+        ray_mesh_id_wp = wp.from_torch(ray_mesh_id, dtype=wp.int32)
+    else:
+        ray_mesh_id = None
+        ray_mesh_id_wp = wp.empty((1, 1), dtype=wp.int32, device=str(torch_device))
+
+    # launch the warp kernel
+    # note: the kernel is launched on the current torch stream so that no synchronization is needed
+    wp.launch(
+        kernel=kernels.raycast_meshes_kernel,
+        dim=(num_batches, num_rays),
+        inputs=[
+            mesh_ids_wp,
+            ray_starts_wp,
+            ray_directions_wp,
+            frame_pos_wp,
+            frame_quat_wp,
+            ray_hits_wp,
+            ray_distance_wp,
+            ray_normal_wp,
+            ray_face_id_wp,
+            ray_mesh_id_wp,
+            float(max_dist),
+            int(shared_rays),
+            int(transform_rays),
+            int(rotate_directions),
+            int(return_distance),
+            int(return_normal),
+            int(return_face_id),
+            int(return_mesh_id),
+        ],
+        device=ray_hits_wp.device,
+        stream=wp.stream_from_torch(torch_device) if torch_device.type == "cuda" else None,
+    )
+
+    if return_distance:
+        ray_distance = ray_distance.to(device)
+    if return_normal:
+        ray_normal = ray_normal.to(device)
+    if return_face_id:
+        ray_face_id = ray_face_id.to(device)
+    if return_mesh_id:
+        ray_mesh_id = ray_mesh_id.to(device)
+
+    return ray_hits.to(device), ray_distance, ray_normal, ray_face_id, ray_mesh_id
+
+
+def raycast_height_field(
+    ray_starts: torch.Tensor,
+    heights: torch.Tensor,
+    valid: torch.Tensor,
+    origin: tuple[float, float],
+    resolution: float,
+    mesh: wp.Mesh | None = None,
+    max_dist: float = 1e6,
+    frame_pos: torch.Tensor | None = None,
+    frame_quat: torch.Tensor | None = None,
+    return_distance: bool = False,
+) -> tuple[torch.Tensor, torch.Tensor | None]:
+    """Performs ray-casting straight down against a terrain given by a height map.
+
+    This is a faster alternative to :func:`raycast_meshes` for rays pointing along the negative z-axis (such as
+    the height scanners of legged robots). The height below each ray is looked up in the height map instead of
+    traversing the BVH of the terrain mesh. For the rays outside the height map or above its invalid cells, the
+    ray-casting falls back to the mesh (if provided).
+
+    The height map and its cells follow the layout of :class:`omni.isaac.lab.terrains.TerrainHeightMap`.
+
+    Args:
+        ray_starts: The starting position of the rays. Shape (B, N, 3), or (N, 3) if shared across the batches.
+        heights: The heights of the terrain at the vertices of the grid. Shape (X + 1, Y + 1).
+        valid: Whether the height map matches the terrain mesh in each cell of the grid. Shape (X, Y).
+        origin: The position of the vertex ``(0, 0)`` of the grid in the xy-plane.
+        resolution: The spacing between the vertices of the grid.
+        mesh: The terrain mesh to ray-cast against outside the valid cells. Defaults to None, in which case
+            the rays outside the valid cells miss.
+        max_dist: The maximum distance to ray-cast. Defaults to 1e6.
+        frame_pos: The positions of the frames in which the ray starts are expressed. Shape (B, 3).
+            Defaults to None, in which case the rays are expressed in the world frame.
+        frame_quat: The orientations (w, x, y, z) of the frames in which the ray starts are expressed. Shape (B, 4).
+            Defaults to None, in which case the frames are not rotated. The ray directions are never rotated.
+        return_distance: Whether to return the distance of the ray until it hits the terrain. Defaults to False.
+
+    Returns:
+        The ray hit position. Shape (B, N, 3).
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+        The ray hit distance. Shape (B, N).
+            Will only return if :attr:`return_distance` is True, else returns None.
+            The returned tensor contains :obj:`float('inf')` for missed hits.
+    """
+    # extract device and shape information
+    device = ray_starts.device
+    # device of the height map
+    torch_device = heights.device
+    shared_rays = ray_starts.dim() == 2
+    if shared_rays:
+        if frame_pos is not None:
+            num_batches = frame_pos.shape[0]
+        elif frame_quat is not None:
+            num_batches = frame_quat.shape[0]
+        else:
+            num_batches = 1
+    else:
+        num_batches = ray_starts.shape[0]
+    # reshape the tensors
+    ray_starts = ray_starts.to(torch_device).view(1 if shared_rays else num_batches, -1, 3).contiguous()
+    num_rays = ray_starts.shape[1]
+    # create output tensor for the ray hits
+    ray_hits = torch.full((num_batches, num_rays, 3), float("inf"), device=torch_device)
+
+    # map the memory to warp arrays
+    # note: warp does not support boolean arrays, so the mask is reinterpreted as bytes
+    heights_wp = wp.from_torch(heights.to(torch.float32).contiguous(), dtype=wp.float32)
+    valid_wp = wp.from_torch(valid.contiguous().view(torch.uint8), dtype=wp.uint8)
+    ray_starts_wp = wp.from_torch(ray_starts, dtype=wp.vec3)
+    ray_hits_wp = wp.from_torch(ray_hits, dtype=wp.vec3)
+
+    # resolve the frames of the rays
+    transform_rays = frame_pos is not None or frame_quat is not None
+    if transform_rays:
+        if frame_pos is None:
+            frame_pos = torch.zeros(num_batches, 3, device=torch_device)
+        if frame_quat is None:
+            frame_quat = torch.zeros(num_batches, 4, device=torch_device)
+            frame_quat[:, 0] = 1.0
+        # note: warp uses the (x, y, z, w) convention for quaternions
+        frame_pos_wp = wp.from_torch(frame_pos.to(torch_device).contiguous(), dtype=wp.vec3)
+        frame_quat_wp = wp.from_torch(frame_quat.to(torch_device).roll(-1, dims=-1).contiguous(), dtype=wp.quat)
+    else:
+        frame_pos_wp = wp.empty((1,), dtype=wp.vec3, device=str(torch_device))
+        frame_quat_wp = wp.empty((1,), dtype=wp.quat, device=str(torch_device))
+
+    if return_distance:
+        ray_distance = torch.full((num_batches, num_rays), float("inf"), device=torch_device)
+        ray_distance_wp = wp.from_torch(ray_distance, dtype=wp.float32)
+    else:
+        ray_distance = None
+        ray_distance_wp = wp.empty((1, 1), dtype=wp.float32, device=str(torch_device))
+
+    # launch the warp kernel
+    # note: the kernel is launched on the current torch stream so that no synchronization is needed
+    wp.launch(
+        kernel=kernels.raycast_height_field_kernel,
+        dim=(num_batches, num_rays),
+        inputs=[
+            heights_wp,
+            valid_wp,
+            mesh.id if mesh is not None else wp.uint64(0),
+            ray_starts_wp,
+            frame_pos_wp,
+            frame_quat_wp,
+            ray_hits_wp,
+            ray_distance_wp,
+            float(origin[0]),
+            float(origin[1]),
+            float(resolution),
+            float(max_dist),
+            int(shared_rays),
+            int(transform_rays),
+            int(mesh is not None),
+            int(return_distance),
+        ],
+        device=ray_hits_wp.device,
+        stream=wp.stream_from_torch(torch_device) if torch_device.type == "cuda" else None,
+    )
+
+    if return_distance:
+        ray_distance = ray_distance.to(device)
+
+    return ray_hits.to(device), ray_distance
+
+
 def convert_to_warp_mesh(points: np.ndarray, indices: np.ndarray, device: str) -> wp.Mesh:
     """Create a warp mesh object with a mesh defined from vertices and triangles.
 
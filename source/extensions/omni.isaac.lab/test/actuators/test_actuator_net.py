@@ -0,0 +1,148 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import os
+import tempfile
+import torch
+import unittest
+
+from omni.isaac.core.utils.types import ArticulationActions
+
+from omni.isaac.lab.actuators import ActuatorNetMLPCfg
+
+
+class TestActuatorNetMLP(unittest.TestCase):
+    """Test fixture for checking the MLP actuator network."""
+
+    def setUp(self):
+        self.device = "cuda:0"
+        self.num_envs = 16
+        self.num_joints = 3
+        self.input_idx = [0, 2, 4]
+        # create a random network and save it as TorchScript
+        torch.manual_seed(0)
+        network = torch.nn.Sequential(
+            torch.nn.Linear(2 * len(self.input_idx), 32), torch.nn.Softsign(), torch.nn.Linear(32, 1)
+        )
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.network_file = os.path.join(self.temp_dir.name, "actuator_net.pt")
+        torch.jit.save(torch.jit.script(network), self.network_file)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_compute_equivalence(self):
+        """Test that the network torques match a reference implementation with rolled history buffers."""
+        for input_order in ["pos_vel", "vel_pos"]:
+            with self.subTest(input_order=input_order):
+                actuator = self._create_actuator(input_order=input_order)
+                reference = _ReferenceActuatorNetMLP(actuator.cfg, self.num_envs, self.num_joints, self.device)
+                for step in range(10):
+                    # reset some environments midway
+                    if step == 6:
+                        actuator.reset([1, 5])
+                        reference.reset([1, 5])
+                    joint_pos_des, joint_pos, joint_vel = torch.randn(
+                        3, self.num_envs, self.num_joints, device=self.device
+                    )
+                    actuator.compute(self._create_actions(joint_pos_des), joint_pos, joint_vel)
+                    torques = reference.compute(joint_pos_des, joint_pos, joint_vel)
+                    torch.testing.assert_close(actuator.computed_effort, torques)
+
+    def test_compute_optimized_network(self):
+        """Test that the torques of the frozen and half precision networks are close to the default ones."""
+        actuator = self._create_actuator()
+        actuator_optimized = self._create_actuator(optimize_network=True)
+        actuator_half = self._create_actuator(half_precision=True)
+        for _ in range(5):
+            joint_pos_des, joint_pos, joint_vel = torch.randn(3, self.num_envs, self.num_joints, device=self.device)
+            actuator.compute(self._create_actions(joint_pos_des), joint_pos, joint_vel)
+            actuator_optimized.compute(self._create_actions(joint_pos_des), joint_pos, joint_vel)
+            actuator_half.compute(self._create_actions(joint_pos_des), joint_pos, joint_vel)
+            torch.testing.assert_close(actuator_optimized.computed_effort, actuator.computed_effort)
+            torch.testing.assert_close(actuator_half.computed_effort, actuator.computed_effort, atol=1e-2, rtol=1e-2)
+            self.assertEqual(actuator_half.computed_effort.dtype, torch.float32)
+
+    """
+    Helper functions.
+    """
+
+    def _create_actuator(self, **kwargs):
+        """Creates the MLP actuator with the test network."""
+        cfg = ActuatorNetMLPCfg(
+            joint_names_expr=[".*"],
+            network_file=self.network_file,
+            pos_scale=-1.0,
+            vel_scale=0.2,
+            torque_scale=60.0,
+            input_order=kwargs.pop("input_order", "pos_vel"),
+            input_idx=self.input_idx,
+            effort_limit=80.0,
+            velocity_limit=7.5,
+            saturation_effort=120.0,
+            **kwargs,
+        )
+        return cfg.class_type(
+            cfg,
+            joint_names=[f"joint_{i}" for i in range(self.num_joints)],
+            joint_ids=slice(None),
+            num_envs=self.num_envs,
+            device=self.device,
+        )
+
+    def _create_actions(self, joint_pos_des: torch.Tensor) -> ArticulationActions:
+        """Creates the actions with the desired joint positions."""
+        return ArticulationActions(
+            joint_positions=joint_pos_des,
+            joint_velocities=torch.zeros_like(joint_pos_des),
+            joint_efforts=torch.zeros_like(joint_pos_des),
+        )
+
+
+class _ReferenceActuatorNetMLP:
+    """Reference implementation of the MLP actuator network with rolled history buffers."""
+
+    def __init__(self, cfg: ActuatorNetMLPCfg, num_envs: int, num_joints: int, device: str):
+        self.cfg = cfg
+        self.num_envs = num_envs
+        self.num_joints = num_joints
+        self.network = torch.jit.load(cfg.network_file, map_location=device)
+        history_length = max(cfg.input_idx) + 1
+        self.joint_pos_error_history = torch.zeros(num_envs, history_length, num_joints, device=device)
+        self.joint_vel_history = torch.zeros(num_envs, history_length, num_joints, device=device)
+
+    def reset(self, env_ids):
+        self.joint_pos_error_history[env_ids] = 0.0
+        self.joint_vel_history[env_ids] = 0.0
+
+    def compute(self, joint_pos_des: torch.Tensor, joint_pos: torch.Tensor, joint_vel: torch.Tensor) -> torch.Tensor:
+        self.joint_pos_error_history = self.joint_pos_error_history.roll(1, 1)
+        self.joint_pos_error_history[:, 0] = joint_pos_des - joint_pos
+        self.joint_vel_history = self.joint_vel_history.roll(1, 1)
+        self.joint_vel_history[:, 0] = joint_vel
+        pos_input = torch.cat([self.joint_pos_error_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
+        pos_input = pos_input.view(self.num_envs * self.num_joints, -1)
+        vel_input = torch.cat([self.joint_vel_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
+        vel_input = vel_input.view(self.num_envs * self.num_joints, -1)
+        if self.cfg.input_order == "pos_vel":
+            network_input = torch.cat([pos_input * self.cfg.pos_scale, vel_input * self.cfg.vel_scale], dim=1)
+        else:
+            network_input = torch.cat([vel_input * self.cfg.vel_scale, pos_input * self.cfg.pos_scale], dim=1)
+        with torch.inference_mode():
+            torques = self.network(network_input)
+        return torques.view(self.num_envs, self.num_joints) * self.cfg.torque_scale
+
+
+if __name__ == "__main__":
+    run_tests()
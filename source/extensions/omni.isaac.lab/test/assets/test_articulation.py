@@ -27,7 +27,7 @@ import omni.isaac.core.utils.prims as prim_utils
 
 import omni.isaac.lab.sim as sim_utils
 import omni.isaac.lab.utils.string as string_utils
-from omni.isaac.lab.actuators import ImplicitActuatorCfg
+from omni.isaac.lab.actuators import IdealPDActuatorCfg, ImplicitActuatorCfg
 from omni.isaac.lab.assets import Articulation, ArticulationCfg
 from omni.isaac.lab.sim import build_simulation_context
 from omni.isaac.lab.utils.assets import ISAAC_NUCLEUS_DIR
@@ -817,6 +817,63 @@ class TestArticulation(unittest.TestCase):
                         # are not properly tuned
                         assert not torch.allclose(articulation.data.joint_pos, joint_pos)
 
+    def test_apply_interleaved_actuator_groups(self):
+        """Test that the commands of actuator groups with interleaved joints are dispatched to the right joints."""
+        for num_articulations in (1, 2):
+            for device in ("cuda:0", "cpu"):
+                with self.subTest(num_articulations=num_articulations, device=device):
+                    with build_simulation_context(device=device, add_ground_plane=True, auto_add_lighting=True) as sim:
+                        # split the joints of the legs into left and right actuator groups with different gains
+                        articulation_cfg = generate_articulation_cfg(articulation_type="anymal").replace(
+                            actuators={
+                                "left_legs": IdealPDActuatorCfg(
+                                    joint_names_expr=["L.*"], stiffness=40.0, damping=1.0, effort_limit=1.0e9
+                                ),
+                                "right_legs": ImplicitActuatorCfg(
+                                    joint_names_expr=["R.*"], stiffness=80.0, damping=2.0, effort_limit=1.0e9
+                                ),
+                            }
+                        )
+                        articulation, _ = generate_articulation(
+                            articulation_cfg=articulation_cfg, num_articulations=num_articulations, device=device
+                        )
+
+                        # Play the simulator
+                        sim.reset()
+
+                        # apply random commands to the articulation
+                        joint_pos_target = articulation.data.default_joint_pos + 0.1 * torch.randn_like(
+                            articulation.data.default_joint_pos
+                        )
+                        joint_effort_target = torch.randn_like(joint_pos_target)
+                        articulation.set_joint_position_target(joint_pos_target)
+                        articulation.set_joint_effort_target(joint_effort_target)
+                        articulation.write_data_to_sim()
+
+                        # compute the expected torques with the gains of each group
+                        left_joint_ids, _ = articulation.find_joints("L.*")
+                        right_joint_ids, _ = articulation.find_joints("R.*")
+                        stiffness = torch.zeros_like(joint_pos_target)
+                        stiffness[:, left_joint_ids] = 40.0
+                        stiffness[:, right_joint_ids] = 80.0
+                        damping = torch.zeros_like(joint_pos_target)
+                        damping[:, left_joint_ids] = 1.0
+                        damping[:, right_joint_ids] = 2.0
+                        expected_torque = (
+                            stiffness * (joint_pos_target - articulation.data.joint_pos)
+                            - damping * articulation.data.joint_vel
+                            + joint_effort_target
+                        )
+                        torch.testing.assert_close(articulation.data.computed_torque, expected_torque)
+                        # check that the simulation targets are only set for the groups that use them
+                        torch.testing.assert_close(
+                            articulation._joint_effort_target_sim[:, left_joint_ids], expected_torque[:, left_joint_ids]
+                        )
+                        torch.testing.assert_close(
+                            articulation._joint_pos_target_sim[:, right_joint_ids], joint_pos_target[:, right_joint_ids]
+                        )
+                        self.assertEqual(torch.count_nonzero(articulation._joint_pos_target_sim[:, left_joint_ids]), 0)
+
 
 if __name__ == "__main__":
     run_tests()
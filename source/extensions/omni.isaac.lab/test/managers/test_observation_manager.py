@@ -297,6 +297,127 @@ class TestObservationManager(unittest.TestCase):
         torch.testing.assert_close(obs_policy[:, 5:8], obs_critic[:, 0:3])
         torch.testing.assert_close(obs_policy[:, 8:11], obs_critic[:, 3:6])
 
+    def test_compute_preallocated_buffer(self):
+        """Test the observation computation into a preallocated buffer."""
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                term_1 = ObservationTermCfg(func=grilled_chicken, scale=10)
+                term_2 = ObservationTermCfg(func=grilled_chicken_with_curry, params={"hot": True})
+                term_3 = ObservationTermCfg(func=pos_w_data, clip=(0.2, 0.7), scale=2.0)
+                term_4 = ObservationTermCfg(
+                    func=lin_vel_w_data,
+                    modifiers=[modifiers.ModifierCfg(func=modifiers.bias, params={"value": 1.0})],
+                    history_length=2,
+                )
+
+            @configclass
+            class ImageCfg(ObservationGroupCfg):
+
+                term_1 = ObservationTermCfg(func=grilled_chicken_image, scale=1.5, params={"bland": 0.5, "channel": 1})
+                term_2 = ObservationTermCfg(func=grilled_chicken_image, clip=(0.0, 0.05), params={"bland": 0.1})
+
+            policy: ObservationGroupCfg = PolicyCfg()
+            image: ObservationGroupCfg = ImageCfg()
+
+        # create observation managers with and without preallocated buffers
+        cfg = MyObservationManagerCfg()
+        obs_man = ObservationManager(cfg, self.env)
+        cfg.policy.preallocate_buffer = True
+        cfg.image.preallocate_buffer = True
+        obs_man_prealloc = ObservationManager(cfg, self.env)
+        # check the observation dimensions are the same
+        self.assertEqual(obs_man.group_obs_dim, obs_man_prealloc.group_obs_dim)
+
+        # compute observations multiple times
+        prev_observations = None
+        for _ in range(3):
+            # change the data to check the buffer is updated
+            self.env.data.pos_w[:] = torch.rand_like(self.env.data.pos_w)
+            observations = obs_man.compute()
+            observations_prealloc = obs_man_prealloc.compute()
+            # check the values are the same
+            for group_name in ["policy", "image"]:
+                torch.testing.assert_close(observations[group_name], observations_prealloc[group_name])
+            # check the same buffer is returned every time
+            if prev_observations is not None:
+                for group_name in ["policy", "image"]:
+                    self.assertIs(prev_observations[group_name], observations_prealloc[group_name])
+            prev_observations = observations_prealloc
+        # check that the input data is not modified by the in-place operations
+        self.assertTrue(torch.any(self.env.data.pos_w < 0.2) or torch.any(self.env.data.pos_w > 0.7))
+
+        # check that non-concatenated groups are not supported
+        cfg.image.concatenate_terms = False
+        with self.assertRaises(ValueError):
+            ObservationManager(cfg, self.env)
+
+    def test_compute_with_history(self):
+        """Test the observation computation with history buffers."""
+
+        @configclass
+        class MyObservationManagerCfg:
+            """Test config class for observation manager."""
+
+            @configclass
+            class PolicyCfg(ObservationGroupCfg):
+                """Test config class for policy observation group."""
+
+                term_1 = ObservationTermCfg(func=grilled_chicken, history_length=4)
+                term_2 = ObservationTermCfg(func=complex_function_class, params={"interval": 0.5}, history_length=3)
+                term_3 = ObservationTermCfg(func=lin_vel_w_data, scale=2.0)
+
+            @configclass
+            class CriticCfg(ObservationGroupCfg):
+                """Test config class for critic observation group."""
+
+                concatenate_terms = False
+                history_length = 2
+                flatten_history_dim = False
+                term_1 = ObservationTermCfg(func=grilled_chicken)
+                term_2 = ObservationTermCfg(func=complex_function_class, params={"interval": 0.5}, history_length=5)
+
+            policy: ObservationGroupCfg = PolicyCfg()
+            critic: ObservationGroupCfg = CriticCfg()
+
+        # create observation manager
+        cfg = MyObservationManagerCfg()
+        self.obs_man = ObservationManager(cfg, self.env)
+        # check the observation dimensions
+        self.assertEqual(self.obs_man.group_obs_term_dim["policy"], [(16,), (3,), (3,)])
+        self.assertEqual(self.obs_man.group_obs_dim["policy"], (22,))
+        self.assertEqual(self.obs_man.group_obs_dim["critic"], [(2, 4), (2, 1)])
+
+        # compute observations
+        observations = self.obs_man.compute()
+        # check that the history is filled with the first observation
+        self.assertEqual((self.env.num_envs, 22), observations["policy"].shape)
+        torch.testing.assert_close(
+            observations["policy"][:, 16:19], torch.full((self.num_envs, 3), 0.5, device=self.device)
+        )
+        self.assertEqual((self.env.num_envs, 2, 4), observations["critic"]["term_1"].shape)
+        torch.testing.assert_close(
+            observations["critic"]["term_2"], torch.full((self.num_envs, 2, 1), 0.5, device=self.device)
+        )
+        # check that the history is ordered from the oldest to the most recent observation
+        for _ in range(3):
+            observations = self.obs_man.compute()
+        expected_history = torch.tensor([1.0, 1.5, 2.0], device=self.device).expand(self.num_envs, -1)
+        torch.testing.assert_close(observations["policy"][:, 16:19], expected_history)
+        torch.testing.assert_close(observations["critic"]["term_2"], expected_history[:, 1:].unsqueeze(-1))
+
+        # check that reset clears the history of the reset environments
+        self.obs_man.reset(env_ids=[0, 4])
+        observations = self.obs_man.compute()
+        torch.testing.assert_close(observations["policy"][0, 16:19], torch.full((3,), 0.5, device=self.device))
+        torch.testing.assert_close(observations["policy"][1, 16:19], torch.tensor([1.5, 2.0, 2.5], device=self.device))
+
     def test_invalid_observation_config(self):
         """Test the invalid observation config."""
 
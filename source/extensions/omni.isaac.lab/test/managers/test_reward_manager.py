@@ -12,10 +12,14 @@ simulation_app = AppLauncher(headless=True).app
 
 """Rest everything follows."""
 
+import json
+import os
+import tempfile
+import torch
 import unittest
 from collections import namedtuple
 
-from omni.isaac.lab.managers import RewardManager, RewardTermCfg
+from omni.isaac.lab.managers import ManagerProfiler, ManagerProfilerCfg, RewardManager, RewardTermCfg
 from omni.isaac.lab.utils import configclass
 
 
@@ -39,7 +43,9 @@ class TestRewardManager(unittest.TestCase):
     """Test cases for various situations with reward manager."""
 
     def setUp(self) -> None:
-        self.env = namedtuple("ManagerBasedRLEnv", ["num_envs", "dt", "device"])(20, 0.1, "cpu")
+        self.env = namedtuple("ManagerBasedRLEnv", ["num_envs", "dt", "device", "max_episode_length_s"])(
+            20, 0.1, "cpu", 10.0
+        )
 
     def test_str(self):
         """Test the string representation of the reward manager."""
@@ -123,6 +129,90 @@ class TestRewardManager(unittest.TestCase):
         self.assertEqual(float(rewards[0]), expected_reward)
         self.assertEqual(tuple(rewards.shape), (self.env.num_envs,))
 
+    def test_compute_stacked_terms(self):
+        """Test the computation of reward and episodic sums with the stacked term values."""
+        cfg = {
+            "term_1": RewardTermCfg(func=grilled_chicken, weight=10),
+            "term_2": RewardTermCfg(func=grilled_chicken_with_bbq, weight=5, params={"bbq": True}),
+            "term_3": RewardTermCfg(func=grilled_chicken, weight=-2.0),
+        }
+        self.rew_man = RewardManager(cfg, self.env)
+        # compute reward multiple times
+        num_steps = 3
+        for _ in range(num_steps):
+            rewards = self.rew_man.compute(dt=self.env.dt)
+        # check the raw values of the terms
+        self.assertEqual(tuple(self.rew_man.term_values.shape), (self.env.num_envs, 3))
+        torch.testing.assert_close(self.rew_man.term_values[0], torch.tensor([1.0, 0.0, 1.0]))
+        # check the total reward
+        torch.testing.assert_close(rewards, torch.full((self.env.num_envs,), 8.0 * self.env.dt))
+        # check the episodic sums
+        torch.testing.assert_close(
+            self.rew_man._episode_sums["term_3"], torch.full((self.env.num_envs,), -2.0 * self.env.dt * num_steps)
+        )
+
+        # change the weight of a term
+        term_cfg = self.rew_man.get_term_cfg("term_1")
+        term_cfg.weight = 1.0
+        self.rew_man.set_term_cfg("term_1", term_cfg)
+        rewards = self.rew_man.compute(dt=self.env.dt)
+        torch.testing.assert_close(rewards, torch.full((self.env.num_envs,), -1.0 * self.env.dt))
+        # disable a term
+        term_cfg.weight = 0.0
+        self.rew_man.set_term_cfg("term_1", term_cfg)
+        rewards = self.rew_man.compute(dt=self.env.dt)
+        torch.testing.assert_close(self.rew_man.term_values[0], torch.tensor([0.0, 0.0, 1.0]))
+        torch.testing.assert_close(rewards, torch.full((self.env.num_envs,), -2.0 * self.env.dt))
+
+        # check that reset logs and clears the episodic sums
+        extras = self.rew_man.reset(env_ids=[0, 1])
+        self.assertEqual(len(extras), 3)
+        self.assertAlmostEqual(
+            float(extras["Episode_Reward/term_3"]), -2.0 * self.env.dt * (num_steps + 2) / self.env.max_episode_length_s
+        )
+        self.assertEqual(float(self.rew_man._episode_sums["term_3"][0]), 0.0)
+        self.assertNotEqual(float(self.rew_man._episode_sums["term_3"][2]), 0.0)
+
+    def test_profiler(self):
+        """Test timing the reward terms with the manager profiler."""
+        cfg = {
+            "term_1": RewardTermCfg(func=grilled_chicken, weight=10),
+            "term_2": RewardTermCfg(func=grilled_chicken_with_bbq, weight=5, params={"bbq": True}),
+            "term_3": RewardTermCfg(func=grilled_chicken_with_curry, weight=0.0, params={"hot": False}),
+        }
+        self.rew_man = RewardManager(cfg, self.env)
+        self.assertIsNone(self.rew_man.profiler)
+
+        with tempfile.TemporaryDirectory() as log_dir:
+            # attach the profiler
+            profiler = ManagerProfiler(ManagerProfilerCfg(dump_interval=2, log_dir=log_dir), device=self.env.device)
+            self.rew_man.set_profiler(profiler)
+            # compute rewards multiple times
+            for _ in range(4):
+                self.rew_man.compute(dt=0.01)
+                profiler.step()
+            # check the recorded statistics
+            # note: terms with zero weight are skipped by the manager
+            summary = profiler.summary()
+            self.assertEqual(sorted(summary.keys()), ["RewardManager/term_1", "RewardManager/term_2"])
+            for stats in summary.values():
+                self.assertEqual(stats["num_calls"], 4)
+                self.assertLessEqual(stats["min"], stats["window_mean"])
+                self.assertLessEqual(stats["window_mean"], stats["max"])
+            # check the dumped reports
+            self.assertEqual(
+                sorted(os.listdir(log_dir)), ["manager_profile_step_2.json", "manager_profile_step_4.json"]
+            )
+            with open(os.path.join(log_dir, "manager_profile_step_4.json")) as f:
+                report = json.load(f)
+            self.assertEqual(report["step"], 4)
+            self.assertEqual(report["terms"]["RewardManager/term_1"]["num_calls"], 4)
+
+        # check that detaching the profiler stops the recording
+        self.rew_man.set_profiler(None)
+        self.rew_man.compute(dt=0.01)
+        self.assertEqual(profiler.summary()["RewardManager/term_1"]["num_calls"], 4)
+
     def test_active_terms(self):
         """Test the correct reading of active terms."""
         cfg = {
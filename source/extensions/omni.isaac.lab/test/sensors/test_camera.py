@@ -23,10 +23,12 @@ import random
 import scipy.spatial.transform as tf
 import torch
 import unittest
+from unittest import mock
 
 import omni.isaac.core.utils.prims as prim_utils
 import omni.isaac.core.utils.stage as stage_utils
 import omni.replicator.core as rep
+import warp as wp
 from omni.isaac.core.prims import GeometryPrim, RigidPrim
 from pxr import Gf, Usd, UsdGeom
 
@@ -231,6 +233,53 @@ class TestCamera(unittest.TestCase):
                 for im_data in cam.data.output.to_dict().values():
                     self.assertEqual(im_data.shape, (1, self.camera_cfg.height, self.camera_cfg.width))
 
+    def test_batched_annotator_readout(self):
+        """Test that the annotator outputs of the cameras are read as a batch and only for the outdated cameras."""
+        num_cameras = 4
+        # create the cameras
+        for i in range(num_cameras):
+            prim_utils.create_prim(f"/World/Origin_{i}", "Xform", translation=(i, 0.0, 0.0))
+        camera_cfg = copy.deepcopy(self.camera_cfg)
+        camera_cfg.prim_path = "/World/Origin_.*/CameraSensor"
+        camera_cfg.data_types = ["distance_to_image_plane", "semantic_segmentation"]
+        camera_cfg.colorize_semantic_segmentation = True
+        camera = Camera(camera_cfg)
+
+        # play sim
+        self.sim.reset()
+        self.sim.step()
+        camera.update(self.dt)
+
+        # replace the annotators with ones that return numpy and warp arrays
+        height, width = camera.image_shape
+        depth = torch.rand(num_cameras, height, width, device=camera.device)
+        segmentation = torch.randint(0, 2**31 - 1, (num_cameras, height, width), dtype=torch.int32)
+        for i in range(num_cameras):
+            camera._rep_registry["distance_to_image_plane"][i] = mock.MagicMock(
+                get_data=mock.MagicMock(return_value=wp.from_torch(depth[i]))
+            )
+            camera._rep_registry["semantic_segmentation"][i] = mock.MagicMock(
+                get_data=mock.MagicMock(return_value={"data": segmentation[i].numpy(), "info": {"index": i}})
+            )
+        # read all the cameras
+        camera.update(self.dt)
+        output = camera.data.output
+        torch.testing.assert_close(output["distance_to_image_plane"], depth)
+        expected_segmentation = segmentation.view(torch.uint8).reshape(num_cameras, height, width, 4)
+        torch.testing.assert_close(output["semantic_segmentation"].cpu(), expected_segmentation)
+        self.assertEqual(
+            [info["semantic_segmentation"] for info in camera.data.info], [{"index": i} for i in range(num_cameras)]
+        )
+
+        # read only the outdated cameras
+        depth[:] = 0.0
+        camera.reset(env_ids=[1, 3])
+        output = camera.data.output
+        self.assertEqual(output["distance_to_image_plane"][[1, 3]].abs().sum().item(), 0.0)
+        self.assertTrue(torch.all(output["distance_to_image_plane"][[0, 2]] > 0.0))
+        for i in range(num_cameras):
+            self.assertEqual(camera._rep_registry["distance_to_image_plane"][i].get_data.call_count, 2 if i % 2 else 1)
+
     def test_camera_init_intrinsic_matrix(self):
         """Test camera initialization from intrinsic matrix."""
         # get the first camera
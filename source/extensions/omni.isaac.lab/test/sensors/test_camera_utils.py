@@ -0,0 +1,116 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+import omni.isaac.lab.utils.math as math_utils
+from omni.isaac.lab.sensors.camera.utils import (
+    create_pointcloud_from_depth,
+    create_pointclouds_from_depth,
+    create_pointclouds_from_rgbd,
+)
+
+
+class TestCameraUtils(unittest.TestCase):
+    """Test the batched pointcloud creation from camera images."""
+
+    def setUp(self):
+        self.device = "cuda:0"
+        self.num_cameras = 4
+        self.height, self.width = 12, 16
+        # intrinsics of the cameras
+        self.intrinsic_matrices = torch.tensor(
+            [[20.0, 0.0, 8.0], [0.0, 20.0, 6.0], [0.0, 0.0, 1.0]], device=self.device
+        ).repeat(self.num_cameras, 1, 1)
+        # depth images with invalid pixels
+        self.depth = torch.rand(self.num_cameras, self.height, self.width, device=self.device) + 0.5
+        self.depth[0, :4] = torch.inf
+        self.depth[1, :, :3] = 0.0
+        self.depth[2, 5, 5] = torch.nan
+        # poses of the cameras
+        self.positions = torch.rand(self.num_cameras, 3, device=self.device)
+        self.orientations = math_utils.random_orientation(self.num_cameras, device=self.device)
+
+    def test_pointclouds_from_depth(self):
+        """Test that the valid points of each camera match the single camera pointclouds."""
+        points, valid = create_pointclouds_from_depth(
+            self.intrinsic_matrices, self.depth, self.positions, self.orientations
+        )
+        self.assertEqual(points.shape, (self.num_cameras, self.height * self.width, 3))
+        for i in range(self.num_cameras):
+            expected_points = create_pointcloud_from_depth(
+                self.intrinsic_matrices[i], self.depth[i], position=self.positions[i], orientation=self.orientations[i]
+            )
+            # remove the points of zero depth
+            expected_points = expected_points[(self.depth[i].T.flatten() > 0.0)[self.depth[i].T.flatten().isfinite()]]
+            num_valid = len(expected_points)
+            # check that the valid points come first
+            self.assertTrue(torch.all(valid[i, :num_valid]))
+            self.assertFalse(torch.any(valid[i, num_valid:]))
+            torch.testing.assert_close(points[i, :num_valid], expected_points)
+            torch.testing.assert_close(points[i, num_valid:], torch.zeros_like(points[i, num_valid:]))
+
+    def test_pointclouds_sampling(self):
+        """Test that a fixed number of valid points is sampled from each pointcloud."""
+        all_points, all_valid = create_pointclouds_from_depth(self.intrinsic_matrices, self.depth)
+        points, valid = create_pointclouds_from_depth(self.intrinsic_matrices, self.depth, num_points=100)
+        self.assertEqual(points.shape, (self.num_cameras, 100, 3))
+        self.assertTrue(torch.all(valid))
+        # check that the sampled points are distinct valid points
+        for i in range(self.num_cameras):
+            distances = torch.cdist(points[i], all_points[i, all_valid[i]], compute_mode="donot_use_mm_for_euclid_dist")
+            self.assertTrue(torch.all(distances.min(dim=1)[0] < 1e-6))
+            self.assertEqual(len(torch.unique(points[i], dim=0)), 100)
+        # check the padding when more points are requested than there are pixels
+        num_points = 2 * self.height * self.width
+        points, valid = create_pointclouds_from_depth(self.intrinsic_matrices, self.depth, num_points=num_points)
+        self.assertEqual(points.shape, (self.num_cameras, num_points, 3))
+        torch.testing.assert_close(valid.sum(dim=1), all_valid.sum(dim=1))
+
+    def test_pointclouds_voxel_downsampling(self):
+        """Test that a single point is kept in each occupied voxel."""
+        voxel_size = 0.1
+        all_points, all_valid = create_pointclouds_from_depth(self.intrinsic_matrices, self.depth)
+        points, valid = create_pointclouds_from_depth(self.intrinsic_matrices, self.depth, voxel_size=voxel_size)
+        for i in range(self.num_cameras):
+            voxels = torch.floor(points[i, valid[i]] / voxel_size)
+            expected_voxels = torch.unique(torch.floor(all_points[i, all_valid[i]] / voxel_size), dim=0)
+            self.assertEqual(len(voxels), len(expected_voxels))
+            torch.testing.assert_close(torch.unique(voxels, dim=0), expected_voxels)
+
+    def test_pointclouds_fusion(self):
+        """Test that the cameras of each environment are fused into a single colored pointcloud."""
+        rgb = torch.randint(0, 255, (self.num_cameras, self.height, self.width, 3), device=self.device)
+        points, colors, valid = create_pointclouds_from_rgbd(
+            self.intrinsic_matrices, self.depth, rgb, self.positions, self.orientations, num_cameras_per_env=2
+        )
+        self.assertEqual(points.shape, (self.num_cameras // 2, 2 * self.height * self.width, 3))
+        self.assertEqual(colors.shape, (self.num_cameras // 2, 2 * self.height * self.width, 3))
+        # check against the pointclouds of the individual cameras
+        camera_points, camera_colors, camera_valid = create_pointclouds_from_rgbd(
+            self.intrinsic_matrices, self.depth, rgb, self.positions, self.orientations
+        )
+        for i in range(self.num_cameras // 2):
+            expected_points = torch.cat([camera_points[2 * i + j, camera_valid[2 * i + j]] for j in range(2)])
+            expected_colors = torch.cat([camera_colors[2 * i + j, camera_valid[2 * i + j]] for j in range(2)])
+            torch.testing.assert_close(points[i, valid[i]], expected_points)
+            torch.testing.assert_close(colors[i, valid[i]], expected_colors)
+        # check that the number of cameras must be divisible
+        with self.assertRaises(ValueError):
+            create_pointclouds_from_depth(self.intrinsic_matrices, self.depth, num_cameras_per_env=3)
+
+
+if __name__ == "__main__":
+    run_tests()
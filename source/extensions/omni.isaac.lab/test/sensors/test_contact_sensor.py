@@ -363,6 +363,8 @@ class TestContactSensor(unittest.TestCase):
         # reset the test state
         sensor.reset()
         expected_last_test_contact_time = 0
+        # history of the net forces with the most recent entry first
+        expected_net_forces_w_history = torch.zeros_like(sensor.data.net_forces_w_history)
         expected_last_reset_contact_time = 0
 
         # set poses for shape for a given contact sensor test mode.
@@ -387,10 +389,14 @@ class TestContactSensor(unittest.TestCase):
                 shape.write_root_pose_to_sim(root_pose=test_pose)
                 # perform simulation step
                 self._perform_sim_step()
+                expected_net_forces_w_history = torch.roll(expected_net_forces_w_history, 1, dims=1)
+                expected_net_forces_w_history[:, 0] = sensor.data.net_forces_w
                 # increment contact time
                 current_test_time += self.sim_dt
             # set last contact time to the previous desired contact duration plus the extra dt allowance.
             expected_last_test_contact_time = self.durations[idx - 1] + self.sim_dt if idx > 0 else 0
+            # Check the history of the net forces
+            self._check_net_forces_history(sensor=sensor, expected_net_forces_w_history=expected_net_forces_w_history)
             # Check the data inside the contact sensor
             if mode == ContactTestMode.IN_CONTACT:
                 self._check_prim_contact_state_times(
@@ -414,6 +420,8 @@ class TestContactSensor(unittest.TestCase):
             shape.write_root_pose_to_sim(root_pose=reset_pose)
             # perform simulation step
             self._perform_sim_step()
+            expected_net_forces_w_history = torch.roll(expected_net_forces_w_history, 1, dims=1)
+            expected_net_forces_w_history[:, 0] = sensor.data.net_forces_w
             # set the last air time to 2 sim_dt steps, because last_air_time and last_contact_time
             # adds an additional sim_dt to the total time spent in the previous contact mode for uncertainty in
             # when the contact switch happened in between a dt step.
@@ -460,6 +468,19 @@ class TestContactSensor(unittest.TestCase):
         self.assertEqual(sensor.compute_first_contact(dt=dt).item(), in_contact)
         self.assertEqual(sensor.compute_first_air(dt=dt).item(), in_air)
 
+    def _check_net_forces_history(self, sensor: ContactSensor, expected_net_forces_w_history: torch.Tensor) -> None:
+        """Checks the history of the net forces and its reductions match the expected values.
+
+        Args:
+            sensor: Instance of ContactSensor containing data to be tested.
+            expected_net_forces_w_history: History of the net forces ground truth, with the most recent entry first.
+        """
+        torch.testing.assert_close(sensor.data.net_forces_w_history, expected_net_forces_w_history)
+        # check the reductions over the history
+        expected_norms = torch.norm(expected_net_forces_w_history, dim=-1)
+        torch.testing.assert_close(sensor.compute_net_forces_history_norm("max"), torch.max(expected_norms, dim=1)[0])
+        torch.testing.assert_close(sensor.compute_net_forces_history_norm("mean"), torch.mean(expected_norms, dim=1))
+
     def _perform_sim_step(self) -> None:
         """Updates sensors and steps the contact sensor test scene."""
         # write data to simulation
@@ -0,0 +1,113 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+import os
+import tempfile
+import torch
+import unittest
+
+from omni.isaac.lab.sensors.camera import ImageWriter
+
+
+class TestImageWriter(unittest.TestCase):
+    """Test the writer that saves the camera outputs in the background."""
+
+    def setUp(self):
+        self.device = "cuda:0"
+        self.num_frames = 5
+        # outputs of four cameras
+        self.outputs = [
+            {
+                "rgb": torch.randint(0, 256, (4, 12, 16, 3), dtype=torch.uint8, device=self.device),
+                "distance_to_image_plane": torch.rand(4, 12, 16, 1, device=self.device),
+            }
+            for _ in range(self.num_frames)
+        ]
+        # directory to save the outputs in
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_write_npy(self):
+        """Test that the outputs are saved as one shard per frame."""
+        # use a single slot so that the writes wait for the workers
+        with ImageWriter(self.output_dir, file_format="npy", max_queue_size=1) as writer:
+            for output in self.outputs:
+                writer.write(output)
+        # check the saved outputs
+        for frame, output in enumerate(self.outputs):
+            for name, images in output.items():
+                saved_images = np.load(os.path.join(self.output_dir, name, f"{frame:06d}.npy"))
+                np.testing.assert_array_equal(saved_images, images.cpu().numpy())
+
+    def test_write_raw(self):
+        """Test that the outputs are saved as raw bytes with explicit frame numbers."""
+        writer = ImageWriter(self.output_dir, file_format="raw", num_workers=1, frame_padding=3)
+        for frame, output in enumerate(self.outputs):
+            writer.write(output, frame=10 * frame)
+        writer.flush()
+        # check the saved outputs
+        for frame, output in enumerate(self.outputs):
+            for name, images in output.items():
+                file_path = os.path.join(self.output_dir, name, f"{10 * frame:03d}.raw")
+                saved_images = np.fromfile(file_path, dtype=images.cpu().numpy().dtype).reshape(images.shape)
+                np.testing.assert_array_equal(saved_images, images.cpu().numpy())
+        writer.close()
+
+    def test_inputs_are_copied(self):
+        """Test that the inputs can be modified after they are queued."""
+        images = self.outputs[0]["rgb"]
+        expected_images = images.clone().cpu().numpy()
+        with ImageWriter(self.output_dir, file_format="npy") as writer:
+            writer.write({"rgb": images})
+            images.zero_()
+        saved_images = np.load(os.path.join(self.output_dir, "rgb", "000000.npy"))
+        np.testing.assert_array_equal(saved_images, expected_images)
+
+    def test_invalid_inputs(self):
+        """Test that invalid inputs are reported."""
+        with self.assertRaises(ValueError):
+            ImageWriter(self.output_dir, file_format="jpg")
+        with self.assertRaises(ValueError):
+            ImageWriter(self.output_dir, max_queue_size=0)
+        with ImageWriter(self.output_dir, file_format="png") as writer:
+            # check that images with unsupported data types or channels are rejected
+            with self.assertRaises(ValueError):
+                writer.write({"semantic_segmentation": torch.zeros(4, 12, 16, 1, dtype=torch.int32)})
+            with self.assertRaises(ValueError):
+                writer.write({"normals": torch.zeros(4, 12, 16, 2)})
+        # check that the writer cannot be used once closed
+        with self.assertRaises(RuntimeError):
+            writer.write(self.outputs[0])
+
+    def test_worker_error(self):
+        """Test that the errors of the workers are raised on the calling thread."""
+        # block the directory of the output with a file
+        with open(os.path.join(self.output_dir, "rgb"), "w"):
+            pass
+        writer = ImageWriter(self.output_dir, file_format="npy")
+        writer.write({"rgb": self.outputs[0]["rgb"]})
+        with self.assertRaises(RuntimeError):
+            writer.flush()
+        # check that the writer keeps working for the other outputs
+        writer.write({"depth": self.outputs[0]["distance_to_image_plane"]})
+        writer.close()
+        self.assertTrue(os.path.isfile(os.path.join(self.output_dir, "depth", "000001.npy")))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -28,6 +28,7 @@ import omni.replicator.core as rep
 from pxr import Gf
 
 import omni.isaac.lab.sim as sim_utils
+import omni.isaac.lab.utils.math as math_utils
 from omni.isaac.lab.sensors.camera import Camera, CameraCfg
 from omni.isaac.lab.sensors.ray_caster import RayCasterCamera, RayCasterCameraCfg, patterns
 from omni.isaac.lab.sim import PinholeCameraCfg
@@ -337,7 +338,13 @@ class TestWarpCamera(unittest.TestCase):
         rs_intrinsic_matrix = [229.31640625, 0.0, 164.810546875, 0.0, 229.826171875, 122.1650390625, 0.0, 0.0, 1.0]
         rs_intrinsic_matrix = torch.tensor(rs_intrinsic_matrix, device=camera.device).reshape(3, 3).unsqueeze(0)
         # Set matrix into simulator
+        default_unprojection_grid = camera.unprojection_grid.clone()
         camera.set_intrinsic_matrices(rs_intrinsic_matrix.clone())
+        # Check that the cached unprojection grid is recomputed from the new matrix
+        self.assertFalse(torch.allclose(default_unprojection_grid, camera.unprojection_grid))
+        torch.testing.assert_close(
+            camera.unprojection_grid, math_utils.compute_unprojection_grid(rs_intrinsic_matrix, 240, 320)
+        )
         # Simulate for a few steps
         # note: This is a workaround to ensure that the textures are loaded.
         #   Check "Known Issues" section in the documentation for more details.
@@ -0,0 +1,122 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+from collections.abc import Sequence
+
+import omni.isaac.core.utils.prims as prim_utils
+import omni.isaac.core.utils.stage as stage_utils
+
+import omni.isaac.lab.sim as sim_utils
+from omni.isaac.lab.sensors import SensorBase, SensorBaseCfg
+from omni.isaac.lab.utils import configclass
+
+
+class DummySensor(SensorBase):
+    """A sensor that records the environments it is updated for."""
+
+    def __init__(self, cfg: SensorBaseCfg):
+        super().__init__(cfg)
+        self.updated_env_ids: list[list[int]] = []
+
+    @property
+    def data(self) -> list[list[int]]:
+        self._update_outdated_buffers()
+        return self.updated_env_ids
+
+    def _initialize_impl(self):
+        super()._initialize_impl()
+
+    def _update_buffers_impl(self, env_ids: Sequence[int]):
+        self.updated_env_ids.append(env_ids.tolist())
+
+
+@configclass
+class DummySensorCfg(SensorBaseCfg):
+    """Configuration for the dummy sensor."""
+
+    class_type: type = DummySensor
+
+
+class TestSensorBase(unittest.TestCase):
+    """Test the update scheduling of the sensors."""
+
+    def setUp(self):
+        """Create a blank new stage for each test."""
+        self.num_envs = 12
+        self.dt = 0.005
+        # Create a new stage
+        stage_utils.create_new_stage()
+        # Load kit helper
+        self.sim = sim_utils.SimulationContext(sim_utils.SimulationCfg(dt=self.dt))
+        # Create the prims of the sensors
+        for env_id in range(self.num_envs):
+            prim_utils.create_prim(f"/World/envs/env_{env_id}/Sensor", "Xform")
+
+    def tearDown(self):
+        """Stops simulator after each test."""
+        # clear the stage
+        self.sim.clear_all_callbacks()
+        self.sim.clear_instance()
+
+    def _run_sensor(self, stagger_update_phases: bool, num_steps: int = 40) -> tuple[list[int], dict[int, list[int]]]:
+        """Steps the sensor and returns the number of updated environments per step and the update steps per
+        environment."""
+        sensor = DummySensor(
+            DummySensorCfg(
+                prim_path="/World/envs/env_.*/Sensor",
+                update_period=4 * self.dt,
+                stagger_update_phases=stagger_update_phases,
+            )
+        )
+        # play sim
+        self.sim.reset()
+        sensor.reset()
+        # step the sensor and read its data at every step
+        num_updated_envs = []
+        update_steps = {env_id: [] for env_id in range(self.num_envs)}
+        for step in range(num_steps):
+            num_updates = len(sensor.updated_env_ids)
+            sensor.update(self.dt)
+            sensor.data
+            # check which environments were updated
+            env_ids = sensor.updated_env_ids[-1] if len(sensor.updated_env_ids) > num_updates else []
+            num_updated_envs.append(len(env_ids))
+            for env_id in env_ids:
+                update_steps[env_id].append(step)
+        return num_updated_envs, update_steps
+
+    def test_update_period(self):
+        """Test that all the environments are updated together by default."""
+        num_updated_envs, update_steps = self._run_sensor(stagger_update_phases=False)
+        # check that the updates happen in bursts
+        self.assertEqual(num_updated_envs[1:], [0, 0, 0, self.num_envs] * 9 + [0, 0, 0])
+        for env_id in range(self.num_envs):
+            self.assertEqual(update_steps[env_id], update_steps[0])
+
+    def test_staggered_update_phases(self):
+        """Test that the updates are spread over the update period."""
+        num_updated_envs, update_steps = self._run_sensor(stagger_update_phases=True)
+        # check that the same number of environments is updated at each step after the first one
+        self.assertTrue(all(num == self.num_envs // 4 for num in num_updated_envs[1:]))
+        for env_id in range(self.num_envs):
+            # check that the environments are refreshed at the update rate
+            steps = torch.tensor(update_steps[env_id])
+            self.assertTrue(torch.all(steps.diff() <= 4))
+            self.assertTrue(torch.all(steps[1:].diff() == 4))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -244,6 +244,54 @@ class TestTiledCamera(unittest.TestCase):
 
         del camera_distance, camera_depth, camera_both
 
+    def test_low_precision_output(self):
+        """Test that the images are written with the configured low-precision data types."""
+        # Create cameras with the same pose
+        camera_cfg = copy.deepcopy(self.camera_cfg)
+        camera_cfg.prim_path = "/World/CameraFloat"
+        camera = TiledCamera(camera_cfg)
+        camera_cfg_low = copy.deepcopy(self.camera_cfg)
+        camera_cfg_low.prim_path = "/World/CameraLowPrecision"
+        camera_cfg_low.rgb_dtype = "uint8"
+        camera_cfg_low.depth_dtype = "float16"
+        camera_cfg_low.depth_clipping_range = (0.0, 10.0)
+        camera_low = TiledCamera(camera_cfg_low)
+        camera_cfg_quantized = copy.deepcopy(camera_cfg_low)
+        camera_cfg_quantized.prim_path = "/World/CameraQuantized"
+        camera_cfg_quantized.depth_dtype = "uint8"
+        camera_quantized = TiledCamera(camera_cfg_quantized)
+        # Play sim
+        self.sim.reset()
+        # Simulate for a few steps
+        # note: This is a workaround to ensure that the textures are loaded.
+        #   Check "Known Issues" section in the documentation for more details.
+        for _ in range(5):
+            self.sim.step()
+        for cam in [camera, camera_low, camera_quantized]:
+            cam.update(self.dt)
+
+        # check the data types
+        self.assertEqual(camera.data.output["rgb"].dtype, torch.float32)
+        self.assertEqual(camera_low.data.output["rgb"].dtype, torch.uint8)
+        self.assertEqual(camera_low.data.output["distance_to_camera"].dtype, torch.float16)
+        self.assertEqual(camera_quantized.data.output["distance_to_camera"].dtype, torch.uint8)
+        # check the values against the full precision images
+        rgb = camera.data.output["rgb"]
+        depth = camera.data.output["distance_to_camera"].clip(0.0, 10.0)
+        torch.testing.assert_close(
+            camera_low.data.output["rgb"].float(), torch.round(rgb.clip(0.0, 1.0) * 255.0), atol=1.0, rtol=0.0
+        )
+        torch.testing.assert_close(camera_low.data.output["distance_to_camera"], depth.half())
+        torch.testing.assert_close(
+            camera_quantized.data.output["distance_to_camera"].float(), torch.round(depth * 25.5), atol=1.0, rtol=0.0
+        )
+        # check that the depth cannot be quantized without a clipping range
+        camera_cfg_quantized.depth_clipping_range = None
+        with self.assertRaises(ValueError):
+            TiledCamera(camera_cfg_quantized)
+
+        del camera, camera_low, camera_quantized
+
     def test_depth_only_camera(self):
         """Test initialization with only depth."""
 
@@ -0,0 +1,99 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import unittest
+
+from omni.isaac.lab.terrains import TerrainCurriculum, TerrainCurriculumCfg
+
+
+class TestTerrainCurriculum(unittest.TestCase):
+    """Test the curriculum over the terrain levels."""
+
+    def setUp(self):
+        self.device = "cuda:0"
+        self.num_envs = 1024
+        # origins of a terrain with 10 levels and 4 types
+        self.terrain_origins = torch.rand(10, 4, 3, device=self.device)
+
+    def test_initial_levels(self):
+        """Test that the environments start at the allowed levels and are spread over the terrain types."""
+        curriculum = TerrainCurriculum(TerrainCurriculumCfg(), self.terrain_origins, self.num_envs, max_init_level=2)
+        # check the levels and types
+        self.assertTrue(torch.all(curriculum.levels <= 2))
+        self.assertTrue(torch.all(curriculum.num_envs_per_level[3:] == 0))
+        self.assertEqual(curriculum.num_envs_per_level.sum().item(), self.num_envs)
+        self.assertListEqual(torch.unique(curriculum.types).tolist(), [0, 1, 2, 3])
+        # check the origins
+        expected_origins = self.terrain_origins[curriculum.levels, curriculum.types]
+        torch.testing.assert_close(curriculum.get_origins(), expected_origins)
+
+    def test_deterministic_update(self):
+        """Test that the environments move by one level and the ones beyond the last level are sent randomly."""
+        curriculum = TerrainCurriculum(TerrainCurriculumCfg(), self.terrain_origins, self.num_envs, max_init_level=0)
+        env_ids = torch.arange(0, self.num_envs, 2, device=self.device)
+        move_up = torch.ones(len(env_ids), dtype=torch.bool, device=self.device)
+        move_down = torch.zeros_like(move_up)
+        # move the environments up to the last level
+        for level in range(1, 10):
+            curriculum.update(env_ids, move_up, move_down)
+            self.assertTrue(torch.all(curriculum.levels[env_ids] == level))
+            self.assertTrue(torch.all(curriculum.levels[1::2] == 0))
+        # check the success rates of the levels
+        self.assertTrue(torch.all(curriculum.success_rates[:9] > 0.5))
+        # move the environments beyond the last level
+        curriculum.update(env_ids, move_up, move_down)
+        self.assertTrue(torch.all(curriculum.levels < 10))
+        # move all the environments down
+        levels = curriculum.levels.clone()
+        curriculum.update(env_ids, move_down, move_up)
+        torch.testing.assert_close(curriculum.levels[env_ids], torch.clip(levels[env_ids] - 1, 0))
+        # check the origins
+        expected_origins = self.terrain_origins[curriculum.levels[env_ids], curriculum.types[env_ids]]
+        torch.testing.assert_close(curriculum.get_origins(env_ids), expected_origins)
+
+    def test_stochastic_update(self):
+        """Test that the environments are promoted with the configured probability."""
+        cfg = TerrainCurriculumCfg(promotion_policy="stochastic", promotion_probability=0.25)
+        curriculum = TerrainCurriculum(cfg, self.terrain_origins, self.num_envs, max_init_level=0)
+        move_up = torch.ones(self.num_envs, dtype=torch.bool, device=self.device)
+        curriculum.update(slice(None), move_up, torch.zeros_like(move_up))
+        # check the fraction of promoted environments
+        self.assertAlmostEqual(curriculum.levels.float().mean().item(), 0.25, delta=0.05)
+        # check that the inputs are not modified
+        self.assertTrue(torch.all(move_up))
+
+    def test_adaptive_update(self):
+        """Test that the environments are held back at the levels that are rarely solved."""
+        cfg = TerrainCurriculumCfg(promotion_policy="adaptive", target_success_rate=0.5, success_rate_smoothing=1.0)
+        curriculum = TerrainCurriculum(cfg, self.terrain_origins, self.num_envs, max_init_level=0)
+        env_ids = torch.arange(self.num_envs, device=self.device)
+        # a tenth of the environments solve the first level
+        move_up = env_ids < self.num_envs // 10
+        curriculum.update(env_ids, move_up, torch.zeros_like(move_up))
+        self.assertAlmostEqual(curriculum.success_rates[0].item(), 0.1, delta=1e-2)
+        # the environments that solved it are promoted with a probability of 0.2
+        num_promoted = (curriculum.levels == 1).sum().item()
+        self.assertLess(num_promoted, 0.4 * (self.num_envs // 10))
+
+    def test_invalid_target_success_rate(self):
+        """Test that the adaptive policy rejects target success rates outside of the range (0, 1)."""
+        for target_success_rate in (0.0, 1.0):
+            cfg = TerrainCurriculumCfg(promotion_policy="adaptive", target_success_rate=target_success_rate)
+            with self.assertRaises(ValueError):
+                TerrainCurriculum(cfg, self.terrain_origins, self.num_envs)
+
+
+if __name__ == "__main__":
+    run_tests()
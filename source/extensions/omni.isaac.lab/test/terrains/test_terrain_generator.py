@@ -20,8 +20,9 @@ import unittest
 
 import omni.isaac.core.utils.torch as torch_utils
 
-from omni.isaac.lab.terrains import FlatPatchSamplingCfg, TerrainGenerator, TerrainGeneratorCfg
+from omni.isaac.lab.terrains import FlatPatchSamplingCfg, HfTerrainBaseCfg, TerrainGenerator, TerrainGeneratorCfg
 from omni.isaac.lab.terrains.config.rough import ROUGH_TERRAINS_CFG
+from omni.isaac.lab.utils.warp import convert_to_warp_mesh, raycast_height_field, raycast_mesh
 
 
 class TestTerrainGenerator(unittest.TestCase):
@@ -143,6 +144,80 @@ class TestTerrainGenerator(unittest.TestCase):
                     terrain_mesh_1.faces, terrain_mesh_2.faces, atol=1e-5, err_msg="Faces are not equal"
                 )
 
+    def test_generation_cache_sub_terrains(self):
+        """Generate the terrain with only the sub-terrains cached and check that loading them gives the same
+        terrain and height map."""
+        # clear output directory
+        if os.path.exists(self.output_dir):
+            shutil.rmtree(self.output_dir)
+        # create terrain generator with only the sub-terrains cached
+        cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
+        cfg.use_cache = True
+        cfg.cache_terrain_mesh = False
+        cfg.build_height_map = True
+        cfg.seed = 0
+        cfg.cache_dir = self.output_dir
+        terrain_generators = [TerrainGenerator(cfg=cfg) for _ in range(2)]
+
+        # check that one entry is stored per unique sub-terrain (and the manifest)
+        self.assertEqual(len(os.listdir(cfg.cache_dir)), cfg.num_rows * cfg.num_cols + 1)
+        # check if the meshes and height maps are equal
+        np.testing.assert_array_equal(
+            terrain_generators[0].terrain_mesh.vertices, terrain_generators[1].terrain_mesh.vertices
+        )
+        np.testing.assert_array_equal(
+            terrain_generators[0].terrain_mesh.faces, terrain_generators[1].terrain_mesh.faces
+        )
+        torch.testing.assert_close(terrain_generators[0].height_map.heights, terrain_generators[1].height_map.heights)
+        torch.testing.assert_close(terrain_generators[0].height_map.valid, terrain_generators[1].height_map.valid)
+
+    def test_cache_eviction(self):
+        """Generate different terrains with a bounded cache and check that the least recently used entries are
+        evicted."""
+        # clear output directory
+        if os.path.exists(self.output_dir):
+            shutil.rmtree(self.output_dir)
+        # create terrain generator with a cache that can only hold a single terrain
+        cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
+        cfg.num_rows = 2
+        cfg.num_cols = 2
+        cfg.use_cache = True
+        cfg.max_cache_size = 1e-6
+        cfg.cache_dir = self.output_dir
+        hash_ids = []
+        for seed in [0, 1]:
+            cfg.seed = seed
+            TerrainGenerator(cfg=cfg)
+            hash_ids.append(set(os.listdir(cfg.cache_dir)) - {"manifest.json"})
+        # check that the entries of the first terrain are evicted
+        self.assertTrue(hash_ids[1])
+        self.assertFalse(hash_ids[0] & hash_ids[1])
+
+        # check that the terrain is loaded from the cache
+        terrain_generator = TerrainGenerator(cfg=cfg)
+        self.assertEqual(len(terrain_generator.terrain_meshes), 1)
+
+    def test_generation_parallel(self):
+        """Generates assorted terrains with multiple workers and tests that the resulting mesh does not depend on
+        the number of workers."""
+        meshes = []
+        for num_workers in [1, 4]:
+            with self.subTest(num_workers=num_workers):
+                # set initial seed
+                torch_utils.set_seed(20)
+                # create terrain generator
+                cfg = ROUGH_TERRAINS_CFG.copy()
+                cfg.num_rows = 4
+                cfg.num_cols = 4
+                cfg.curriculum = True
+                cfg.num_workers = num_workers
+                cfg.seed = 20
+                terrain_generator = TerrainGenerator(cfg=cfg)
+                meshes.append(terrain_generator.terrain_mesh)
+        # check that the meshes are identical
+        np.testing.assert_array_equal(meshes[0].vertices, meshes[1].vertices)
+        np.testing.assert_array_equal(meshes[0].faces, meshes[1].faces)
+
     def test_terrain_flat_patches(self):
         """Test the flat patches generation."""
         # create terrain generator
@@ -164,6 +239,83 @@ class TestTerrainGenerator(unittest.TestCase):
         # check that no flat patches are zero
         for _, flat_patches in terrain_generator.flat_patches.items():
             self.assertFalse(torch.allclose(flat_patches, torch.zeros_like(flat_patches)))
+        # check that the flat patches lie within their sub-terrain
+        rows, cols = torch.meshgrid(torch.arange(cfg.num_rows), torch.arange(cfg.num_cols), indexing="ij")
+        centers = torch.stack(
+            [
+                (rows + 0.5 - 0.5 * cfg.num_rows) * cfg.size[0],
+                (cols + 0.5 - 0.5 * cfg.num_cols) * cfg.size[1],
+            ],
+            dim=-1,
+        ).unsqueeze(2)
+        half_size = torch.tensor(cfg.size) * 0.5 + 1e-4
+        for _, flat_patches in terrain_generator.flat_patches.items():
+            offsets = flat_patches[..., :2].cpu() - centers
+            self.assertTrue(torch.all(offsets.abs() <= half_size))
+
+    def test_height_map(self):
+        """Test that looking up heights in the height map matches ray-casting against the terrain mesh."""
+        # create terrain generator
+        cfg = ROUGH_TERRAINS_CFG.copy()
+        cfg.num_rows = 4
+        cfg.num_cols = 4
+        cfg.build_height_map = True
+        terrain_generator = TerrainGenerator(cfg=cfg)
+        height_map = terrain_generator.height_map
+
+        # check the size of the height map
+        num_cells = (
+            round(cfg.num_rows * cfg.size[0] / cfg.horizontal_scale),
+            round(cfg.num_cols * cfg.size[1] / cfg.horizontal_scale),
+        )
+        self.assertTupleEqual(tuple(height_map.valid.shape), num_cells)
+        self.assertTupleEqual(tuple(height_map.heights.shape), (num_cells[0] + 1, num_cells[1] + 1))
+        # check that the height field sub-terrains are part of the height map
+        self.assertTrue(torch.any(height_map.valid))
+        self.assertFalse(torch.all(height_map.valid))
+
+        # ray-cast downwards on the whole terrain (including the border)
+        mesh = terrain_generator.terrain_mesh
+        wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device="cpu")
+        ray_starts = torch.rand(10000, 3) - 0.5
+        ray_starts[:, 0] *= cfg.num_rows * cfg.size[0] + 2 * cfg.border_width
+        ray_starts[:, 1] *= cfg.num_cols * cfg.size[1] + 2 * cfg.border_width
+        ray_starts[:, 2] = 10.0
+        ray_directions = torch.tensor([[0.0, 0.0, -1.0]]).repeat(10000, 1)
+        expected, _, _, _ = raycast_mesh(ray_starts, ray_directions, wp_mesh)
+        ray_hits, _ = raycast_height_field(
+            ray_starts, height_map.heights, height_map.valid, height_map.origin, height_map.resolution, mesh=wp_mesh
+        )
+        torch.testing.assert_close(ray_hits[0], expected, atol=1e-4, rtol=0.0)
+
+    def test_simplify_flat_regions(self):
+        """Test that merging the flat regions of the height field terrains keeps the surface of the terrain."""
+        meshes = []
+        for simplify in [False, True]:
+            # create terrain generator
+            cfg = ROUGH_TERRAINS_CFG.copy()
+            cfg.num_rows = 4
+            cfg.num_cols = 4
+            cfg.use_cache = False
+            cfg.seed = 0
+            for sub_terrain_cfg in cfg.sub_terrains.values():
+                if isinstance(sub_terrain_cfg, HfTerrainBaseCfg):
+                    sub_terrain_cfg.simplify_flat_regions = simplify
+            meshes.append(TerrainGenerator(cfg=cfg).terrain_mesh)
+
+        # check that the number of triangles is reduced
+        self.assertLess(len(meshes[1].faces), len(meshes[0].faces))
+        # ray-cast downwards on both meshes and check that the hits are the same
+        ray_starts = torch.rand(10000, 3) - 0.5
+        ray_starts[:, 0] *= cfg.num_rows * cfg.size[0]
+        ray_starts[:, 1] *= cfg.num_cols * cfg.size[1]
+        ray_starts[:, 2] = 10.0
+        ray_directions = torch.tensor([[0.0, 0.0, -1.0]]).repeat(10000, 1)
+        ray_hits = [
+            raycast_mesh(ray_starts, ray_directions, convert_to_warp_mesh(mesh.vertices, mesh.faces, device="cpu"))[0]
+            for mesh in meshes
+        ]
+        torch.testing.assert_close(ray_hits[1], ray_hits[0], atol=1e-4, rtol=0.0)
 
 
 if __name__ == "__main__":
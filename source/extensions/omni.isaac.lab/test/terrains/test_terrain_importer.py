@@ -153,6 +153,54 @@ class TestTerrainImporter(unittest.TestCase):
                 self.assertAlmostEqual(actualSize[0], expectedSizeX)
                 self.assertAlmostEqual(actualSize[1], expectedSizeY)
 
+    def test_tiled_terrain(self) -> None:
+        """Generates a tiled terrain and tests that only the tiles occupied by the environments are imported."""
+        for device in ("cuda:0", "cpu"):
+            with build_simulation_context(device=device, auto_add_lighting=True) as _:
+                # Handler for terrains importing
+                # note: there is one environment per column of tiles
+                num_envs = ROUGH_TERRAINS_CFG.num_cols
+                terrain_importer_cfg = terrain_gen.TerrainImporterCfg(
+                    prim_path="/World/ground",
+                    max_init_terrain_level=0,
+                    terrain_type="generator",
+                    terrain_generator=ROUGH_TERRAINS_CFG.replace(curriculum=True),
+                    num_envs=num_envs,
+                    tiled=True,
+                    tile_neighborhood=0,
+                    max_resident_tiles=2 * ROUGH_TERRAINS_CFG.num_cols,
+                )
+                terrain_importer = TerrainImporter(terrain_importer_cfg)
+                num_cols = ROUGH_TERRAINS_CFG.num_cols
+
+                # check that only the first row of tiles is imported
+                self.assertListEqual(sorted(terrain_importer.resident_tiles), [(0, col) for col in range(num_cols)])
+                self.assertTrue(prim_utils.is_prim_path_valid("/World/ground/tile_0_0"))
+                self.assertFalse(prim_utils.is_prim_path_valid("/World/ground/tile_1_0"))
+
+                # move all the environments up by two levels
+                env_ids = torch.arange(num_envs, device=device)
+                for _ in range(2):
+                    terrain_importer.update_env_origins(
+                        env_ids, torch.ones(num_envs, dtype=torch.bool, device=device), torch.zeros_like(env_ids).bool()
+                    )
+                # check that the least recently used row of tiles is removed
+                self.assertListEqual(
+                    sorted(terrain_importer.resident_tiles),
+                    [(row, col) for row in (1, 2) for col in range(num_cols)],
+                )
+                self.assertFalse(prim_utils.is_prim_path_valid("/World/ground/tile_0_0"))
+                self.assertTrue(prim_utils.is_prim_path_valid("/World/ground/tile_2_0"))
+                self.assertEqual(terrain_importer.tiles_version, 3)
+
+                # check that the tiles are not rebuilt when the environments stay on the same tiles
+                warp_mesh = terrain_importer.warp_meshes["terrain"]
+                terrain_importer.update_env_origins(
+                    env_ids, torch.zeros_like(env_ids).bool(), torch.zeros_like(env_ids).bool()
+                )
+                self.assertEqual(terrain_importer.tiles_version, 3)
+                self.assertIs(terrain_importer.warp_meshes["terrain"], warp_mesh)
+
     def test_ball_drop(self) -> None:
         """Generates assorted terrains and spheres created as meshes.
 
@@ -93,6 +93,68 @@ class TestCircularBuffer(unittest.TestCase):
 
         self.assertTrue(torch.equal(retrieved_data, expected_data))
 
+    def test_return_buffer_prop(self):
+        """Test retrieving the complete buffer ordered from the oldest to the most recent entry."""
+        # append data more than the maximum length
+        for i in range(self.max_len + 2):
+            data = torch.full((self.batch_size, 2), i, device=self.device)
+            self.buffer.append(data)
+        # check the complete buffer
+        history = self.buffer.buffer
+        self.assertEqual(history.shape, (self.batch_size, self.max_len, 2))
+        expected = torch.arange(2, self.max_len + 2, device=self.device).unsqueeze(-1).expand(-1, 2)
+        for index in range(self.batch_size):
+            torch.testing.assert_close(history[index], expected)
+
+        # reset one batch index and append new data
+        self.buffer.reset(batch_ids=[1])
+        data = torch.full((self.batch_size, 2), 10, device=self.device)
+        self.buffer.append(data)
+        history = self.buffer.buffer
+        # check that the missing history is filled with the oldest pushed entry
+        torch.testing.assert_close(history[1], torch.full((self.max_len, 2), 10, device=self.device))
+        # check that the other batch indices are not affected
+        torch.testing.assert_close(history[0, :-1], expected[1:])
+        torch.testing.assert_close(history[0, -1], data[0])
+
+    def test_get_into_output(self):
+        """Test retrieving data without host checks into a pre-allocated tensor."""
+        for i in range(self.max_len + 2):
+            data = torch.full((self.batch_size, 2), i, device=self.device)
+            self.buffer.append(data)
+        # reset one batch index and append new data
+        self.buffer.reset(batch_ids=[2])
+        self.buffer.append(torch.full((self.batch_size, 2), 10, device=self.device))
+        # retrieve data with different lags
+        key = torch.tensor([0, 2, 3], dtype=torch.int, device=self.device)
+        out = torch.zeros((self.batch_size, 2), dtype=data.dtype, device=self.device)
+        retrieved_data = self.buffer.get(key, out=out)
+        # check that the data is written into the output
+        self.assertEqual(retrieved_data.data_ptr(), out.data_ptr())
+        torch.testing.assert_close(out[:, 0], torch.tensor([10, 5, 10], device=self.device))
+        # check that it matches indexing the buffer
+        torch.testing.assert_close(self.buffer.get(key), self.buffer[key])
+
+    def test_get_lags(self):
+        """Test retrieving several lags with a single gather."""
+        for i in range(self.max_len + 2):
+            data = torch.full((self.batch_size, 2), i, device=self.device)
+            self.buffer.append(data)
+        # shared lags
+        lags = torch.tensor([0, 1, 4], device=self.device)
+        retrieved_data = self.buffer.get_lags(lags)
+        self.assertEqual(retrieved_data.shape, (self.batch_size, 3, 2))
+        for index, lag in enumerate(lags.tolist()):
+            torch.testing.assert_close(
+                retrieved_data[:, index], self.buffer[torch.full((self.batch_size,), lag, device=self.device)]
+            )
+        # lags per batch index into a pre-allocated tensor
+        lags = torch.tensor([[0, 1], [2, 3], [4, 9]], device=self.device)
+        out = torch.zeros((self.batch_size, 2, 2), dtype=data.dtype, device=self.device)
+        self.buffer.get_lags(lags, out=out)
+        expected = torch.tensor([[6, 5], [4, 3], [2, 2]], device=self.device)
+        torch.testing.assert_close(out[..., 0], expected)
+
     def test_empty_buffer_access(self):
         """Test accessing an empty buffer."""
         with self.assertRaises(RuntimeError):
@@ -0,0 +1,150 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import torch
+import unittest
+from types import SimpleNamespace
+
+import omni.isaac.core.utils.prims as prim_utils
+
+import omni.isaac.lab.sim as sim_utils
+from omni.isaac.lab.actuators import ImplicitActuatorCfg
+from omni.isaac.lab.assets import Articulation, ArticulationCfg
+from omni.isaac.lab.envs.mdp.actions import JointPositionActionCfg
+from omni.isaac.lab.sim import build_simulation_context
+from omni.isaac.lab.utils.assets import ISAAC_NUCLEUS_DIR
+from omni.isaac.lab.utils.cuda_graph import CudaGraphFunction
+
+
+class TestCudaGraphFunction(unittest.TestCase):
+    """Test fixture for checking the CUDA graph wrapper."""
+
+    def setUp(self):
+        self.devices = ["cpu"]
+        if torch.cuda.is_available():
+            self.devices.append("cuda:0")
+
+    def test_persistent_buffers(self):
+        """Test that the wrapped function updates the persistent buffers on every call."""
+        for device in self.devices:
+            with self.subTest(device=device):
+                inputs = torch.zeros(64, 12, device=device)
+                outputs = torch.zeros_like(inputs)
+
+                def compute():
+                    torch.mul(inputs, 2.0, out=outputs)
+                    outputs.clamp_(max=10.0)
+
+                graphed_compute = CudaGraphFunction(compute, device=device, num_warmup_calls=2)
+                self.assertEqual(graphed_compute.is_enabled, "cuda" in device)
+                # call the function multiple times with changing inputs
+                for step in range(8):
+                    inputs.fill_(step)
+                    graphed_compute()
+                    torch.testing.assert_close(outputs, torch.full_like(inputs, min(2.0 * step, 10.0)))
+                # check that the graph is only captured on CUDA devices
+                self.assertEqual(graphed_compute.is_captured, "cuda" in device)
+
+                # check that resetting discards the graph
+                graphed_compute.reset()
+                self.assertFalse(graphed_compute.is_captured)
+                inputs.fill_(1.0)
+                graphed_compute()
+                torch.testing.assert_close(outputs, torch.full_like(inputs, 2.0))
+
+    def test_disabled(self):
+        """Test that the function is called eagerly when disabled."""
+        for device in self.devices:
+            with self.subTest(device=device):
+                num_calls = [0]
+
+                def count():
+                    num_calls[0] += 1
+
+                graphed_count = CudaGraphFunction(count, device=device, num_warmup_calls=1, enabled=False)
+                for _ in range(5):
+                    graphed_count()
+                self.assertFalse(graphed_count.is_enabled)
+                self.assertFalse(graphed_count.is_captured)
+                self.assertEqual(num_calls[0], 5)
+
+    def test_capture_failure_fallback(self):
+        """Test that the function is called eagerly if the capture fails."""
+        if not torch.cuda.is_available():
+            self.skipTest("CUDA is not available.")
+        values = torch.zeros(4, device="cuda:0")
+        results = []
+
+        def synchronize():
+            values.add_(1.0)
+            # note: reading values on the host is not allowed while capturing
+            results.append(values.sum().item())
+
+        graphed_synchronize = CudaGraphFunction(synchronize, device="cuda:0", num_warmup_calls=1)
+        for _ in range(3):
+            graphed_synchronize()
+        self.assertFalse(graphed_synchronize.is_enabled)
+        self.assertFalse(graphed_synchronize.is_captured)
+        self.assertEqual(results[-1], float(values.sum().item()))
+
+
+class TestCudaGraphActionTerm(unittest.TestCase):
+    """Test fixture for replaying the application of action terms as a CUDA graph."""
+
+    def test_joint_position_action(self):
+        """Test that replaying a joint position action term sets the same joint targets as calling it eagerly."""
+        if not torch.cuda.is_available():
+            self.skipTest("CUDA is not available.")
+        device = "cuda:0"
+        num_envs, num_steps = 4, 8
+        with build_simulation_context(device=device, add_ground_plane=True, auto_add_lighting=True) as sim:
+            # create the robots
+            for i in range(num_envs):
+                prim_utils.create_prim(f"/World/Env_{i}", "Xform", translation=(1.5 * i, 0.0, 0.0))
+            robot = Articulation(
+                ArticulationCfg(
+                    prim_path="/World/Env_.*/Robot",
+                    spawn=sim_utils.UsdFileCfg(
+                        usd_path=f"{ISAAC_NUCLEUS_DIR}/Robots/Humanoid/humanoid_instanceable.usd"
+                    ),
+                    init_state=ArticulationCfg.InitialStateCfg(pos=(0.0, 0.0, 1.34)),
+                    actuators={"body": ImplicitActuatorCfg(joint_names_expr=[".*"], stiffness=10.0, damping=2.0)},
+                )
+            )
+            sim.reset()
+            # create the action term with a minimal environment
+            env = SimpleNamespace(scene={"robot": robot}, num_envs=num_envs, device=device)
+            cfg = JointPositionActionCfg(asset_name="robot", joint_names=[".*"], scale=0.5)
+            term = cfg.class_type(cfg, env)
+            actions = [torch.randn(num_envs, term.action_dim, device=device) for _ in range(num_steps)]
+
+            # apply the actions eagerly
+            expected_targets = []
+            for step_actions in actions:
+                term.process_actions(step_actions)
+                term.apply_actions()
+                expected_targets.append(robot.data.joint_pos_target.clone())
+
+            # apply the actions through the graph
+            robot.data.joint_pos_target.zero_()
+            graphed_apply_actions = CudaGraphFunction(term.apply_actions, device=device, num_warmup_calls=2)
+            for step_actions, targets in zip(actions, expected_targets):
+                term.process_actions(step_actions)
+                graphed_apply_actions()
+                torch.testing.assert_close(robot.data.joint_pos_target, targets)
+            self.assertTrue(graphed_apply_actions.is_captured)
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -87,6 +87,28 @@ class TestDelayBuffer(unittest.TestCase):
                 error = delayed_data[i] - all_data[true_delayed_index[i]][i]
                 self.assertTrue(torch.all(error == 0))
 
+    def test_grouped_data_into_output(self):
+        """Test delaying stacked data with random delays into a pre-allocated tensor."""
+        max_lag: int = 3
+        time_lags = torch.randint(low=0, high=max_lag + 1, size=(self.batch_size,), dtype=torch.int, device=self.device)
+
+        self.buffer.set_time_lag(time_lags)
+
+        out = torch.zeros((self.batch_size, 3, 1), dtype=torch.int, device=self.device)
+        all_data = []
+        for i, data in enumerate(self._generate_data(20)):
+            # stack three quantities sharing the same delay
+            grouped_data = torch.stack((data, 2 * data, 3 * data), dim=1)
+            all_data.append(grouped_data)
+            # apply delay
+            delayed_data = self.buffer.compute(grouped_data, out=out)
+            self.assertEqual(delayed_data.data_ptr(), out.data_ptr())
+            true_delayed_index = torch.maximum(i - self.buffer.time_lags, torch.zeros_like(self.buffer.time_lags))
+            true_delayed_index = true_delayed_index.tolist()
+            for i in range(self.batch_size):
+                error = out[i] - all_data[true_delayed_index[i]][i]
+                self.assertTrue(torch.all(error == 0))
+
     """Helper functions."""
 
     def _generate_data(self, length: int) -> Generator[torch.Tensor]:
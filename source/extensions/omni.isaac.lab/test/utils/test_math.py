@@ -376,6 +376,29 @@ class TestMathUtilities(unittest.TestCase):
                 iter_old_quat_rotate_inverse(q_rand, v_rand),
             )
 
+    def test_unproject_depth_with_grid(self):
+        """Test that unprojecting depth images with a precomputed grid matches the computation from intrinsics."""
+        for device in ["cpu", "cuda:0"]:
+            # prepare intrinsics of two cameras and their depth images
+            intrinsics = torch.tensor([[20.0, 0.0, 8.0], [0.0, 20.0, 6.0], [0.0, 0.0, 1.0]], device=device)
+            intrinsics = torch.stack([intrinsics, 2.0 * intrinsics])
+            intrinsics[:, 2, 2] = 1.0
+            depth = math_utils.sample_uniform(0.1, 10.0, (2, 12, 16), device=device)
+            # compute the grid once
+            grid = math_utils.compute_unprojection_grid(intrinsics, 12, 16)
+            self.assertEqual(grid.shape, (2, 12 * 16, 3))
+            torch.testing.assert_close(grid[..., 2], torch.ones(2, 12 * 16, device=device))
+            # check that the points match
+            points = math_utils.unproject_depth(depth, intrinsics)
+            torch.testing.assert_close(math_utils.unproject_depth(depth, intrinsics, grid), points)
+            # check that the points project back to the pixels
+            projected_points = math_utils.project_points(points, intrinsics)
+            torch.testing.assert_close(projected_points[..., 2], depth.transpose(1, 2).reshape(2, -1))
+            # check a single camera
+            torch.testing.assert_close(
+                math_utils.unproject_depth(depth[0], intrinsics[0], grid[0]), points[0], rtol=1e-5, atol=1e-5
+            )
+
 
 if __name__ == "__main__":
     run_tests()
@@ -0,0 +1,328 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from omni.isaac.lab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import numpy as np
+import torch
+import trimesh
+import unittest
+
+import warp as wp
+
+from omni.isaac.lab.terrains.height_field.utils import convert_height_field_to_mesh
+from omni.isaac.lab.utils.math import (
+    combine_frame_transforms,
+    convert_quat,
+    quat_apply,
+    random_orientation,
+    random_yaw_orientation,
+    subtract_frame_transforms,
+    yaw_quat,
+)
+from omni.isaac.lab.utils.warp import convert_to_warp_mesh, raycast_height_field, raycast_mesh, raycast_meshes
+from omni.isaac.lab.utils.warp.kernels import compute_frame_transforms, reshape_tiled_image
+
+
+class TestWarpRaycast(unittest.TestCase):
+    """Test fixture for checking the ray-casting operations based on warp."""
+
+    def setUp(self):
+        self.device = "cuda:0"
+        # ground box with its top face at z = 0
+        ground = trimesh.creation.box((10.0, 10.0, 1.0))
+        ground.apply_translation((0.0, 0.0, -0.5))
+        self.ground = convert_to_warp_mesh(ground.vertices, ground.faces, device=self.device)
+        # obstacle box with its top face at z = 1
+        obstacle = trimesh.creation.box((1.0, 1.0, 1.0))
+        obstacle.apply_translation((0.0, 0.0, 0.5))
+        self.obstacle = convert_to_warp_mesh(obstacle.vertices, obstacle.faces, device=self.device)
+        # rays pointing downwards: one above the obstacle, one above the ground and one missing all meshes
+        self.ray_starts = torch.tensor([[0.0, 0.0, 5.0], [3.0, 0.0, 5.0], [20.0, 0.0, 5.0]], device=self.device)
+        self.ray_directions = torch.tensor([[0.0, 0.0, -1.0]], device=self.device).repeat(3, 1)
+
+    def test_raycast_single_mesh(self):
+        """Test that ray-casting against a single mesh matches the single mesh function."""
+        ray_starts = self.ray_starts.repeat(2, 1, 1)
+        ray_directions = self.ray_directions.repeat(2, 1, 1)
+        mesh_ids = torch.tensor([[self.ground.id]] * 2, dtype=torch.int64, device=self.device)
+        ray_hits, ray_distance, ray_normal, ray_face_id, _ = raycast_meshes(
+            ray_starts, ray_directions, mesh_ids, return_distance=True, return_normal=True, return_face_id=True
+        )
+        expected = raycast_mesh(
+            ray_starts,
+            ray_directions,
+            self.ground,
+            return_distance=True,
+            return_normal=True,
+            return_face_id=True,
+        )
+        torch.testing.assert_close(ray_hits, expected[0])
+        torch.testing.assert_close(ray_distance, expected[1])
+        torch.testing.assert_close(ray_normal, expected[2])
+        torch.testing.assert_close(ray_face_id, expected[3])
+
+    def test_raycast_multiple_meshes(self):
+        """Test that the closest hit across a shared and an instanced mesh is returned."""
+        ray_starts = self.ray_starts.repeat(2, 1, 1)
+        ray_directions = self.ray_directions.repeat(2, 1, 1)
+        # the first batch has the obstacle instanced, the second batch only has the ground
+        mesh_ids = torch.tensor(
+            [[self.ground.id, self.obstacle.id], [self.ground.id, self.ground.id]],
+            dtype=torch.int64,
+            device=self.device,
+        )
+        ray_hits, ray_distance, _, _, ray_mesh_id = raycast_meshes(
+            ray_starts, ray_directions, mesh_ids, return_distance=True, return_mesh_id=True
+        )
+        # check the hits
+        torch.testing.assert_close(ray_hits[0, 0], torch.tensor([0.0, 0.0, 1.0], device=self.device))
+        torch.testing.assert_close(ray_hits[0, 1], torch.tensor([3.0, 0.0, 0.0], device=self.device))
+        torch.testing.assert_close(ray_hits[1, 0], torch.tensor([0.0, 0.0, 0.0], device=self.device))
+        torch.testing.assert_close(ray_distance[:, :2], torch.tensor([[4.0, 5.0], [5.0, 5.0]], device=self.device))
+        # check the misses
+        self.assertTrue(torch.all(torch.isinf(ray_hits[:, 2])))
+        self.assertTrue(torch.all(torch.isinf(ray_distance[:, 2])))
+        # check the mesh ids
+        self.assertEqual(ray_mesh_id.tolist(), [[1, 0, -1], [0, 0, -1]])
+
+    def test_raycast_shared_rays_in_frames(self):
+        """Test that shared rays transformed inside the kernel match the rays transformed in torch."""
+        num_batches = 4
+        mesh_ids = torch.tensor(
+            [[self.ground.id, self.obstacle.id]] * num_batches, dtype=torch.int64, device=self.device
+        )
+        # sensor poses above the ground
+        frame_pos = torch.rand(num_batches, 3, device=self.device) + torch.tensor([0.0, 0.0, 3.0], device=self.device)
+        frame_quat = random_orientation(num_batches, device=self.device)
+        # rays in the sensor frame
+        ray_starts = torch.rand(10, 3, device=self.device) - 0.5
+        ray_directions = torch.tensor([[0.1, 0.2, -1.0]], device=self.device).repeat(10, 1)
+        for rotate_directions in [True, False]:
+            with self.subTest(rotate_directions=rotate_directions):
+                quat = frame_quat if rotate_directions else yaw_quat(frame_quat)
+                ray_hits, ray_distance, _, _, ray_mesh_id = raycast_meshes(
+                    ray_starts,
+                    ray_directions,
+                    mesh_ids,
+                    frame_pos=frame_pos,
+                    frame_quat=quat,
+                    rotate_directions=rotate_directions,
+                    return_distance=True,
+                    return_mesh_id=True,
+                )
+                # transform the rays in torch
+                quat = quat.unsqueeze(1).repeat(1, 10, 1)
+                ray_starts_w = quat_apply(quat, ray_starts.repeat(num_batches, 1, 1)) + frame_pos.unsqueeze(1)
+                ray_directions_w = ray_directions.repeat(num_batches, 1, 1)
+                if rotate_directions:
+                    ray_directions_w = quat_apply(quat, ray_directions_w)
+                expected = raycast_meshes(
+                    ray_starts_w, ray_directions_w, mesh_ids, return_distance=True, return_mesh_id=True
+                )
+                torch.testing.assert_close(ray_hits, expected[0])
+                torch.testing.assert_close(ray_distance, expected[1])
+                torch.testing.assert_close(ray_mesh_id, expected[4])
+
+    def test_raycast_height_field(self):
+        """Test that looking up heights in a height field matches ray-casting against its mesh."""
+        num_batches = 8
+        # random height field with 0.1 m resolution
+        height_field = np.random.default_rng(0).integers(-50, 50, size=(41, 31)).astype(np.int16)
+        vertices, triangles = convert_height_field_to_mesh(height_field, 0.1, 0.005)
+        origin = (-2.0, -1.5)
+        vertices[:, :2] += origin
+        mesh = convert_to_warp_mesh(vertices, triangles, device=self.device)
+        mesh_ids = torch.tensor([[mesh.id]] * num_batches, dtype=torch.int64, device=self.device)
+        heights = torch.tensor(height_field * 0.005, dtype=torch.float32, device=self.device)
+        # sensor poses above the height field (some of the rays are outside of it)
+        frame_pos = torch.rand(num_batches, 3, device=self.device) * 3.0 - 1.5
+        frame_pos[:, 2] = 2.0
+        frame_quat = random_yaw_orientation(num_batches, device=self.device)
+        ray_starts = torch.rand(100, 3, device=self.device) - 0.5
+        ray_directions = torch.tensor([[0.0, 0.0, -1.0]], device=self.device).repeat(100, 1)
+        # expected hits from the mesh
+        expected, expected_distance, _, _, _ = raycast_meshes(
+            ray_starts,
+            ray_directions,
+            mesh_ids,
+            frame_pos=frame_pos,
+            frame_quat=frame_quat,
+            rotate_directions=False,
+            return_distance=True,
+        )
+        # some of the cells are invalid and fall back to the mesh
+        valid = torch.rand(heights.shape[0] - 1, heights.shape[1] - 1, device=self.device) > 0.2
+        for valid, fallback_mesh in [(torch.ones_like(valid), None), (valid, mesh)]:
+            with self.subTest(all_valid=bool(valid.all()), use_mesh=fallback_mesh is not None):
+                ray_hits, ray_distance = raycast_height_field(
+                    ray_starts,
+                    heights,
+                    valid,
+                    origin,
+                    0.1,
+                    mesh=fallback_mesh,
+                    frame_pos=frame_pos,
+                    frame_quat=frame_quat,
+                    return_distance=True,
+                )
+                torch.testing.assert_close(ray_hits, expected, atol=1e-4, rtol=0.0)
+                torch.testing.assert_close(ray_distance, expected_distance, atol=1e-4, rtol=0.0)
+        # without fallback, the rays above the invalid cells miss
+        ray_hits, _ = raycast_height_field(
+            ray_starts, heights, torch.zeros_like(valid), origin, 0.1, frame_pos=frame_pos, frame_quat=frame_quat
+        )
+        self.assertTrue(torch.all(torch.isinf(ray_hits)))
+
+
+class TestWarpTiledImage(unittest.TestCase):
+    """Test fixture for checking the reshaping of tiled images based on warp."""
+
+    def setUp(self):
+        self.device = "cuda:0"
+        # images of three cameras tiled in a grid of 2 x 2
+        self.num_tiles_x = 2
+        self.images = torch.rand(3, 4, 5, 3, device=self.device)
+        tiled_image = torch.zeros(2 * 4, 2 * 5, 3, device=self.device)
+        for index, image in enumerate(self.images):
+            row, col = divmod(index, self.num_tiles_x)
+            tiled_image[row * 4 : (row + 1) * 4, col * 5 : (col + 1) * 5] = image
+        self.tiled_image = wp.from_torch(tiled_image.flatten())
+
+    def _reshape(self, dtype: torch.dtype, clip_min: float, clip_max: float, scale: float, bias: float):
+        """Reshapes the tiled image into a batch of images of the given data type."""
+        batched_image = torch.zeros_like(self.images, dtype=dtype)
+        wp.launch(
+            kernel=reshape_tiled_image,
+            dim=self.images.shape[:3],
+            inputs=[
+                self.tiled_image,
+                wp.from_torch(batched_image),
+                *self.images.shape[1:],
+                self.num_tiles_x,
+                0,
+                clip_min,
+                clip_max,
+                scale,
+                bias,
+            ],
+            device=self.device,
+        )
+        return batched_image
+
+    def test_reshape_tiled_image(self):
+        """Test that the tiled image is reshaped into the images of the cameras."""
+        batched_image = self._reshape(torch.float32, -float("inf"), float("inf"), 1.0, 0.0)
+        torch.testing.assert_close(batched_image, self.images)
+
+    def test_reshape_tiled_image_low_precision(self):
+        """Test that the images are converted to low-precision data types while they are reshaped."""
+        # half precision
+        batched_image = self._reshape(torch.float16, -float("inf"), float("inf"), 1.0, 0.0)
+        torch.testing.assert_close(batched_image, self.images.half())
+        # quantized to 8 bits over a clipping range
+        batched_image = self._reshape(torch.uint8, 0.25, 0.75, 255.0 / 0.5, 0.5 - 0.25 * 255.0 / 0.5)
+        expected_image = torch.round((self.images.clip(0.25, 0.75) - 0.25) * 255.0 / 0.5).to(torch.uint8)
+        torch.testing.assert_close(batched_image, expected_image, atol=1, rtol=0)
+
+
+class TestWarpFrameTransforms(unittest.TestCase):
+    """Test fixture for checking the kernel of the frame transformer."""
+
+    def setUp(self):
+        self.device = "cuda:0"
+        self.num_envs, self.num_bodies = 6, 4
+        # the source frame is on the third body and two of the target frames share a body
+        self.source_body_index = 2
+        self.target_body_indices = [0, 1, 1, 3]
+        num_frames = len(self.target_body_indices)
+        # poses of the bodies as reported by PhysX: position and quaternion (x, y, z, w)
+        self.body_pos_w = torch.randn(self.num_envs, self.num_bodies, 3, device=self.device)
+        self.body_quat_w = random_orientation(self.num_envs * self.num_bodies, self.device).view(
+            self.num_envs, self.num_bodies, 4
+        )
+        self.body_transforms = torch.cat([self.body_pos_w, convert_quat(self.body_quat_w, to="xyzw")], dim=-1)
+        # offsets of the frames
+        self.source_offset_pos = torch.randn(3, device=self.device)
+        self.source_offset_quat = random_orientation(1, self.device)[0]
+        self.target_offset_pos = torch.randn(num_frames, 3, device=self.device)
+        self.target_offset_quat = random_orientation(num_frames, self.device)
+        # output buffers
+        self.source_pos_w = torch.zeros(self.num_envs, 3, device=self.device)
+        self.source_quat_w = torch.zeros(self.num_envs, 4, device=self.device)
+        self.target_pos_w = torch.zeros(self.num_envs, num_frames, 3, device=self.device)
+        self.target_quat_w = torch.zeros(self.num_envs, num_frames, 4, device=self.device)
+        self.target_pos_source = torch.zeros_like(self.target_pos_w)
+        self.target_quat_source = torch.zeros_like(self.target_quat_w)
+
+    def test_compute_frame_transforms(self):
+        """Test that the kernel matches the frame transforms computed with torch for the given environments."""
+        env_ids = torch.tensor([0, 2, 5], dtype=torch.int32, device=self.device)
+        target_offsets = torch.cat([self.target_offset_pos, convert_quat(self.target_offset_quat, to="xyzw")], dim=-1)
+        wp.launch(
+            kernel=compute_frame_transforms,
+            dim=(len(env_ids), len(self.target_body_indices)),
+            inputs=[
+                wp.from_torch(self.body_transforms, dtype=wp.transformf),
+                wp.from_torch(env_ids),
+                self.source_body_index,
+                wp.transformf(
+                    wp.vec3f(*self.source_offset_pos.tolist()),
+                    wp.quatf(*convert_quat(self.source_offset_quat, to="xyzw").tolist()),
+                ),
+                wp.array(self.target_body_indices, dtype=wp.int32, device=self.device),
+                wp.from_torch(target_offsets.contiguous(), dtype=wp.transformf),
+                wp.from_torch(self.source_pos_w, dtype=wp.vec3f),
+                wp.from_torch(self.source_quat_w, dtype=wp.vec4f),
+                wp.from_torch(self.target_pos_w, dtype=wp.vec3f),
+                wp.from_torch(self.target_quat_w, dtype=wp.vec4f),
+                wp.from_torch(self.target_pos_source, dtype=wp.vec3f),
+                wp.from_torch(self.target_quat_source, dtype=wp.vec4f),
+            ],
+            device=self.device,
+        )
+        # compute the expected transforms
+        env_ids = env_ids.long()
+        num_frames = len(self.target_body_indices)
+        source_pos_w, source_quat_w = combine_frame_transforms(
+            self.body_pos_w[env_ids, self.source_body_index],
+            self.body_quat_w[env_ids, self.source_body_index],
+            self.source_offset_pos.expand(len(env_ids), 3),
+            self.source_offset_quat.expand(len(env_ids), 4),
+        )
+        target_pos_w, target_quat_w = combine_frame_transforms(
+            self.body_pos_w[env_ids][:, self.target_body_indices],
+            self.body_quat_w[env_ids][:, self.target_body_indices],
+            self.target_offset_pos.expand(len(env_ids), -1, -1),
+            self.target_offset_quat.expand(len(env_ids), -1, -1),
+        )
+        target_pos_source, target_quat_source = subtract_frame_transforms(
+            source_pos_w.unsqueeze(1).expand(-1, num_frames, -1),
+            source_quat_w.unsqueeze(1).expand(-1, num_frames, -1),
+            target_pos_w,
+            target_quat_w,
+        )
+        # check the updated environments
+        torch.testing.assert_close(self.source_pos_w[env_ids], source_pos_w)
+        torch.testing.assert_close(self.source_quat_w[env_ids], source_quat_w)
+        torch.testing.assert_close(self.target_pos_w[env_ids], target_pos_w)
+        torch.testing.assert_close(self.target_quat_w[env_ids], target_quat_w)
+        torch.testing.assert_close(self.target_pos_source[env_ids], target_pos_source)
+        torch.testing.assert_close(self.target_quat_source[env_ids], target_quat_source)
+        # check that the other environments are untouched
+        other_env_ids = [1, 3, 4]
+        self.assertTrue(torch.all(self.source_pos_w[other_env_ids] == 0.0))
+        self.assertTrue(torch.all(self.target_quat_source[other_env_ids] == 0.0))
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,102 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the environment stepping with and without the CUDA graph for applying actions.
+
+The script creates the environment twice, once with the actions applied eagerly and once with the
+application of actions replayed as a CUDA graph (see :attr:`ManagerBasedEnvCfg.use_action_cuda_graph`).
+For each mode, it steps the environment with random actions and reports the number of steps per second.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p source/standalone/benchmarks/benchmark_action_cuda_graph.py \
+        --task Isaac-Velocity-Flat-Anymal-D-v0 --num_envs 4096 --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.lab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the CUDA graph for applying actions.")
+parser.add_argument(
+    "--disable_fabric", action="store_true", default=False, help="Disable fabric and use USD I/O operations."
+)
+parser.add_argument("--num_envs", type=int, default=None, help="Number of environments to simulate.")
+parser.add_argument("--task", type=str, default=None, help="Name of the task.")
+parser.add_argument("--num_steps", type=int, default=1000, help="Number of environment steps to time.")
+parser.add_argument("--num_warmup_steps", type=int, default=50, help="Number of environment steps before timing.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import torch
+
+from omni.isaac.lab.utils.timer import Timer
+
+import omni.isaac.lab_tasks  # noqa: F401
+from omni.isaac.lab_tasks.utils import parse_env_cfg
+
+
+def run_benchmark(use_action_cuda_graph: bool) -> float:
+    """Steps the environment with random actions and returns the number of steps per second."""
+    # create environment configuration
+    env_cfg = parse_env_cfg(
+        args_cli.task, device=args_cli.device, num_envs=args_cli.num_envs, use_fabric=not args_cli.disable_fabric
+    )
+    env_cfg.use_action_cuda_graph = use_action_cuda_graph
+    # create environment
+    env = gym.make(args_cli.task, cfg=env_cfg)
+    env.reset()
+    # sample actions from -1 to 1
+    actions = 2 * torch.rand(env.action_space.shape, device=env.unwrapped.device) - 1
+
+    with torch.inference_mode():
+        # warm-up (this also captures the graph)
+        for _ in range(args_cli.num_warmup_steps):
+            env.step(actions)
+        # time the stepping
+        if "cuda" in env.unwrapped.device:
+            torch.cuda.synchronize()
+        with Timer() as timer:
+            for _ in range(args_cli.num_steps):
+                env.step(actions)
+            if "cuda" in env.unwrapped.device:
+                torch.cuda.synchronize()
+    # print whether the graph was used
+    print(f"[INFO]: CUDA graph requested: {use_action_cuda_graph}.")
+    print(f"[INFO]: CUDA graph captured : {env.unwrapped._apply_action_graph.is_captured}.")
+
+    # close the environment
+    env.close()
+    return args_cli.num_steps / timer.total_run_time
+
+
+def main():
+    """Benchmark the environment stepping in both modes."""
+    results = {mode: run_benchmark(mode) for mode in (False, True)}
+    # print the results
+    print(f"[INFO]: Benchmark results for '{args_cli.task}' ({args_cli.num_steps} steps):")
+    print(f"\tEager actions      : {results[False]:10.2f} steps/s")
+    print(f"\tCUDA graph actions : {results[True]:10.2f} steps/s")
+    print(f"\tSpeed-up           : {results[True] / results[False]:10.2f}x")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
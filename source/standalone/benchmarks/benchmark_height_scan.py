@@ -0,0 +1,135 @@
+# Copyright (c) 2022-2024, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark height scans with ray-casting against the terrain mesh and with height map look-ups.
+
+The script generates the rough terrain used by the locomotion tasks together with its height map (see
+:attr:`TerrainGeneratorCfg.build_height_map`). It then scans the terrain below randomly placed sensors with the
+grid pattern of the height scanners, once by ray-casting against the terrain mesh and once by looking up the
+heights in the height map (see :attr:`RayCasterCfg.use_height_map`). For each mode, it reports the number of
+scans per second. It also reports the difference between the hits of both modes.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p source/standalone/benchmarks/benchmark_height_scan.py --num_sensors 4096 --headless
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+
+from omni.isaac.lab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark height scans against the terrain mesh and the height map.")
+parser.add_argument("--num_sensors", type=int, default=4096, help="Number of height scanners.")
+parser.add_argument("--num_steps", type=int, default=1000, help="Number of scans to time.")
+parser.add_argument("--num_warmup_steps", type=int, default=50, help="Number of scans before timing.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import torch
+
+from omni.isaac.lab.sensors.ray_caster.patterns import GridPatternCfg
+from omni.isaac.lab.terrains import TerrainGenerator
+from omni.isaac.lab.terrains.config.rough import ROUGH_TERRAINS_CFG
+from omni.isaac.lab.utils.math import random_yaw_orientation
+from omni.isaac.lab.utils.timer import Timer
+from omni.isaac.lab.utils.warp import convert_to_warp_mesh, raycast_height_field, raycast_meshes
+
+
+def time_scans(scan) -> float:
+    """Calls the scan function repeatedly and returns the number of scans per second."""
+    # warm-up (this also compiles the kernels)
+    for _ in range(args_cli.num_warmup_steps):
+        scan()
+    # time the scans
+    if "cuda" in args_cli.device:
+        torch.cuda.synchronize()
+    with Timer() as timer:
+        for _ in range(args_cli.num_steps):
+            scan()
+        if "cuda" in args_cli.device:
+            torch.cuda.synchronize()
+    return args_cli.num_steps / timer.total_run_time
+
+
+def main():
+    """Benchmark the height scans in both modes."""
+    device = args_cli.device
+    # generate the terrain and its height map
+    terrain_cfg = ROUGH_TERRAINS_CFG.replace(build_height_map=True)
+    terrain_generator = TerrainGenerator(cfg=terrain_cfg, device=device)
+    terrain_mesh = terrain_generator.terrain_mesh
+    height_map = terrain_generator.height_map
+    wp_mesh = convert_to_warp_mesh(terrain_mesh.vertices, terrain_mesh.faces, device=device)
+    mesh_ids = torch.full((args_cli.num_sensors, 1), wp_mesh.id, dtype=torch.int64, device=device)
+
+    # height scanner pattern of the locomotion tasks
+    pattern_cfg = GridPatternCfg(resolution=0.1, size=[1.6, 1.0])
+    ray_starts, ray_directions = pattern_cfg.func(pattern_cfg, device)
+    ray_starts[:, 2] += 20.0
+    # sensors placed randomly over the terrain
+    frame_pos = torch.rand(args_cli.num_sensors, 3, device=device) - 0.5
+    frame_pos[:, 0] *= terrain_cfg.num_rows * terrain_cfg.size[0]
+    frame_pos[:, 1] *= terrain_cfg.num_cols * terrain_cfg.size[1]
+    frame_pos[:, 2] = 0.5
+    frame_quat = random_yaw_orientation(args_cli.num_sensors, device=device)
+
+    def scan_mesh():
+        return raycast_meshes(
+            ray_starts,
+            ray_directions,
+            mesh_ids,
+            frame_pos=frame_pos,
+            frame_quat=frame_quat,
+            rotate_directions=False,
+        )[0]
+
+    def scan_height_map():
+        return raycast_height_field(
+            ray_starts,
+            height_map.heights,
+            height_map.valid,
+            height_map.origin,
+            height_map.resolution,
+            mesh=wp_mesh,
+            frame_pos=frame_pos,
+            frame_quat=frame_quat,
+        )[0]
+
+    # compare the hits of both modes
+    hits_mesh = scan_mesh()
+    hits_height_map = scan_height_map()
+    error = torch.nan_to_num((hits_mesh - hits_height_map)[..., 2].abs(), nan=0.0)
+    # time both modes
+    results = {"mesh": time_scans(scan_mesh), "height_map": time_scans(scan_height_map)}
+
+    # print the results
+    num_rays = args_cli.num_sensors * len(ray_starts)
+    print(
+        f"[INFO]: Benchmark results for {args_cli.num_sensors} sensors ({num_rays} rays, {args_cli.num_steps} scans):"
+    )
+    print(f"\tValid cells of height map : {100.0 * height_map.valid.float().mean().item():10.2f} %")
+    print(f"\tMesh ray-casting          : {results['mesh']:10.2f} scans/s")
+    print(f"\tHeight map look-ups       : {results['height_map']:10.2f} scans/s")
+    print(f"\tSpeed-up                  : {results['height_map'] / results['mesh']:10.2f}x")
+    print(f"\tMaximum height difference : {error.max().item():10.2e} m")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
@@ -153,7 +153,9 @@ def run_simulator(sim: sim_utils.SimulationContext, scene_entities: dict):
 
             # Pointcloud in world frame
             points_3d_cam = unproject_depth(
-                camera.data.output["distance_to_image_plane"], camera.data.intrinsic_matrices
+                camera.data.output["distance_to_image_plane"],
+                camera.data.intrinsic_matrices,
+                camera.unprojection_grid,
             )
 
             # Check methods are valid
@@ -255,6 +255,7 @@ def run_simulator(sim: sim_utils.SimulationContext, scene_entities: dict):
                 position=camera.data.pos_w[camera_index],
                 orientation=camera.data.quat_w_ros[camera_index],
                 device=sim.device,
+                unprojection_grid=camera.unprojection_grid[camera_index],
             )
 
             # In the first few steps, things are still being instanced and Camera.data